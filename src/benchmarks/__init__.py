@@ -0,0 +1,42 @@
+import os
+import time
+from typing import Callable
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "hide")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# pylint: disable=wrong-import-position
+import pygame
+# pylint: enable=wrong-import-position
+
+
+def init_headless_display(size: tuple[int, int] = (1280, 720)) -> pygame.Surface:
+    """Initializes pygame with a display surface so images can be converted without a window.
+
+    Args:
+        size: Size of the display surface.
+
+    Returns:
+        The display surface.
+    """
+    pygame.init()
+    return pygame.display.set_mode(size)
+
+
+def time_call(function: Callable[[], object], repeats: int = 5) -> float:
+    """Runs the given function multiple times and returns the fastest run time in seconds.
+
+    Args:
+        function: The function to be measured.
+        repeats: How many times the function is run.
+
+    Returns:
+        Fastest measured run time in seconds.
+    """
+    best: float = float("inf")
+    for _ in range(repeats):
+        start: float = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
@@ -0,0 +1,38 @@
+import os
+from functools import partial
+
+import pygame
+from pygame import Surface
+
+from benchmarks import init_headless_display, time_call
+from utilities import image_handler
+
+BLITS: int = 100
+BACKGROUND: str = "castle_dungeon_background.png"
+
+
+def _blit(display: Surface, image: Surface, blits: int):
+    for _ in range(blits):
+        display.blit(image, (0, 0))
+
+
+def run(blits: int = BLITS):
+    """Compares blitting the background with and without converting it to the display format."""
+    display: Surface = init_headless_display()
+    size: tuple[int, int] = display.get_size()
+    path: str = os.path.join(image_handler.IMAGES_DIR, BACKGROUND)
+    images: dict[str, Surface] = {
+        "unconverted": pygame.transform.scale(pygame.image.load(path), size),
+        "converted": image_handler.load_image(BACKGROUND, False, size),
+    }
+
+    print(f"Blitting the {size[0]}x{size[1]} background {blits} times")
+    for label, image in images.items():
+        elapsed: float = time_call(partial(_blit, display, image, blits), repeats=3)
+        print(f"  {label:<12} {elapsed / blits * 1e6:8.1f} µs per blit")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    run()
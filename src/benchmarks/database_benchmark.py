@@ -0,0 +1,52 @@
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import initialize_database
+from database.database_connection import ConnectionFactory
+from database.score_service import ScoreService
+
+SINGLE_INSERTS: int = 500
+BATCH_INSERTS: int = 20000
+
+
+def _scores(count: int) -> list[tuple[str, int, int, datetime]]:
+    start: datetime = datetime(2025, 1, 1)
+    return [(f"player_{i % 100}", i % 30, i, start + timedelta(seconds=i)) for i in range(count)]
+
+
+def _rows_per_second(database_file: Path, tuned: bool, batched: bool) -> float:
+    """Inserts scores into a fresh database and returns the insert throughput."""
+    factory: ConnectionFactory = ConnectionFactory(str(database_file), tuned)
+    connection = factory.connect()
+    initialize_database.create_schema(connection)
+    score_service: ScoreService = ScoreService(connection)
+
+    scores: list[tuple[str, int, int, datetime]] = _scores(BATCH_INSERTS if batched
+                                                           else SINGLE_INSERTS)
+    start: float = time.perf_counter()
+    if batched:
+        score_service.add_new_scores(scores)
+    else:
+        for score in scores:
+            score_service.add_new_score(*score)
+    elapsed: float = time.perf_counter() - start
+
+    connection.close()
+    return len(scores) / elapsed
+
+
+def run():
+    """Compares score insert throughput with default and tuned connections."""
+    print("Score inserts per second")
+    for label, batched in (("one commit per score", False), ("single transaction", True)):
+        for tuned in (False, True):
+            with tempfile.TemporaryDirectory() as directory:
+                rows: float = _rows_per_second(Path(directory) / "benchmark.db", tuned, batched)
+            mode: str = "WAL, synchronous=NORMAL" if tuned else "default journal"
+            print(f"  {label:<21} {mode:<24} {rows:10.0f}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,79 @@
+from functools import partial
+from typing import Callable
+
+import pygame
+
+from benchmarks import init_headless_display, time_call
+from game_engine import GameLogic, GameState, SpawnSettings
+from game_engine.enemy_store import EnemyStore
+
+ENEMY_COUNT: int = 2000
+TICKS: int = 120
+WIDTH: int = 1280
+HEIGHT: int = 720
+
+
+def _create_game_logic(enemy_count: int, vectorized: bool) -> GameLogic:
+    game_state: GameState = GameState(
+        WIDTH, HEIGHT, spawn_settings=SpawnSettings(vectorized_enemies=vectorized))
+    game_state.populate_level_with_gems(1)
+    game_state.spawn_multiple_enemies(enemy_count, enemy_speed=3)
+    game_logic: GameLogic = GameLogic(game_state)
+    game_logic.move_player(WIDTH // 2, HEIGHT // 2)
+    return game_logic
+
+
+def _run_ticks(game_logic: GameLogic, ticks: int):
+    for _ in range(ticks):
+        game_logic.activate_player_invulnerability()
+        game_logic.update()
+
+
+def _move_enemies(game_logic: GameLogic, ticks: int):
+    for _ in range(ticks):
+        game_logic.move_enemies()
+        if game_logic.enemy_store is not None:
+            continue
+
+        for enemy in game_logic.enemies.border_candidates(WIDTH, HEIGHT):
+            if enemy.rect.left < 0:
+                enemy.direction_x = 1
+            elif enemy.rect.right > WIDTH:
+                enemy.direction_x = -1
+
+            if enemy.rect.top < 0:
+                enemy.direction_y = 1
+            elif enemy.rect.bottom > HEIGHT:
+                enemy.direction_y = -1
+
+
+def _compare(title: str, benchmark: Callable[[GameLogic, int], None], enemy_count: int,
+             ticks: int):
+    print(f"{title} with {enemy_count} enemies, {ticks} ticks")
+    for vectorized in (False, True):
+        if vectorized and not EnemyStore.is_available():
+            print("  NumPy is not installed, skipping the vectorized enemy store")
+            continue
+
+        game_logic: GameLogic = _create_game_logic(enemy_count, vectorized)
+        elapsed: float = time_call(partial(benchmark, game_logic, ticks), repeats=3)
+        label: str = "vectorized store" if vectorized else "Enemy.move"
+        print(f"  {label:<17} {elapsed / ticks * 1000:8.3f} ms per tick")
+
+
+def run(enemy_count: int = ENEMY_COUNT, ticks: int = TICKS):
+    """Compares moving the enemies one by one with moving them in the vectorized store.
+
+    The first comparison measures only moving the enemies and reflecting them from the
+    game borders, the second one the whole GameLogic update.
+    """
+    init_headless_display()
+
+    _compare("Moving and reflecting", _move_enemies, enemy_count, ticks)
+    _compare("GameLogic.update", _run_ticks, enemy_count, ticks)
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,66 @@
+import itertools
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from time import perf_counter
+
+import initialize_database
+from database.database_connection import ConnectionFactory
+from database.score_service import RETURNING_SUPPORTED, ScoreService
+
+SUBMISSIONS: int = 10_000
+PLAYERS: int = 100
+
+
+def _scores(count: int, players: int) -> list[tuple[str, int, int, datetime]]:
+    start: datetime = datetime(2025, 1, 1)
+    return [(f"player_{i % players}", i % 30, i, start + timedelta(seconds=i))
+            for i in range(count)]
+
+
+def _submit(database_file: Path, scores: list[tuple[str, int, int, datetime]],
+            **options) -> tuple[float, float]:
+    """Submits the scores one at a time to a fresh database.
+
+    Returns:
+        The submissions per second and the statements run per submission.
+    """
+    connection = ConnectionFactory(str(database_file)).connect()
+    initialize_database.create_schema(connection)
+    score_service: ScoreService = ScoreService(connection, **options)
+
+    statements: list[str] = []
+    connection.set_trace_callback(statements.append)
+    start: float = perf_counter()
+    for score in scores:
+        score_service.add_new_score(*score)
+    elapsed: float = perf_counter() - start
+    connection.set_trace_callback(None)
+    connection.close()
+
+    # Statements run by triggers are traced as repeats of the statement firing them.
+    queries: int = sum(statement.split()[0] in ("INSERT", "SELECT")
+                       for statement, _ in itertools.groupby(statements))
+    return len(scores) / elapsed, queries / len(scores)
+
+
+def run(submissions: int = SUBMISSIONS, players: int = PLAYERS):
+    """Compares score submissions with and without the player id cache and upserts."""
+    scores: list[tuple[str, int, int, datetime]] = _scores(submissions, players)
+    variants: list[tuple[str, dict]] = [
+        ("insert or ignore + select", {"player_cache_size": 0, "upsert": False}),
+        ("cached, insert or ignore", {"upsert": False}),
+    ]
+    if RETURNING_SUPPORTED:
+        variants.insert(1, ("upsert returning", {"player_cache_size": 0, "upsert": True}))
+        variants.append(("cached, upsert returning", {"upsert": True}))
+
+    print(f"{submissions} submissions from {players} players")
+    for label, options in variants:
+        with tempfile.TemporaryDirectory() as directory:
+            rate, statements = _submit(Path(directory) / "benchmark.db", scores, **options)
+        print(f"  {label:<26} {rate:10.0f} submissions/s {statements:6.2f} statements each")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,85 @@
+import gc
+import time
+from random import Random
+
+import pygame
+
+from benchmarks import init_headless_display
+from game_engine import GameState, SpawnSettings
+from sprites.sprite_pool import POOL_SIZE
+
+GAMES: int = 20
+LEVELS: int = 60
+
+
+class GCMonitor:
+    """Counts garbage collections and measures their pauses with gc.callbacks.
+
+    Attributes:
+        collections: Number of collections of every generation.
+        pauses: Duration of every collection in milliseconds.
+        _started: time.perf_counter time the running collection started.
+    """
+
+    def __init__(self):
+        self.collections: list[int] = [0, 0, 0]
+        self.pauses: list[float] = []
+        self._started: float = 0.0
+
+    def __enter__(self):
+        gc.collect()
+        gc.callbacks.append(self._callback)
+        return self
+
+    def __exit__(self, *exc_info):
+        gc.callbacks.remove(self._callback)
+
+    def _callback(self, phase: str, info: dict):
+        if phase == "start":
+            self._started = time.perf_counter()
+        else:
+            self.collections[info["generation"]] += 1
+            self.pauses.append((time.perf_counter() - self._started) * 1000)
+
+
+def _play(game_state: GameState, levels: int):
+    """Plays through the levels by collecting every gem and spawning the next level."""
+    game_state.populate_level_with_gems(5)
+    game_state.spawn_multiple_enemies(enemy_count=3, enemy_speed=1)
+    for level in range(levels):
+        collected = game_state.gems.sprites()
+        for gem in collected:
+            gem.kill()
+        game_state.release_gems(collected)
+
+        game_state.increase_level()
+        game_state.spawn_enemy(speed=2)
+        game_state.populate_level_with_gems(4 + level)
+    game_state.reset_game_state()
+
+
+def run(games: int = GAMES, levels: int = LEVELS):
+    init_headless_display()
+
+    print(f"Playing {games} games of {levels} levels")
+    for pool_size in (0, POOL_SIZE):
+        game_state: GameState = GameState(
+            1280, 720, spawn_settings=SpawnSettings(rng=Random(0), pool_size=pool_size))
+        start: float = time.perf_counter()
+        with GCMonitor() as monitor:
+            for _ in range(games):
+                _play(game_state, levels)
+        elapsed: float = time.perf_counter() - start
+
+        stats: dict[str, dict[str, int]] = game_state.get_pool_stats()
+        label: str = "with pools" if pool_size else "without pools"
+        print(f"  {label:<14} {elapsed * 1000:8.2f} ms"
+              f"  collections (gen 0/1/2): {'/'.join(map(str, monitor.collections))}"
+              f"  longest pause: {max(monitor.pauses, default=0.0):.3f} ms"
+              f"  gem hits: {stats['gems']['hits']}, enemy hits: {stats['enemies']['hits']}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    run()
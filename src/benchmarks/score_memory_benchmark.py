@@ -0,0 +1,94 @@
+import bisect
+import tracemalloc
+from datetime import datetime, timedelta
+from random import Random
+from time import perf_counter
+from typing import Callable
+
+from utilities.rank_index import RankIndex
+from utilities.score import Score, to_timestamp
+
+SCORE_COUNT: int = 1_000_000
+INSERTS: int = 20_000
+
+
+class DictScore:
+    """Score record with an instance dictionary and a time string, as scores used to be."""
+
+    def __init__(self, name: str, level: int, points: int, time: str):
+        self.name: str = name
+        self.level: int = level
+        self.points: int = points
+        self.time: str = time
+
+
+def _measure(build: Callable[[], object]) -> tuple[float, object]:
+    """Returns the megabytes allocated while building the object and the object."""
+    tracemalloc.start()
+    built: object = build()
+    size: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size / 1024 ** 2, built
+
+
+def _rows(count: int) -> list[tuple[str, int, int, datetime]]:
+    rng: Random = Random(0)
+    start: datetime = datetime(2025, 1, 1)
+    return [(f"player {i % 5000}", rng.randint(1, 60), rng.randint(1, 100_000),
+             start + timedelta(microseconds=rng.randint(0, 10 ** 13))) for i in range(count)]
+
+
+def _key(points: int, recorded: datetime) -> int:
+    return (-points << 64) + to_timestamp(recorded)
+
+
+def _measure_memory(rows: list[tuple[str, int, int, datetime]]) -> RankIndex:
+    """Prints the memory used by the scores in each representation and returns the index."""
+    dict_size, _ = _measure(lambda: [DictScore(name, level, points, str(recorded))
+                                     for name, level, points, recorded in rows])
+    slot_size, _ = _measure(lambda: [Score(name, level, points, recorded)
+                                     for name, level, points, recorded in rows])
+    index_size, index = _measure(lambda: RankIndex(_key(points, recorded)
+                                                   for _, _, points, recorded in rows))
+
+    print(f"Memory of {len(rows)} scores, not counting the shared player names")
+    print(f"  dict records with time strings {dict_size:8.1f} MB")
+    print(f"  slotted Score records          {slot_size:8.1f} MB")
+    print(f"  RankIndex of score keys        {index_size:8.1f} MB")
+    return index
+
+
+def _measure_inserts(rows: list[tuple[str, int, int, datetime]], index: RankIndex, inserts: int):
+    """Prints the time of inserting new scores into a sorted list and the index."""
+    new_keys: list[int] = [_key(points, recorded) for _, _, points, recorded in _rows(inserts)]
+    ordered: list[int] = sorted(_key(points, recorded) for _, _, points, recorded in rows)
+
+    start: float = perf_counter()
+    for key in new_keys:
+        bisect.insort_right(ordered, key)
+    insort_time: float = perf_counter() - start
+
+    start = perf_counter()
+    for key in new_keys:
+        index.add(key)
+    index_time: float = perf_counter() - start
+
+    start = perf_counter()
+    for key in new_keys:
+        index.rank(key)
+    rank_time: float = perf_counter() - start
+
+    print(f"Inserting {inserts} scores into {len(rows)} scores")
+    print(f"  bisect.insort into a list {insort_time / inserts * 1e6:8.2f} µs per score")
+    print(f"  RankIndex.add             {index_time / inserts * 1e6:8.2f} µs per score")
+    print(f"  RankIndex.rank            {rank_time / inserts * 1e6:8.2f} µs per query")
+
+
+def run(score_count: int = SCORE_COUNT, inserts: int = INSERTS):
+    rows: list[tuple[str, int, int, datetime]] = _rows(score_count)
+    index: RankIndex = _measure_memory(rows)
+    _measure_inserts(rows, index, inserts)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,42 @@
+import pygame
+
+from benchmarks import init_headless_display, time_call
+from game_engine import GameState
+from utilities import image_handler
+
+GEM_COUNT: int = 1000
+
+
+def _spawn_without_cache(gem_count: int):
+    """Spawns gems while clearing the image cache before each gem like before the cache existed."""
+    game_state: GameState = GameState(1280, 720)
+    for _ in range(gem_count):
+        image_handler.clear_cache()
+        game_state.populate_level_with_gems(1)
+
+
+def _spawn_with_cache(gem_count: int):
+    """Spawns gems in one go with a warm image cache."""
+    game_state: GameState = GameState(1280, 720)
+    game_state.populate_level_with_gems(gem_count)
+
+
+def run(gem_count: int = GEM_COUNT):
+    init_headless_display()
+
+    uncached: float = time_call(lambda: _spawn_without_cache(gem_count))
+
+    image_handler.clear_cache()
+    cached: float = time_call(lambda: _spawn_with_cache(gem_count))
+    stats: dict[str, int] = image_handler.get_cache_stats()
+
+    print(f"Spawning {gem_count} gems")
+    print(f"  without image cache: {uncached * 1000:8.2f} ms")
+    print(f"  with image cache:    {cached * 1000:8.2f} ms ({uncached / cached:.1f}x faster)")
+    print(f"  cache hits: {stats['hits']}, misses: {stats['misses']}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    run()
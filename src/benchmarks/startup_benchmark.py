@@ -0,0 +1,33 @@
+from benchmarks import init_headless_display, time_call
+from utilities import image_handler
+
+BACKGROUNDS: tuple[str, ...] = ("castle_dungeon_background.png", "end_game.png")
+SIZE: tuple[int, int] = (1280, 720)
+
+
+def _decode_backgrounds():
+    for filename in BACKGROUNDS:
+        image_handler.load_image(filename, False, SIZE)
+
+
+def _load_cached_backgrounds():
+    for filename in BACKGROUNDS:
+        image_handler.load_cached_image(filename, SIZE)
+
+
+def run():
+    """Compares decoding and scaling the backgrounds to loading them from the disk cache."""
+    init_headless_display(SIZE)
+    _load_cached_backgrounds()
+
+    decoded: float = time_call(_decode_backgrounds, repeats=3)
+    cached: float = time_call(_load_cached_backgrounds, repeats=3)
+
+    print(f"Loading {len(BACKGROUNDS)} backgrounds at {SIZE[0]}x{SIZE[1]}")
+    print(f"  decode and scale {decoded * 1000:8.1f} ms")
+    print(f"  disk cache       {cached * 1000:8.1f} ms")
+    print(f"  speedup          {decoded / cached:8.1f}x")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,55 @@
+from functools import partial
+from pathlib import Path
+
+import pygame
+from pygame.font import Font
+
+from benchmarks import init_headless_display, time_call
+from ui.glyph_atlas import GlyphAtlas
+from utilities.constants import Folder
+
+UPDATES: int = 5000
+COLOR: tuple[int, int, int] = (230, 215, 165)
+
+
+def _render_counter(render, updates: int):
+    for points in range(0, updates * 7, 7):
+        render(f"Points: {points}")
+
+
+def _render_score_lines(render, updates: int):
+    for i in range(updates):
+        render(f"{i % 100 + 1:<{4}}|{'PLAYER':^{20}}|{i % 30:<{6}}|{i * 13:<}")
+
+
+def run(updates: int = UPDATES):
+    init_headless_display()
+    fonts: dict[str, Font] = {
+        "Arial 24": pygame.font.SysFont("Arial", 24),
+        "Courier New 24": pygame.font.SysFont("Courier New", 24),
+        "Cinzel 80": pygame.font.Font(Path(Folder.FONTS_DIR) / "Cinzel-Medium.ttf", 80),
+    }
+
+    print(f"Rendering {updates} changing strings")
+    for name, font in fonts.items():
+        atlas: GlyphAtlas = GlyphAtlas(font, COLOR)
+        renderers = {
+            "Font.render": lambda text, font=font: font.render(text, True, COLOR),
+            "GlyphAtlas": atlas.render,
+        }
+
+        for label, benchmark in (("point counter", _render_counter),
+                                 ("score line", _render_score_lines)):
+            times: dict[str, float] = {
+                renderer: time_call(partial(benchmark, render, updates), repeats=3)
+                for renderer, render in renderers.items()}
+            print(f"  {name:<15} {label:<14}"
+                  f"  Font.render {times['Font.render'] / updates * 1e6:7.1f} µs"
+                  f"  GlyphAtlas {times['GlyphAtlas'] / updates * 1e6:7.1f} µs"
+                  f"  ({times['Font.render'] / times['GlyphAtlas']:.1f}x)")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    run()
@@ -1,19 +1,123 @@
 import sqlite3
+import threading
 
-from utilities.config_manager import ConfigManager
+from utilities.config_manager import ConfigManager, get_config_manager
+
+STATEMENT_CACHE_SIZE: int = 256
+"""Number of prepared statements kept in the statement cache of each connection."""
+
+MMAP_SIZE: int = 64 * 1024 * 1024
+"""Maximum number of bytes of the database file read through memory-mapped I/O."""
+
+TUNED_PRAGMAS: dict[str, str | int] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": MMAP_SIZE,
+}
+"""Pragmas set on every tuned connection.
+
+In WAL mode readers don't block the writer and the writer doesn't block readers, and
+with synchronous=NORMAL commits don't wait for fsync, which is still safe against
+corruption in WAL mode.
+"""
+
+
+class ConnectionFactory:
+    """Opens configured SQLite connections to a database file and reuses one per thread.
+
+    SQLite connections can't be shared between threads, so every thread that asks for a
+    connection gets its own. The connection is kept and returned again on later calls
+    from the same thread until it is closed.
+
+    Attributes:
+        _database_file: Path of the database file.
+        _tuned: Whether the TUNED_PRAGMAS are set on the opened connections.
+        _local: Thread-local storage holding the connection of each thread.
+    """
+
+    def __init__(self, database_file: str, tuned: bool = True):
+        """Initializes the factory.
+
+        Args:
+            database_file: Path of the database file.
+            tuned: If True, connections use WAL journaling, synchronous=NORMAL and
+                memory-mapped I/O. If False, SQLite defaults are used.
+        """
+        self._database_file: str = database_file
+        self._tuned: bool = tuned
+        self._local: threading.local = threading.local()
+
+    def connect(self) -> sqlite3.Connection:
+        """Opens a new configured connection to the database.
+
+        Returns:
+            A SQLite database connection object.
+        """
+        if not self._tuned:
+            return sqlite3.connect(self._database_file)
+
+        connection: sqlite3.Connection = sqlite3.connect(self._database_file,
+                                                         cached_statements=STATEMENT_CACHE_SIZE)
+        for pragma, value in TUNED_PRAGMAS.items():
+            connection.execute(f"PRAGMA {pragma} = {value};")
+        return connection
+
+    def get_connection(self) -> sqlite3.Connection:
+        """Returns the connection of the calling thread, opening it if needed.
+
+        Returns:
+            A SQLite database connection object.
+        """
+        connection: sqlite3.Connection | None = getattr(self._local, "connection", None)
+        if connection is None or not _is_open(connection):
+            connection = self.connect()
+            self._local.connection = connection
+        return connection
+
+    def close(self):
+        """Closes the connection of the calling thread."""
+        connection: sqlite3.Connection | None = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+
+_factories: dict[str, ConnectionFactory] = {}
+"""Connection factories of the opened database files."""
+_factories_lock: threading.Lock = threading.Lock()
+
+
+def get_connection_factory() -> ConnectionFactory:
+    """Returns the connection factory of the database file defined in the configuration file.
+
+    Returns:
+        The ConnectionFactory shared by every caller using the same database file.
+    """
+    cfg: ConfigManager = get_config_manager()
+    cfg.create_config()
+    database_file: str = str(cfg.get_database_path())
+
+    with _factories_lock:
+        if database_file not in _factories:
+            _factories[database_file] = ConnectionFactory(database_file)
+        return _factories[database_file]
 
 
 def get_database_connection() -> sqlite3.Connection:
     """Establish a connection to the SQLite database defined in the configuration file.
 
-    This function utilizes the ConfigManager class to get the filename of the database.
-    It then establishes and returns a connection to the SQLite database using the provided filename.
+    This function utilizes the shared ConfigManager to get the filename of the database.
+    It then returns the calling thread's tuned connection to the database from the
+    shared connection factory.
 
     Returns:
         A SQLite database connection object.
     """
-    cfg: ConfigManager = ConfigManager()
-    cfg.create_config()
-    database_file: str = cfg.get_database_path()
-    connection: sqlite3.Connection = sqlite3.connect(database_file)
-    return connection
+    return get_connection_factory().get_connection()
+
+
+def _is_open(connection: sqlite3.Connection) -> bool:
+    try:
+        return connection.total_changes >= 0
+    except sqlite3.ProgrammingError:
+        return False
@@ -0,0 +1,213 @@
+import sqlite3
+import time
+from typing import TYPE_CHECKING, Callable
+
+from database.database_connection import get_database_connection
+
+if TYPE_CHECKING:
+    from sqlite3 import Connection
+
+type Migration = tuple[str, Callable[["Connection"], None]]
+
+PERIOD_TOP_SIZE: int = 10
+"""Number of scores kept for every day and week in the period_tops table."""
+
+
+# Migrations are never changed after they have been released, because databases that
+# have already run them won't run them again. Schema changes are added as new migrations.
+# Every statement is written so that running it on a database that already has its
+# changes does nothing, as databases created before the migrations have version 0.
+
+def _create_tables(connection: "Connection"):
+    connection.execute("""
+    CREATE TABLE IF NOT EXISTS players (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL UNIQUE
+    );
+    """)
+    connection.execute("""
+    CREATE TABLE IF NOT EXISTS scores (
+        id INTEGER PRIMARY KEY,
+        player_id INTEGER NOT NULL REFERENCES players,
+        level INTEGER NOT NULL,
+        points INTEGER NOT NULL,
+        time DATETIME
+    );
+    """)
+
+
+def _create_scores_index(connection: "Connection"):
+    # Covers the high score ordering, so pages and ranks are read from the index.
+    connection.execute("""
+    CREATE INDEX IF NOT EXISTS scores_by_rank
+        ON scores (points DESC, time, player_id, level);
+    """)
+
+
+def _create_leaderboards(connection: "Connection"):
+    connection.execute("""
+    CREATE TABLE IF NOT EXISTS player_bests (
+        player_id INTEGER PRIMARY KEY REFERENCES players,
+        level INTEGER NOT NULL,
+        points INTEGER NOT NULL,
+        time DATETIME
+    );
+    """)
+    connection.execute("""
+    CREATE TABLE IF NOT EXISTS period_tops (
+        period TEXT NOT NULL,
+        start DATE NOT NULL,
+        player_id INTEGER NOT NULL REFERENCES players,
+        level INTEGER NOT NULL,
+        points INTEGER NOT NULL,
+        time DATETIME
+    );
+    """)
+    connection.execute("""
+    CREATE INDEX IF NOT EXISTS player_bests_by_rank
+        ON player_bests (points DESC, time);
+    """)
+    connection.execute("""
+    CREATE INDEX IF NOT EXISTS period_tops_by_rank
+        ON period_tops (period, start, points DESC, time);
+    """)
+
+    _fill_leaderboards(connection)
+
+    # Keeps the best score of every player in high score order. Imported scores aren't
+    # added in time order, so an earlier score with equal points replaces the best one too.
+    connection.execute("""
+    CREATE TRIGGER IF NOT EXISTS update_player_bests AFTER INSERT ON scores
+    BEGIN
+        INSERT INTO player_bests (player_id, level, points, time)
+        VALUES (NEW.player_id, NEW.level, NEW.points, NEW.time)
+        ON CONFLICT (player_id) DO UPDATE
+            SET level = excluded.level, points = excluded.points, time = excluded.time
+            WHERE excluded.points > player_bests.points
+                OR (excluded.points = player_bests.points
+                    AND excluded.time < player_bests.time);
+    END;
+    """)
+
+    # Adds the score to the top scores of its day and of its week, which starts on Monday.
+    # A top has at most one score too many after an insert, so only the score after the top
+    # is removed, by its rowid found with a single seek of the index.
+    connection.execute(f"""
+    CREATE TRIGGER IF NOT EXISTS update_period_tops AFTER INSERT ON scores
+    BEGIN
+        INSERT INTO period_tops (period, start, player_id, level, points, time) VALUES
+            ('day', date(NEW.time), NEW.player_id, NEW.level, NEW.points, NEW.time),
+            ('week', date(NEW.time, '-6 days', 'weekday 1'), NEW.player_id, NEW.level,
+             NEW.points, NEW.time);
+
+        DELETE FROM period_tops WHERE rowid = (
+            SELECT rowid FROM period_tops
+            WHERE period = 'day' AND start = date(NEW.time)
+            ORDER BY points DESC, time
+            LIMIT 1 OFFSET {PERIOD_TOP_SIZE}
+        );
+        DELETE FROM period_tops WHERE rowid = (
+            SELECT rowid FROM period_tops
+            WHERE period = 'week' AND start = date(NEW.time, '-6 days', 'weekday 1')
+            ORDER BY points DESC, time
+            LIMIT 1 OFFSET {PERIOD_TOP_SIZE}
+        );
+    END;
+    """)
+
+
+def _fill_leaderboards(connection: "Connection"):
+    """Rebuilds the leaderboard tables from the stored scores."""
+    connection.execute("DELETE FROM player_bests;")
+    connection.execute("""
+    INSERT INTO player_bests (player_id, level, points, time)
+    SELECT player_id, level, points, time
+    FROM (
+        SELECT player_id, level, points, time,
+            ROW_NUMBER() OVER (PARTITION BY player_id ORDER BY points DESC, time) AS position
+        FROM scores
+    )
+    WHERE position = 1;
+    """)
+
+    connection.execute("DELETE FROM period_tops;")
+    for period, start in (("day", "date(time)"), ("week", "date(time, '-6 days', 'weekday 1')")):
+        connection.execute(f"""
+        INSERT INTO period_tops (period, start, player_id, level, points, time)
+        SELECT '{period}', start, player_id, level, points, time
+        FROM (
+            SELECT {start} AS start, player_id, level, points, time,
+                ROW_NUMBER() OVER (PARTITION BY {start} ORDER BY points DESC, time) AS position
+            FROM scores
+        )
+        WHERE position <= {PERIOD_TOP_SIZE};
+        """)
+
+
+MIGRATIONS: list[Migration] = [
+    ("Create the players and scores tables", _create_tables),
+    ("Index the scores in high score order", _create_scores_index),
+    ("Add the player best and daily and weekly top score leaderboards", _create_leaderboards),
+]
+"""Description and function of every migration. Migration n brings the database to version n."""
+
+
+def get_version(connection: "Connection") -> int:
+    """Returns the schema version stored in the user_version of the database."""
+    return connection.execute("PRAGMA user_version;").fetchone()[0]
+
+
+def migrate(connection: "Connection", migrations: list[Migration] | None = None,
+            verbose: bool = True) -> bool:
+    """Brings the database schema up to date by running the migrations it hasn't run yet.
+
+    The version of the database is kept in its user_version. Every missing migration is
+    run in a single transaction together with the version update, so the database is
+    either fully migrated or left as it was. The transaction takes the write lock before
+    the version is read, so two games starting at the same time don't both migrate.
+    Databases from a newer version of the game are left untouched.
+
+    Args:
+        connection: Connection to the score database.
+        migrations: The migrations of the schema. Defaults to MIGRATIONS.
+        verbose: If True, the progress of every migration is printed.
+
+    Returns:
+        False if a migration failed, True otherwise.
+    """
+    migrations = MIGRATIONS if migrations is None else migrations
+    try:
+        connection.commit()
+        connection.execute("BEGIN IMMEDIATE;")
+        version: int = get_version(connection)
+        if version < len(migrations):
+            _run_migrations(connection, migrations, version, verbose)
+        elif version > len(migrations):
+            print(f"The score database has version {version}, which is newer than the "
+                  f"latest known version {len(migrations)}.")
+        connection.commit()
+    except sqlite3.Error as error:
+        connection.rollback()
+        print(f"Could not migrate the score database, it was left unchanged: {error}")
+        return False
+
+    return True
+
+
+def _run_migrations(connection: "Connection", migrations: list[Migration], version: int,
+                    verbose: bool):
+    """Runs the migrations after the given version and updates the version without committing."""
+    if verbose:
+        print(f"Migrating the score database from version {version} to {len(migrations)}")
+
+    for number, (description, apply) in enumerate(migrations[version:], start=version + 1):
+        start: float = time.perf_counter()
+        apply(connection)
+        if verbose:
+            print(f"  {number}: {description} ({time.perf_counter() - start:.2f} s)")
+
+    connection.execute(f"PRAGMA user_version = {len(migrations)};")
+
+
+if __name__ == "__main__":
+    migrate(get_database_connection())
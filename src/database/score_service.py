@@ -1,14 +1,36 @@
 import sqlite3
 import sys
-from datetime import datetime
-from typing import TYPE_CHECKING
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Iterable
 
 import pygame
 
+from utilities.frame_profiler import profiled
+from utilities.lru_cache import LRUCache
+
 if TYPE_CHECKING:
     from sqlite3 import Connection, Cursor
 
 type ScoreTuple = tuple[str, int, int, str]
+type ScoreKey = tuple[int, str]
+
+PLAYER_CACHE_SIZE: int = 1024
+"""Maximum number of player ids a ScoreService keeps in memory."""
+
+RETURNING_SUPPORTED: bool = sqlite3.sqlite_version_info >= (3, 35, 0)
+"""Whether the SQLite library supports the RETURNING clause, added in SQLite 3.35."""
+
+_SELECT_SCORES: str = """
+SELECT name, level, points, time
+FROM scores JOIN players
+    ON players.id = scores.player_id
+"""
+
+_SELECT_VIEW: str = """
+SELECT name, level, points, time
+FROM {table} JOIN players
+    ON players.id = {table}.player_id
+"""
 
 
 class ScoreService:
@@ -21,51 +43,85 @@ class ScoreService:
     and `_insert_score` enable streamlined management of player and score-related
     data.
 
+    Player ids are cached in a bounded LRUCache, so a score of a player whose id is
+    cached is stored with a single statement.
+
     Attributes:
         connection: Connection instance used to establish and manage
             communication with a database or a network service.
+        _player_ids: LRUCache of player ids by player name.
+        _upsert: Whether missing players are inserted with an upsert returning their id.
+        _exit_on_missing_tables: Whether a missing table quits the game instead of raising.
     """
 
-    def __init__(self, connection: "Connection"):
+    def __init__(self, connection: "Connection", player_cache_size: int = PLAYER_CACHE_SIZE,
+                 upsert: bool = RETURNING_SUPPORTED, exit_on_missing_tables: bool = True):
         """Initializes the ScoreService instance with a database connection.
 
         Args:
             connection: database connection
+            player_cache_size: Maximum number of cached player ids. 0 disables the cache.
+            upsert: If True, a missing player is inserted and their id is returned with a
+                single statement. Requires SQLite 3.35 or newer.
+            exit_on_missing_tables: If False, a missing table raises the error instead of
+                quitting the game. Services used outside the main thread must not quit it.
         """
         self.connection: Connection = connection
+        self._player_ids: LRUCache = LRUCache(player_cache_size)
+        self._upsert: bool = upsert
+        self._exit_on_missing_tables: bool = exit_on_missing_tables
 
-    def _insert_player(self, name: str) -> int | None:
+    def _insert_player(self, name: str, commit: bool = True) -> int | None:
         """Inserts a new player into the database and retrieves their ID.
 
-        This function attempts to insert a player with the provided name into the
-        `players` table of the database. If the player already exists, it skips the
-        insertion due to the `INSERT or IGNORE` SQL statement and retrieves their ID.
-        In case of an operational error during the database operation, the exception
-        is handled by the internal `_exception_handler` method.
+        The ID is taken from the player id cache when the player has been seen before,
+        without touching the database. Otherwise the player is inserted into the
+        `players` table and their ID is retrieved and cached. With upserts, an existing
+        player's name is rewritten unchanged so the single statement returns the ID of
+        new and existing players alike. Without them, the `INSERT or IGNORE` SQL
+        statement skips existing players and the ID is selected separately. In case of
+        an operational error during the database operation, the exception is handled by
+        the internal `_exception_handler` method.
 
         Args:
             name: The name of the player to be inserted into the database.
+            commit: If False, the insert is left to the ongoing transaction.
 
         Returns:
             An integer representing the ID of the inserted or existing player, or
             None if the operation fails.
         """
+        player_id: int | None = self._player_ids.get(name)
+        if player_id is not None:
+            return player_id
+
         cursor: Cursor = self.connection.cursor()
-        player_id: int | None = None
 
         try:
-            sql: str = "INSERT or IGNORE INTO players (name) VALUES (?);"
-            cursor.execute(sql, (name,))
-
-            sql: str = "SELECT id FROM players WHERE name = ?;"
-            player_id: int = cursor.execute(sql, (name,)).fetchone()[0]
-            self.connection.commit()
+            if self._upsert:
+                sql: str = """
+                INSERT INTO players (name) VALUES (?)
+                ON CONFLICT (name) DO UPDATE SET name = excluded.name
+                RETURNING id;
+                """
+                player_id = cursor.execute(sql, (name,)).fetchone()[0]
+            else:
+                sql: str = "INSERT or IGNORE INTO players (name) VALUES (?);"
+                cursor.execute(sql, (name,))
+
+                sql: str = "SELECT id FROM players WHERE name = ?;"
+                player_id = cursor.execute(sql, (name,)).fetchone()[0]
+            if commit:
+                self.connection.commit()
         except sqlite3.OperationalError as error:
             self._exception_handler(error)
+            return None
 
+        self._player_ids.put(name, player_id)
         return player_id
 
-    def _insert_score(self, player_id: int, level: int, points: int, time: datetime):
+    def _insert_score(self, player_id: int, level: int, points: int, time: datetime, *,
+                      commit: bool = True):
         """Inserts a new score into the database for a specific player.
 
         This method takes player's details and score information such as player ID, level,
@@ -78,6 +134,7 @@ class ScoreService:
             level: The game level the player achieved the score on.
             points: The score points earned by the player.
             time: The timestamp when the score was achieved.
+            commit: If False, the insert is left to the ongoing transaction.
         """
         if player_id is None:
             return
@@ -87,10 +144,12 @@ class ScoreService:
 
         try:
             cursor.execute(sql, (player_id, level, points, time))
-            self.connection.commit()
+            if commit:
+                self.connection.commit()
         except sqlite3.OperationalError as error:
             self._exception_handler(error)
 
+    @profiled("score_service.add_new_score")
     def add_new_score(self, name: str, level: int, points: int, time: datetime):
         """Adds a new score to the database by inserting player details and score information.
 
@@ -109,6 +168,30 @@ class ScoreService:
 
         self._insert_score(player_id, level, points, time)
 
+    @profiled("score_service.add_new_scores")
+    def add_new_scores(self, scores: Iterable[tuple[str, int, int, datetime]]):
+        """Adds multiple scores to the database in a single transaction.
+
+        Works like add_new_score for every score, but commits only once after all of
+        the scores have been inserted. If the transaction fails, it is rolled back and the
+        player id cache is cleared, because it may hold ids of players whose insert was
+        rolled back.
+
+        Args:
+            scores: Name, level, points and time of every score to be added.
+        """
+        try:
+            for name, level, points, time in scores:
+                player_id: int | None = self._insert_player(name, commit=False)
+                self._insert_score(player_id, level, points, time, commit=False)
+
+            self.connection.commit()
+        except sqlite3.Error:
+            self.connection.rollback()
+            self._player_ids.clear()
+            raise
+
+    @profiled("score_service.get_scores")
     def get_scores(self) -> list[ScoreTuple]:
         """Retrieves a list of scores along with player details, sorted by points in descending
         order and time.
@@ -144,19 +227,184 @@ class ScoreService:
 
         return cursor.fetchall()
 
+    @profiled("score_service.get_page")
+    def get_page(self, after: ScoreKey | None = None, limit: int = 10) -> list[ScoreTuple]:
+        """Retrieves a page of scores in high score order using keyset pagination.
+
+        The page starts right after the score with the given points and time, so the
+        database can seek to it with the scores index instead of counting past every
+        earlier score like an OFFSET would.
+
+        Args:
+            after: Points and time of the last score of the previous page, or None for the
+                first page.
+            limit: Maximum number of scores on the page.
+
+        Returns:
+            A list of records containing player names, levels, points, and time.
+        """
+        if after is None:
+            sql: str = f"{_SELECT_SCORES} ORDER BY points DESC, time LIMIT :limit;"
+            return self._fetch_all(sql, {"limit": limit})
+
+        sql: str = f"""
+        {_SELECT_SCORES}
+        WHERE points <= :points AND (points < :points OR time > :time)
+        ORDER BY points DESC, time
+        LIMIT :limit;
+        """
+        return self._fetch_all(sql, {"points": after[0], "time": after[1], "limit": limit})
+
+    @profiled("score_service.get_page_before")
+    def get_page_before(self, before: ScoreKey | None = None, limit: int = 10) -> list[ScoreTuple]:
+        """Retrieves the scores preceding the given score in high score order.
+
+        Works like get_page in the opposite direction, so pages can be browsed backwards
+        and the last page can be fetched without reading the whole table.
+
+        Args:
+            before: Points and time of the first score of the next page, or None for the
+                last page.
+            limit: Maximum number of scores on the page.
+
+        Returns:
+            A list of records containing player names, levels, points, and time in high
+            score order.
+        """
+        if before is None:
+            sql: str = f"{_SELECT_SCORES} ORDER BY points, time DESC LIMIT :limit;"
+            return self._fetch_all(sql, {"limit": limit})[::-1]
+
+        sql: str = f"""
+        {_SELECT_SCORES}
+        WHERE points >= :points AND (points > :points OR time < :time)
+        ORDER BY points, time DESC
+        LIMIT :limit;
+        """
+        return self._fetch_all(sql, {"points": before[0], "time": before[1],
+                                     "limit": limit})[::-1]
+
+    @profiled("score_service.get_player_bests")
+    def get_player_bests(self, limit: int = 10) -> list[ScoreTuple]:
+        """Retrieves the best score of every player in high score order.
+
+        The best scores are kept in the `player_bests` table by a trigger on the `scores`
+        table, so they are read from its index without grouping the scores.
+
+        Args:
+            limit: Maximum number of scores returned.
+
+        Returns:
+            A list of records containing player names, levels, points, and time.
+        """
+        sql: str = f"""
+        {_SELECT_VIEW.format(table="player_bests")}
+        ORDER BY points DESC, time
+        LIMIT :limit;
+        """
+        return self._fetch_all(sql, {"limit": limit})
+
+    @profiled("score_service.get_daily_top")
+    def get_daily_top(self, day: date, limit: int = 10) -> list[ScoreTuple]:
+        """Retrieves the top scores recorded on the given day in high score order.
+
+        Args:
+            day: The day the scores were recorded on.
+            limit: Maximum number of scores returned. At most PERIOD_TOP_SIZE scores are
+                kept for a day.
+
+        Returns:
+            A list of records containing player names, levels, points, and time.
+        """
+        return self._get_period_top("day", day, limit)
+
+    @profiled("score_service.get_weekly_top")
+    def get_weekly_top(self, week_start: date, limit: int = 10) -> list[ScoreTuple]:
+        """Retrieves the top scores recorded in the week starting on the given Monday.
+
+        Args:
+            week_start: The Monday the week starts on.
+            limit: Maximum number of scores returned. At most PERIOD_TOP_SIZE scores are
+                kept for a week.
+
+        Returns:
+            A list of records containing player names, levels, points, and time.
+        """
+        return self._get_period_top("week", week_start, limit)
+
+    def _get_period_top(self, period: str, start: date, limit: int) -> list[ScoreTuple]:
+        """Retrieves the top scores of a day or a week from the `period_tops` table.
+
+        The table is kept up to date by a trigger on the `scores` table.
+        """
+        sql: str = f"""
+        {_SELECT_VIEW.format(table="period_tops")}
+        WHERE period = :period AND start = :start
+        ORDER BY points DESC, time
+        LIMIT :limit;
+        """
+        return self._fetch_all(sql, {"period": period, "start": str(start), "limit": limit})
+
+    @profiled("score_service.get_rank")
+    def get_rank(self, points: int, time: str) -> int:
+        """Retrieves the position of a score with the given points and time on the high scores.
+
+        Args:
+            points: Points of the score.
+            time: Time the score was recorded.
+
+        Returns:
+            The 1-based rank the score has or would have among the stored scores.
+        """
+        sql: str = """
+        SELECT COUNT(*) + 1
+        FROM scores
+        WHERE points >= :points AND (points > :points OR time < :time);
+        """
+        return self._fetch_all(sql, {"points": points, "time": str(time)})[0][0]
+
+    @profiled("score_service.get_score_keys")
+    def get_score_keys(self) -> list[ScoreKey]:
+        """Retrieves the points and time of every stored score in high score order.
+
+        The query is answered from the scores index without reading the score rows or
+        joining the players.
+        """
+        return self._fetch_all("SELECT points, time FROM scores ORDER BY points DESC, time;")
+
+    @profiled("score_service.count_scores")
+    def count_scores(self) -> int:
+        """Retrieves the number of stored scores."""
+        return self._fetch_all("SELECT COUNT(*) FROM scores;")[0][0]
+
+    def _fetch_all(self, sql: str, parameters: dict | None = None) -> list[tuple]:
+        """Runs a query and returns every resulting row.
+
+        Operational errors are handled by the `_exception_handler` method.
+        """
+        cursor: Cursor = self.connection.cursor()
+
+        try:
+            cursor.execute(sql, parameters or {})
+        except sqlite3.OperationalError as error:
+            self._exception_handler(error)
+
+        return cursor.fetchall()
+
     def _exception_handler(self, exception: Exception):
         """Handles exceptions that arise during runtime and takes appropriate action
         based on the nature of the error.
 
         If the exception contains the phrase "no such table" error, it provides user
         feedback on the missing database initialization and subsequently terminates
-        the application gracefully. For all other exceptions, it re-raises them to
-        ensure proper handling elsewhere.
+        the application gracefully, unless the service was created with
+        exit_on_missing_tables set to False. For all other exceptions, it re-raises them
+        to ensure proper handling elsewhere.
 
         Args:
             exception: The exception encountered during the program's execution.
         """
-        if "no such table" in exception.args[0]:
+        if self._exit_on_missing_tables and "no such table" in exception.args[0]:
             print("Trying to run the game without initializing the database.")
             print("Please refer to the user manual on how to initialize the database.")
             self.connection.close()
@@ -0,0 +1,204 @@
+import json
+from datetime import datetime
+from typing import TYPE_CHECKING, Iterable, Iterator, TextIO
+
+from utilities.lru_cache import LRUCache
+
+if TYPE_CHECKING:
+    from sqlite3 import Connection, Cursor
+
+type ScoreRecord = tuple[str, int, int, str]
+
+FORMAT: str = "gem-poacher-scores"
+"""Name of the score file format written on the header line of every export."""
+
+VERSION: int = 1
+"""Version of the score file format."""
+
+COLUMNS: list[str] = ["name", "level", "points", "time"]
+"""Names of the values on every score line, in order."""
+
+BATCH_SIZE: int = 10_000
+"""Number of scores inserted with a single executemany call."""
+
+PLAYER_CACHE_SIZE: int = 100_000
+"""Maximum number of player ids kept in memory while importing."""
+
+_EXPORT_SQL: str = """
+SELECT name, level, points, time
+FROM scores JOIN players
+    ON players.id = scores.player_id
+ORDER BY scores.id;
+"""
+
+
+def export_scores(connection: "Connection", file: TextIO) -> int:
+    """Writes every stored score to a newline-delimited JSON file.
+
+    The first line is a header naming the format and the columns, and every following
+    line is a compact JSON array of the player name, level, points and time of a single
+    score. The rows are streamed from the cursor, so only one score is held in memory at
+    a time.
+
+    Args:
+        connection: Connection to the score database.
+        file: Text file the scores are written to.
+
+    Returns:
+        The number of exported scores.
+
+    Raises:
+        ValueError: If a score has no time, which import_scores would reject.
+    """
+    header: dict = {"format": FORMAT, "version": VERSION, "columns": COLUMNS}
+    file.write(json.dumps(header, separators=(",", ":")) + "\n")
+
+    count: int = 0
+    for row in connection.execute(_EXPORT_SQL):
+        if row[3] is None:
+            raise ValueError(f"Score {count + 1} of {row[0]} has no time")
+        file.write(json.dumps(row, ensure_ascii=False, separators=(",", ":")) + "\n")
+        count += 1
+    return count
+
+
+def import_scores(connection: "Connection", file: TextIO, batch_size: int = BATCH_SIZE) -> int:
+    """Adds the scores of a file written by export_scores to the database.
+
+    The scores are read and inserted in batches with executemany, all inside a single
+    transaction that is rolled back if the file is invalid. Players are added with
+    INSERT OR IGNORE, so players already in the database keep their id, and the ids are
+    cached in a bounded LRUCache. Memory use depends on the batch and cache sizes only,
+    not on the size of the file.
+
+    Args:
+        connection: Connection to the score database.
+        file: Text file the scores are read from.
+        batch_size: Number of scores inserted at a time.
+
+    Returns:
+        The number of imported scores.
+
+    Raises:
+        ValueError: If the file isn't a valid score file.
+    """
+    records: Iterator[ScoreRecord] = _read_records(file)
+    player_ids: LRUCache = LRUCache(PLAYER_CACHE_SIZE)
+    count: int = 0
+
+    try:
+        batch: list[ScoreRecord] = []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= batch_size:
+                count += _insert_batch(connection, batch, player_ids)
+                batch.clear()
+        count += _insert_batch(connection, batch, player_ids)
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+
+    return count
+
+
+def _insert_batch(connection: "Connection", batch: list[ScoreRecord],
+                  player_ids: LRUCache) -> int:
+    """Inserts the players and scores of a batch without committing.
+
+    Returns:
+        The number of inserted scores.
+    """
+    if not batch:
+        return 0
+
+    names: Iterable[str] = dict.fromkeys(record[0] for record in batch)
+    ids: dict[str, int] = _get_player_ids(connection, names, player_ids)
+    connection.executemany(
+        "INSERT INTO scores (player_id, level, points, time) VALUES (?, ?, ?, ?);",
+        ((ids[name], level, points, time) for name, level, points, time in batch))
+    return len(batch)
+
+
+def _get_player_ids(connection: "Connection", names: Iterable[str],
+                    player_ids: LRUCache) -> dict[str, int]:
+    """Returns the ids of the players, adding the players missing from the database.
+
+    Ids found in the cache are used as is. The missing players are inserted with a single
+    executemany call and their ids are looked up and cached.
+    """
+    ids: dict[str, int] = {}
+    missing: list[str] = []
+    for name in names:
+        player_id: int | None = player_ids.get(name)
+        if player_id is None:
+            missing.append(name)
+        else:
+            ids[name] = player_id
+
+    if missing:
+        connection.executemany("INSERT OR IGNORE INTO players (name) VALUES (?);",
+                               ((name,) for name in missing))
+        cursor: Cursor = connection.cursor()
+        for name in missing:
+            player_id: int = cursor.execute("SELECT id FROM players WHERE name = ?;",
+                                            (name,)).fetchone()[0]
+            player_ids.put(name, player_id)
+            ids[name] = player_id
+
+    return ids
+
+
+def _read_records(file: TextIO) -> Iterator[ScoreRecord]:
+    """Checks the header of a score file and yields its scores one line at a time.
+
+    Raises:
+        ValueError: If the header or a score line is invalid.
+    """
+    try:
+        header: dict = json.loads(file.readline() or "null") or {}
+    except json.JSONDecodeError as error:
+        raise ValueError(f"Line 1: invalid header: {error}") from error
+
+    if not isinstance(header, dict) or header.get("format") != FORMAT:
+        raise ValueError("Line 1: not a score file")
+    if header.get("version") != VERSION or header.get("columns") != COLUMNS:
+        raise ValueError(f"Line 1: unsupported score file version {header.get('version')}")
+
+    for line_number, line in enumerate(file, start=2):
+        if line.strip():
+            yield _parse_record(line, line_number)
+
+
+def _parse_record(line: str, line_number: int) -> ScoreRecord:
+    """Parses a single score line.
+
+    The time is stored in the form the game writes it, str of a naive datetime, so other
+    ISO formats like a T separator or a date without a time are normalized to it. Times
+    with a timezone are rejected, because the game records local times without one, and
+    so are missing times, which the daily and weekly leaderboards can't place.
+
+    Raises:
+        ValueError: If the line isn't a valid score.
+    """
+    try:
+        record: list = json.loads(line)
+    except json.JSONDecodeError as error:
+        raise ValueError(f"Line {line_number}: {error}") from error
+
+    if (not isinstance(record, list) or len(record) != len(COLUMNS)
+            or not isinstance(record[0], str) or not isinstance(record[3], str)
+            or not all(isinstance(value, int) and not isinstance(value, bool)
+                       for value in record[1:3])):
+        raise ValueError(f"Line {line_number}: expected [name, level, points, time], "
+                         f"got {line.strip()}")
+
+    try:
+        time: datetime = datetime.fromisoformat(record[3])
+    except ValueError as error:
+        raise ValueError(f"Line {line_number}: invalid time: {error}") from error
+    if time.tzinfo is not None:
+        raise ValueError(f"Line {line_number}: time {record[3]} has a timezone, "
+                         "expected a local time without one")
+
+    return record[0], record[1], record[2], str(time)
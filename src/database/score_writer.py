@@ -0,0 +1,178 @@
+import contextlib
+import queue
+import sqlite3
+import threading
+from datetime import datetime
+from functools import partial
+from typing import Callable, TYPE_CHECKING
+
+from database.score_service import ScoreService
+
+if TYPE_CHECKING:
+    from sqlite3 import Connection
+
+type ScoreRow = tuple[str, int, int, datetime]
+type WriteListener = Callable[[list[ScoreRow]], None]
+
+
+class ScoreWriter:
+    """Persists scores in a background thread so the game loop never waits for the disk.
+
+    Submitted scores are put into a bounded queue. A background thread takes every
+    score waiting in the queue, up to the batch size, and inserts them in a single
+    transaction through its own ScoreService. SQLite connections can't be shared
+    between threads, so the writer thread opens its own connection with the given
+    connection function. Listeners are notified from the writer thread after each
+    batch has been committed, and failure listeners after each batch that could not be
+    saved. Errors are reported without stopping the thread.
+
+    Attributes:
+        _queue: Bounded queue of scores waiting to be written. None stops the thread.
+        _connect: Function opening the database connection of the writer thread.
+        _batch_size: Maximum number of scores written in a single transaction.
+        _listeners: Functions called with the written scores after every batch.
+        _failure_listeners: Functions called with the scores of every failed batch.
+        _thread: The background writer thread.
+    """
+
+    def __init__(self, connect: Callable[[], "Connection"], max_pending: int = 256,
+                 batch_size: int = 64):
+        """Initializes the writer and starts the writer thread.
+
+        Args:
+            connect: Function opening a database connection. It is called in the writer
+                thread.
+            max_pending: Maximum number of scores waiting to be written. Submitting more
+                blocks until the writer catches up.
+            batch_size: Maximum number of scores written in a single transaction.
+        """
+        self._queue: queue.Queue[ScoreRow | None] = queue.Queue(max_pending)
+        self._connect: Callable[[], "Connection"] = connect
+        self._batch_size: int = batch_size
+        self._listeners: list[WriteListener] = []
+        self._failure_listeners: list[WriteListener] = []
+        self._thread: threading.Thread = threading.Thread(target=self._run, name="score-writer",
+                                                          daemon=True)
+        self._thread.start()
+
+    def add_listener(self, listener: WriteListener):
+        """Adds a function that is called with the scores of every committed batch.
+
+        Listeners are called from the writer thread.
+        """
+        self._listeners.append(listener)
+
+    def add_failure_listener(self, listener: WriteListener):
+        """Adds a function that is called with the scores of every batch that failed to save.
+
+        Listeners are called from the writer thread.
+        """
+        self._failure_listeners.append(listener)
+
+    def submit(self, name: str, level: int, points: int, time: datetime):
+        """Queues a score to be written to the database.
+
+        Args:
+            name: The name of the player.
+            level: The level reached by the player.
+            points: The score points earned by the player.
+            time: The time the score was recorded.
+        """
+        self._queue.put((name, level, points, time))
+
+    def flush(self):
+        """Blocks until every submitted score has been written."""
+        self._queue.join()
+
+    def close(self):
+        """Writes the remaining scores and stops the writer thread."""
+        if not self._thread.is_alive():
+            return
+
+        self.flush()
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        try:
+            connection: "Connection" = self._connect()
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            print(f"Could not open the score database, scores won't be saved: {error}")
+            while self._process_batch(self._fail):
+                pass
+            return
+
+        score_service: ScoreService = ScoreService(connection, exit_on_missing_tables=False)
+        try:
+            while self._process_batch(partial(self._write, score_service)):
+                pass
+        finally:
+            connection.close()
+
+    def _process_batch(self, write: Callable[[list[ScoreRow]], None]) -> bool:
+        """Writes the next batch and marks its scores done, even if the write fails.
+
+        Args:
+            write: Function writing the scores of the batch.
+
+        Returns:
+            False if the batch ended with None, which stops the writer thread.
+        """
+        batch: list[ScoreRow | None] = self._next_batch()
+        try:
+            write([score for score in batch if score is not None])
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+        return batch[-1] is not None
+
+    def _next_batch(self) -> list[ScoreRow | None]:
+        """Waits for a score and takes the scores queued after it, up to the batch size.
+
+        The batch ends early at None, which stops the writer thread.
+        """
+        batch: list[ScoreRow | None] = [self._queue.get()]
+        while len(batch) < self._batch_size and batch[-1] is not None:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, score_service: ScoreService, scores: list[ScoreRow]):
+        """Writes a batch of scores and notifies the listeners.
+
+        Any error is reported and the failure listeners are notified instead, so a failed
+        batch never stops the writer thread.
+        """
+        if not scores:
+            return
+
+        try:
+            score_service.add_new_scores(scores)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            print(f"Could not save {len(scores)} score(s): {error}")
+            with contextlib.suppress(sqlite3.Error):
+                score_service.connection.rollback()
+            _notify(self._failure_listeners, scores)
+            return
+
+        _notify(self._listeners, scores)
+
+    def _fail(self, scores: list[ScoreRow]):
+        """Passes the scores to the failure listeners without writing them.
+
+        Used when the database connection couldn't be opened, so submitted scores are
+        still dropped by the listeners and flush and submit never block for good.
+        """
+        if scores:
+            _notify(self._failure_listeners, scores)
+
+
+def _notify(listeners: list[WriteListener], scores: list[ScoreRow]):
+    """Calls every listener with the scores, reporting the errors of failing listeners."""
+    for listener in listeners:
+        try:
+            listener(scores)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            print(f"Score writer listener failed: {error}")
@@ -1,5 +1,5 @@
-from .clock import Clock
+from .clock import Clock, FixedStepClock
 from .event_queue import EventQueue
 from .game_logic import GameLogic
 from .game_loop import GameLoop
-from .game_state import GameState
+from .game_state import GameState, SpawnSettings
@@ -1,29 +1,221 @@
+import statistics
+import time
+from typing import TYPE_CHECKING
+
 import pygame
 
+if TYPE_CHECKING:
+    from utilities.config_manager import ConfigSnapshot
+
+FPS_STEPS: tuple[int, ...] = (240, 144, 120, 90, 75, 60, 50, 45, 40, 30)
+"""Framerates the adaptive frame pacing steps between, highest first."""
+
+JITTER_LIMIT_MS: float = 1.0
+"""Mean deviation from the frame time above which sleeping is replaced by busy waiting."""
+
+BUSY_LOOP_RETRY_WINDOWS: int = 10
+"""Measurement windows the busy loop is used for before sleeping is measured again."""
+
+
+class FramePacer:
+    """Chooses the framerate and the waiting strategy of a Clock from measured frame times.
+
+    Frame times are measured over windows of one second of frames. After every window:
+
+    - If at least half of the frames took longer to update and render than the frame
+      time allows, the framerate is lowered to the highest step in FPS_STEPS whose frame
+      time fits the median work time, but not below the minimum framerate.
+    - If every frame took less than half of the frame time of the next higher step, the
+      framerate is raised back towards the target framerate.
+    - If the frames waited by sleeping deviated from the frame time by more than
+      JITTER_LIMIT_MS on average, the clock switches to busy waiting, which is precise
+      but keeps a CPU core busy. Sleeping is measured again after
+      BUSY_LOOP_RETRY_WINDOWS windows.
+
+    Attributes:
+        target_fps: The wanted framerate.
+        fps: The framerate currently used.
+        busy_loop: Whether the clock should busy wait instead of sleeping.
+        _min_fps: Lowest framerate the pacer lowers the framerate to. A lower target
+            framerate is used as the lowest framerate instead.
+        _last_tick: perf_counter time at the end of the previous tick, or None.
+        _samples: (work, frame) times in milliseconds of the frames in the current window.
+        _busy_windows: Windows measured since switching to busy waiting.
+    """
+
+    def __init__(self, target_fps: int, min_fps: int = 30):
+        """Initialize the pacer.
+
+        Args:
+            target_fps: The wanted framerate.
+            min_fps: Lowest framerate the pacer lowers the framerate to.
+        """
+        self.target_fps: int = target_fps
+        self.fps: int = target_fps
+        self.busy_loop: bool = False
+        self._min_fps: int = min_fps
+        self._last_tick: float | None = None
+        self._samples: list[tuple[float, float]] = []
+        self._busy_windows: int = 0
+
+    def set_target(self, fps: int):
+        """Sets a new target framerate and starts pacing from it."""
+        self.target_fps = fps
+        self.fps = fps
+        self._samples.clear()
+
+    def record(self, work_start: float, frame_end: float):
+        """Records the times of a frame and adjusts the pacing after every full window.
+
+        Args:
+            work_start: perf_counter time before the clock started waiting.
+            frame_end: perf_counter time after the clock stopped waiting.
+        """
+        if self._last_tick is not None:
+            self._samples.append(((work_start - self._last_tick) * 1000,
+                                  (frame_end - self._last_tick) * 1000))
+        self._last_tick = frame_end
+
+        if len(self._samples) >= self.fps:
+            self._adjust()
+            self._samples.clear()
+
+    def _adjust(self):
+        frame_time: float = 1000 / self.fps
+        work_times: list[float] = [work for work, _ in self._samples]
+        overruns: int = sum(1 for work in work_times if work > frame_time)
+
+        if overruns * 2 >= len(work_times):
+            min_fps: int = min(self._min_fps, self.target_fps)
+            median_work: float = statistics.median(work_times)
+            fitting: list[int] = [step for step in FPS_STEPS
+                                  if step < self.fps and 1000 / step >= median_work]
+            self.fps = max(fitting[0] if fitting else min_fps, min_fps)
+            return
+
+        if self.fps < self.target_fps:
+            higher_fps: int = _next_step(self.fps, self.target_fps)
+            if max(work_times) < 500 / higher_fps:
+                self.fps = higher_fps
+                return
+
+        self._choose_waiting_strategy(frame_time, overruns)
+
+    def _choose_waiting_strategy(self, frame_time: float, overruns: int):
+        if self.busy_loop:
+            self._busy_windows += 1
+            if self._busy_windows >= BUSY_LOOP_RETRY_WINDOWS:
+                self.busy_loop = False
+            return
+
+        waited: list[float] = [frame for work, frame in self._samples if work <= frame_time]
+        if overruns or not waited:
+            return
+
+        jitter: float = statistics.fmean(abs(frame - frame_time) for frame in waited)
+        if jitter > JITTER_LIMIT_MS:
+            self.busy_loop = True
+            self._busy_windows = 0
+
+
+def _next_step(fps: int, limit: int) -> int:
+    """Returns the next higher framerate in FPS_STEPS, but at most the limit."""
+    steps: list[int] = [step for step in reversed(FPS_STEPS) if step > fps]
+    return min(steps[0] if steps else limit, limit)
+
 
 class Clock:
     """Class that encapsulates the functionality of pygame.time.Clock.
 
     Attributes:
+        _fps: Target frames per second.
         _clock: Instance of pygame.time.Clock.
+        _pacer: FramePacer choosing the framerate and the waiting strategy, or None
+            when adaptive frame pacing is disabled.
     """
 
-    def __init__(self, fps: int = 120):
-        """Initialize the clock."""
+    def __init__(self, fps: int = 120, adaptive: bool = False):
+        """Initialize the clock.
+
+        Args:
+            fps: Target frames per second.
+            adaptive: If True, a FramePacer chooses between sleeping and busy waiting
+                and lowers the framerate when frames consistently take too long.
+        """
         self._fps = fps
         self._clock: pygame.time.Clock = pygame.time.Clock()
+        self._pacer: FramePacer | None = FramePacer(fps) if adaptive else None
 
     @property
     def fps(self):
+        if self._pacer is not None:
+            return self._pacer.fps
         return self._fps
 
+    @property
+    def busy_loop(self) -> bool:
+        return self._pacer is not None and self._pacer.busy_loop
+
     def set_framerate(self, fps: int):
         self._fps = fps
+        if self._pacer is not None:
+            self._pacer.set_target(fps)
+
+    def apply_config(self, config: "ConfigSnapshot"):
+        """Applies the framerate of changed configuration settings."""
+        self.set_framerate(config.fps)
 
     def tick(self):
         """Gives access to pygame.time.clock.tick method.
 
-        Args:
-            fps: Set how many ticks per second.
+        With adaptive frame pacing the frame is paced with tick_busy_loop when the
+        pacer has chosen busy waiting, and the frame times are given to the pacer.
         """
-        self._clock.tick(self._fps)
+        if self._pacer is None:
+            self._clock.tick(self._fps)
+            return
+
+        work_start: float = time.perf_counter()
+        if self._pacer.busy_loop:
+            self._clock.tick_busy_loop(self._pacer.fps)
+        else:
+            self._clock.tick(self._pacer.fps)
+        self._pacer.record(work_start, time.perf_counter())
+
+
+class FixedStepClock:
+    """Clock for simulations that advances time by a fixed timestep instead of waiting.
+
+    Every tick advances the simulated time by one frame of the set framerate without
+    sleeping, so a simulation can run as fast as the CPU allows. The get_ticks method
+    can be used as the time source of GameLogic in place of pygame.time.get_ticks, which
+    makes simulations reproducible.
+
+    Attributes:
+        _fps: Simulated frames per second.
+        _frames: Frames ticked since the framerate was last set.
+        _base_ticks: Simulated milliseconds elapsed before the framerate was last set.
+    """
+
+    def __init__(self, fps: int = 120):
+        """Initialize the clock at simulated time zero."""
+        self._fps: int = fps
+        self._frames: int = 0
+        self._base_ticks: int = 0
+
+    @property
+    def fps(self):
+        return self._fps
+
+    def set_framerate(self, fps: int):
+        self._base_ticks = self.get_ticks()
+        self._frames = 0
+        self._fps = fps
+
+    def tick(self):
+        """Advances the simulated time by one frame."""
+        self._frames += 1
+
+    def get_ticks(self) -> int:
+        """Returns the simulated milliseconds elapsed since the clock was created."""
+        return self._base_ticks + self._frames * 1000 // self._fps
@@ -0,0 +1,177 @@
+from typing import TYPE_CHECKING
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from sprites.spatial_hash import CELL_SIZE
+
+if TYPE_CHECKING:
+    from sprites import Enemy
+
+FIELDS: tuple[str, ...] = ("center_x", "center_y", "direction_x", "direction_y", "speed", "width",
+                           "height")
+"""Names of the arrays kept for each enemy inside the EnemyStore."""
+
+
+class EnemyStore:
+    """Structure of arrays holding the movement data of every enemy.
+
+    Positions, directions, speeds and sizes of the enemies are kept in contiguous
+    NumPy arrays, so every enemy can be moved and reflected from the game borders with
+    a single vectorized step. Enemy sprites added to the store become views to the store
+    and read their movement values from it. Their rects are synced from the stored
+    positions lazily, when the rect is read. Spatial hash groups are only updated for the
+    enemies that moved to different grid cells during a step, so spatial hash groups
+    containing stored enemies have to use the cell size of the store. Requires the
+    optional NumPy dependency.
+
+    Attributes:
+        steps: Number of steps taken. Enemies compare it to the step their rect was
+            last synced on.
+        _cell_size: Grid cell size of the spatial hash groups containing the enemies.
+        _arrays: Dictionary holding an array for every field in FIELDS.
+        _enemies: List of the stored enemies. The index of an enemy matches its index
+            in the arrays.
+    """
+
+    def __init__(self, capacity: int = 64, cell_size: int = CELL_SIZE):
+        """Initializes the store with empty arrays.
+
+        Args:
+            capacity: Initial capacity of the arrays. The arrays grow when needed.
+            cell_size: Grid cell size of the spatial hash groups containing the enemies.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if numpy is None:
+            raise ImportError("EnemyStore requires NumPy")
+
+        self.steps: int = 0
+        self._cell_size: int = cell_size
+        self._arrays: dict[str, numpy.ndarray] = {
+            field: numpy.zeros(capacity, dtype=numpy.int64) for field in FIELDS
+        }
+        self._enemies: list["Enemy"] = []
+
+    @staticmethod
+    def is_available() -> bool:
+        """Returns True if NumPy is installed and the store can be used."""
+        return numpy is not None
+
+    def __len__(self) -> int:
+        return len(self._enemies)
+
+    def _grow(self):
+        """Doubles the capacity of every array."""
+        for field, array in self._arrays.items():
+            self._arrays[field] = numpy.concatenate((array, numpy.zeros_like(array)))
+
+    def add(self, enemy: "Enemy"):
+        """Copies the enemy's movement values into the store and binds the enemy to it.
+
+        Args:
+            enemy: Enemy sprite that has already been placed.
+        """
+        index: int = len(self._enemies)
+        if index == len(self._arrays["center_x"]):
+            self._grow()
+
+        values: dict[str, int] = {
+            "center_x": enemy.rect.centerx,
+            "center_y": enemy.rect.centery,
+            "direction_x": enemy.direction_x,
+            "direction_y": enemy.direction_y,
+            "speed": enemy.speed,
+            "width": enemy.rect.width,
+            "height": enemy.rect.height,
+        }
+        for field, value in values.items():
+            self._arrays[field][index] = value
+
+        self._enemies.append(enemy)
+        enemy.bind(self, index)
+
+    def remove(self, enemy: "Enemy"):
+        """Removes the enemy from the store and unbinds it.
+
+        The last enemy in the store is moved to the freed index so the arrays stay
+        contiguous.
+
+        Args:
+            enemy: Enemy sprite bound to this store.
+        """
+        index: int = enemy.store_index
+        enemy.unbind()
+
+        last: int = len(self._enemies) - 1
+        last_enemy: "Enemy" = self._enemies.pop()
+        if index != last:
+            for array in self._arrays.values():
+                array[index] = array[last]
+            self._enemies[index] = last_enemy
+            last_enemy.bind(self, index)
+
+    def get_value(self, index: int, field: str) -> int:
+        return int(self._arrays[field][index])
+
+    def set_value(self, index: int, field: str, value: int):
+        self._arrays[field][index] = value
+
+    def get_center(self, index: int) -> tuple[int, int]:
+        return int(self._arrays["center_x"][index]), int(self._arrays["center_y"][index])
+
+    def set_center(self, index: int, center: tuple[int, int]):
+        self._arrays["center_x"][index] = center[0]
+        self._arrays["center_y"][index] = center[1]
+
+    def _cell_bounds(self, centers_x: numpy.ndarray, centers_y: numpy.ndarray,
+                     arrays: dict[str, numpy.ndarray]) -> numpy.ndarray:
+        """Returns the first and last grid column and row of every enemy at the given positions.
+
+        Matches SpatialHash bounds of the rects centered at the given positions.
+        """
+        left: numpy.ndarray = centers_x - arrays["width"] // 2
+        top: numpy.ndarray = centers_y - arrays["height"] // 2
+        return numpy.stack((left, left + arrays["width"] - 1,
+                            top, top + arrays["height"] - 1)) // self._cell_size
+
+    def step(self, width: int, height: int):
+        """Moves every enemy and reflects the ones crossing the game borders.
+
+        Gives the same result as calling Enemy.move for every enemy and then changing the
+        directions of the enemies that collide with the game borders. Enemy rects are
+        synced when they are read next, and only the enemies that moved to different
+        grid cells are rehashed.
+
+        Args:
+            width: Width of the game area.
+            height: Height of the game area.
+        """
+        count: int = len(self._enemies)
+        if not count:
+            return
+
+        arrays: dict[str, numpy.ndarray] = {field: array[:count]
+                                            for field, array in self._arrays.items()}
+        old_bounds: numpy.ndarray = self._cell_bounds(arrays["center_x"], arrays["center_y"],
+                                                      arrays)
+        arrays["center_x"] += arrays["direction_x"] * arrays["speed"]
+        arrays["center_y"] += arrays["direction_y"] * arrays["speed"]
+
+        left: numpy.ndarray = arrays["center_x"] - arrays["width"] // 2
+        top: numpy.ndarray = arrays["center_y"] - arrays["height"] // 2
+
+        arrays["direction_x"][:] = numpy.where(
+            left < 0, 1, numpy.where(left + arrays["width"] > width, -1, arrays["direction_x"]))
+        arrays["direction_y"][:] = numpy.where(
+            top < 0, 1, numpy.where(top + arrays["height"] > height, -1, arrays["direction_y"]))
+
+        self.steps += 1
+        new_bounds: numpy.ndarray = self._cell_bounds(arrays["center_x"], arrays["center_y"],
+                                                      arrays)
+        moved: numpy.ndarray = numpy.flatnonzero((old_bounds != new_bounds).any(axis=0))
+        for index in moved.tolist():
+            self._enemies[index].rehash()
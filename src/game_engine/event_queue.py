@@ -1,13 +1,85 @@
+from typing import Sequence
+
 import pygame
 
+HANDLED_EVENT_TYPES: tuple[int, ...] = (
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.MOUSEMOTION,
+    # KEYDOWN events get their unicode attribute from the matching TEXTINPUT event,
+    # so text input can't be blocked without breaking the name input box.
+    pygame.TEXTINPUT,
+    # Window events are kept so minimizing, restoring, exposing and focus changes of the
+    # window still reach pygame and the window manager. Pygame 2 splits the SDL window
+    # event into the WINDOW* event types.
+    pygame.WINDOWSHOWN,
+    pygame.WINDOWHIDDEN,
+    pygame.WINDOWEXPOSED,
+    pygame.WINDOWMINIMIZED,
+    pygame.WINDOWRESTORED,
+    pygame.WINDOWFOCUSGAINED,
+    pygame.WINDOWFOCUSLOST,
+    pygame.VIDEOEXPOSE,
+    pygame.ACTIVEEVENT,
+)
+"""Event types the game and the window need. Other event types are blocked from the event
+queue."""
+
 
 class EventQueue:
-    """Encapsulates the pygame method for getting pygame events."""
+    """Encapsulates the pygame method for getting pygame events.
+
+    Only the newest MOUSEMOTION event of every frame is delivered, because the player is
+    moved to the newest mouse position anyway. High polling rate mice can produce
+    hundreds of motion events per frame.
+
+    Attributes:
+        _stats: Dictionary counting the events taken from the pygame event queue and the
+            events delivered to the game loop.
+    """
+
+    def __init__(self, allowed: Sequence[int] | None = None):
+        """Initializes the event queue.
+
+        Args:
+            allowed: If given, only events of these types are allowed into the pygame
+                event queue with pygame.event.set_allowed. HANDLED_EVENT_TYPES holds the
+                event types the game handles. Requires an initialized display.
+        """
+        self._stats: dict[str, int] = {"raw": 0, "delivered": 0}
+        if allowed is not None:
+            pygame.event.set_blocked(None)
+            pygame.event.set_allowed(list(allowed))
 
-    def get(self):
+    def get(self) -> list[pygame.event.Event]:
         """Method for getting pygame events.
 
-        Returns: pygame event.
+        Motion events are collapsed into the newest one, which keeps its place among the
+        other events. Its rel attribute holds the movement of every collapsed event.
 
+        Returns: The pygame events of the frame.
         """
-        return pygame.event.get()
+        events: list[pygame.event.Event] = pygame.event.get()
+        self._stats["raw"] += len(events)
+
+        motions: list[pygame.event.Event] = [event for event in events
+                                             if event.type == pygame.MOUSEMOTION]
+        if len(motions) > 1:
+            newest: pygame.event.Event = _merge_motions(motions)
+            events = [newest if event is motions[-1] else event for event in events
+                      if event.type != pygame.MOUSEMOTION or event is motions[-1]]
+
+        self._stats["delivered"] += len(events)
+        return events
+
+    def get_stats(self) -> dict[str, int]:
+        """Returns the numbers of raw events taken from pygame and events delivered."""
+        return dict(self._stats)
+
+
+def _merge_motions(motions: list[pygame.event.Event]) -> pygame.event.Event:
+    """Returns the newest motion event with the movement of every given motion event."""
+    newest: pygame.event.Event = motions[-1]
+    rel: tuple[int, int] = (sum(motion.rel[0] for motion in motions),
+                            sum(motion.rel[1] for motion in motions))
+    return pygame.event.Event(pygame.MOUSEMOTION, {**newest.dict, "rel": rel})
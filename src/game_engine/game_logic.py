@@ -1,12 +1,37 @@
+from typing import Callable, Sequence, TYPE_CHECKING
+
 import pygame
 from pygame.sprite import Group
 
-from sprites import Player, Gem, Enemy
-from .game_state import GameState
+from sprites import Player, Gem, Enemy, SpatialHash
+from sprites.spatial_hash import spritecollide
+from utilities.constants import Difficulty
+from utilities.frame_profiler import FrameProfiler, get_profiler
+from .enemy_store import EnemyStore
+from .game_state import DEFAULT_LIVES, GameState
+
+if TYPE_CHECKING:
+    from utilities.config_manager import ConfigSnapshot
 
 type Character = Player | Enemy
 type ProgressionLogic = tuple[tuple[int, int], tuple[int, int], tuple[int, int]]
 
+PROGRESSION_OPTIONS: tuple[ProgressionLogic, ...] = (
+    ((1, 10), (1, 2), (5, 5)),
+    ((2, 6), (2, 3), (4, 4)),
+    ((2, 6), (3, 3), (3, 3)),
+    ((1, 1), (5, 5), (1, 1)),
+    ((2, 6), (2, 3), (4, 4)),
+)
+"""Default progression logic for every difficulty, indexed by the difficulty value.
+
+Each option holds the level thresholds, enemy speeds and gem counts used after
+reaching the first and the second threshold.
+"""
+
+INVULNERABILITY_PERIOD: int = 1000
+"""Milliseconds the player stays invulnerable after being injured or starting a level."""
+
 
 class GameLogic:
     """A class responsible for providing core functionality of gameplay.
@@ -15,12 +40,19 @@ class GameLogic:
         _game_state: Instance of GameState class.
         player: Instance of Player class.
         enemies: pygame sprite group class that contains enemy sprites.
-        _invulnerability_period: Default value for the player invulnerability period.
+        enemy_store: EnemyStore used for moving the enemies or None.
         _invulnerability_period_start: Allows the class to track when the
           invulnerability period starts.
+        _time_source: Function returning elapsed milliseconds, or None for
+          pygame.time.get_ticks.
+        _progression_options: Progression logic for every difficulty, followed by the
+          custom difficulty settings.
+        _default_option_count: Number of progression options before the custom settings.
     """
 
-    def __init__(self, game_state: GameState, custom_settings: ProgressionLogic | None = None):
+    def __init__(self, game_state: GameState, custom_settings: ProgressionLogic | None = None,
+                 time_source: Callable[[], int] | None = None, *,
+                 progression_options: Sequence[ProgressionLogic] = PROGRESSION_OPTIONS):
         """Initialize the game logic.
 
         Initializes the base attributes for the class. Player and Enemy Group
@@ -29,25 +61,53 @@ class GameLogic:
         handling player invulnerability.
         Args:
             game_state: Instance of GameState class.
+            custom_settings: Progression logic used with the custom difficulty.
+            time_source: Function returning elapsed milliseconds. Defaults to
+                pygame.time.get_ticks. A FixedStepClock can be used for simulations.
+            progression_options: Progression logic for every difficulty, indexed by the
+                difficulty value. Defaults to PROGRESSION_OPTIONS.
         """
         self._game_state: GameState = game_state
         self.player: Player = game_state.player
         self.enemies: Group[Enemy] = game_state.enemies
-        self._invulnerability_period: int = 1000
+        self.enemy_store: EnemyStore | None = game_state.enemy_store
         self._invulnerability_period_start: int = 0
-        self._initialize_progression_difficulty_settings(custom_settings)
-
-    def _initialize_progression_difficulty_settings(self, custom_settings: ProgressionLogic | None):
-        self._progression_options: list[ProgressionLogic] = [
-            ((1, 10), (1, 2), (5, 5)),
-            ((2, 6), (2, 3), (4, 4)),
-            ((2, 6), (3, 3), (3, 3)),
-            ((1, 1), (5, 5), (1, 1)),
-            ((2, 6), (2, 3), (4, 4)),
-        ]
+        self._time_source: Callable[[], int] | None = time_source
+        self._initialize_progression_difficulty_settings(custom_settings, progression_options)
+
+    def _get_ticks(self) -> int:
+        """Returns elapsed milliseconds from the time source."""
+        if self._time_source:
+            return self._time_source()
+        return pygame.time.get_ticks()
+
+    def _initialize_progression_difficulty_settings(
+            self, custom_settings: ProgressionLogic | None,
+            progression_options: Sequence[ProgressionLogic]):
+        self._progression_options: list[ProgressionLogic] = list(progression_options)
+        self._default_option_count: int = len(progression_options)
         if custom_settings:
             self._progression_options.append(custom_settings)
 
+    def apply_config(self, config: "ConfigSnapshot"):
+        """Applies changed configuration settings while the game is running.
+
+        The custom difficulty progression logic is replaced right away. The difficulty
+        and the custom difficulty lives are used from the next new game on.
+
+        Args:
+            config: The changed settings.
+        """
+        if config.custom_difficulty_settings:
+            # Options after the default option of every difficulty are custom settings.
+            del self._progression_options[self._default_option_count:]
+            self._progression_options.append(config.custom_difficulty_settings)
+
+        lives: int = DEFAULT_LIVES
+        if config.difficulty == Difficulty.CUSTOM:
+            lives = config.player_lives
+        self._game_state.set_next_game_settings(config.difficulty, lives)
+
     @property
     def game_over(self):
         """This property checks if the current game state indicates that the game is over.
@@ -82,16 +142,32 @@ class GameLogic:
         """Moves all enemies inside the enemies group.
 
         Enemy class is responsible for its own movement logic which this method uses.
+        When an enemy store is in use, every enemy is moved and reflected from the game
+        borders with a single vectorized step instead.
         """
+        if self.enemy_store is not None:
+            self.enemy_store.step(self._game_state.width, self._game_state.height)
+            return
+
         for enemy in self.enemies:
             enemy.move()
 
     def _run_collision_checks(self):
-        """Runs all the collision checks."""
-        self._player_gem_collision(self._game_state.gems)
-        self._player_wall_collision()
-        self._player_enemy_collision()
-        self._enemy_wall_collision()
+        """Runs all the collision checks.
+
+        Enemy wall collisions are skipped when an enemy store is in use, because
+        the store handles them while moving the enemies.
+        """
+        profiler: FrameProfiler = get_profiler()
+        with profiler.phase("logic.collision.gems"):
+            self._player_gem_collision(self._game_state.gems)
+        with profiler.phase("logic.collision.player_wall"):
+            self._player_wall_collision()
+        with profiler.phase("logic.collision.player_enemy"):
+            self._player_enemy_collision()
+        if self.enemy_store is None:
+            with profiler.phase("logic.collision.enemy_wall"):
+                self._enemy_wall_collision()
 
     def detect_border_collision(self, entity: Character) -> bool:
         """Runs detection logic for game border collision.
@@ -113,18 +189,20 @@ class GameLogic:
     def _player_gem_collision(self, gems: Group):
         """Runs a collision detection logic on player and gems.
 
-        Uses pygame.sprite.spritecollide to check whether Player class collides with
-        any gem inside the gem group. Upon collision the gem is remove from the group
-        and from the game. The value of a removed gem is added to game_states points.
+        Uses spritecollide to check whether Player class collides with any gem inside
+        the gem group. Spatial hash groups only test the gems near the player.
+        Upon collision the gem is remove from the group and from the game and released
+        to the gem pool. The value of a removed gem is added to game_states points.
 
         Args:
             gems: Sprite group containing gems.
         """
-        collided_gems: list[Gem] = pygame.sprite.spritecollide(self.player, gems, True)
+        collided_gems: list[Gem] = spritecollide(self.player, gems, True)
 
         if collided_gems:
             for gem in collided_gems:
                 self._game_state.add_points(gem.value)
+            self._game_state.release_gems(collided_gems)
 
     def _player_wall_collision(self):
         """Checks whether player collides with game borders and calls damage handling"""
@@ -133,12 +211,19 @@ class GameLogic:
 
     def _player_enemy_collision(self):
         """Checks whether player collides with enemies and calls damage handling"""
-        if pygame.sprite.spritecollide(self.player, self.enemies, False):
+        if spritecollide(self.player, self.enemies, False):
             self._player_damage_event_handler()
 
     def _enemy_wall_collision(self):
-        """Checks whether enemies collides with game borders and changes their direction"""
-        for enemy in self.enemies:
+        """Checks whether enemies collides with game borders and changes their direction
+
+        Spatial hash groups only give the enemies that are in grid cells near the borders.
+        """
+        enemies: Group | list[Enemy] = self.enemies
+        if isinstance(enemies, SpatialHash):
+            enemies = enemies.border_candidates(self._game_state.width, self._game_state.height)
+
+        for enemy in enemies:
             if self.detect_border_collision(enemy):
                 if enemy.rect.left < 0:
                     enemy.direction_x = 1
@@ -164,12 +249,12 @@ class GameLogic:
     def activate_player_invulnerability(self):
         """Makes player invulnerable to damage and marks the start of the invulnerability.
 
-        After player invulnerability is activated, pygame.time.get_ticks is called to
-        get the elapsed time after pygame has been initiated. The value is saved so it
+        After player invulnerability is activated, the time source is called to
+        get the elapsed time after the game has been initiated. The value is saved so it
         can be used later when game logic updates.
         """
         self.player.vulnerable = False
-        self._invulnerability_period_start = pygame.time.get_ticks()
+        self._invulnerability_period_start = self._get_ticks()
 
     def _progress_to_next_level(self):
         """Manages the progression to the next in the game by evaluating the current game state.
@@ -216,21 +301,41 @@ class GameLogic:
         self._invulnerability_period_start = 0
         self.player = self._game_state.player
         self.enemies = self._game_state.enemies
+        self.enemy_store = self._game_state.enemy_store
 
     def update(self):
         """Activate all the functionality inside this class
 
         Update method meant to be called by the running game loop on every iteration
-        to keep the game logic running.
+        to keep the game logic running. Each step is measured as a sub-phase of the
+        "logic" phase of the frame profiler. The time source is read once and the same
+        frame timestamp is used for the invulnerability period and the animations.
         """
-        self.move_enemies()
+        ticks: int = self._get_ticks()
+        profiler: FrameProfiler = get_profiler()
+        with profiler.phase("logic.movement"):
+            self.move_enemies()
         self._run_collision_checks()
 
-        if not self._game_state.gems:
-            self._progress_to_next_level()
+        with profiler.phase("logic.progression"):
+            if not self._game_state.gems:
+                self._progress_to_next_level()
 
-        elapsed_time: int = pygame.time.get_ticks() - self._invulnerability_period_start
-        if elapsed_time > self._invulnerability_period:
-            self.player.vulnerable = True
+            if ticks - self._invulnerability_period_start > INVULNERABILITY_PERIOD:
+                self.player.vulnerable = True
 
-        self._game_state.sprites.update()
+        with profiler.phase("logic.sprites"):
+            self._update_sprites(ticks)
+
+    def _update_sprites(self, ticks: int):
+        """Updates the sprite animations for the frame.
+
+        Every enemy shows the frame of the shared enemy animation of the game state, which
+        is computed once from the frame timestamp. Gems aren't animated, so only the player
+        is updated separately.
+
+        Args:
+            ticks: Timestamp of the frame in milliseconds.
+        """
+        self._game_state.enemy_animation.animate(ticks)
+        self.player.update()
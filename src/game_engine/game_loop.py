@@ -1,10 +1,19 @@
+from typing import TYPE_CHECKING
+
 import pygame
 
 from ui.renderer import Renderer
+from utilities.frame_profiler import FrameProfiler, get_profiler
 from .clock import Clock
 from .event_queue import EventQueue
 from .game_logic import GameLogic
 
+if TYPE_CHECKING:
+    from utilities.config_manager import ConfigManager
+
+CONFIG_CHECK_INTERVAL: int = 1000
+"""Milliseconds between checks for changes in the configuration file."""
+
 
 class GameLoop:
     """A class responsible for running the game loop.
@@ -15,16 +24,31 @@ class GameLoop:
         self._clock: Instance of the Clock class.
         self._event_queue: Instance of the EventQueue class.
         self._running: Boolean value indicating whether the game loop is running.
+        self._config: ConfigManager whose file is checked for changes, or None.
+        self._config_checked: Time of the previous configuration check in milliseconds.
+        self._profiler: FrameProfiler measuring the phases of every frame.
     """
 
     def __init__(self, game_logic: GameLogic, renderer: Renderer, clock: Clock,
-                 event_queue: EventQueue):
-        """Initialize the game loop"""
+                 event_queue: EventQueue, *, config: "ConfigManager | None" = None,
+                 profiler: FrameProfiler | None = None):
+        """Initialize the game loop
+
+        Args:
+            config: If given, the configuration file is checked for changes once every
+                CONFIG_CHECK_INTERVAL milliseconds, so the subscribers of the
+                ConfigManager can apply changed settings while the game is running.
+            profiler: FrameProfiler measuring the phases of every frame. Defaults to the
+                profiler shared by the whole process.
+        """
         self._game_logic = game_logic
         self._renderer = renderer
         self._clock = clock
         self._event_queue = event_queue
         self._running = True
+        self._config = config
+        self._config_checked = 0
+        self._profiler = profiler or get_profiler()
 
     def run(self):
         """Start the game loop and call update the game on every iteration.
@@ -32,7 +56,7 @@ class GameLoop:
         Checks the pygame event_queue to see if the mouse has been moved and calls game
         logic to move the player when mouse movement is detected. Responsible for
         calling clock ticks and updating the game logic and renderer. breaks the loop
-        on quit event.
+        on quit event. Every iteration is measured as the "frame" phase of the profiler.
         """
 
         self._game_logic.start_new_game()
@@ -41,14 +65,35 @@ class GameLoop:
             if not self._running:
                 break
 
+            with self._profiler.phase("frame"):
+                self._run_frame()
+
+    def _run_frame(self):
+        """Runs a single iteration of the game loop, measuring each of its phases."""
+        profiler: FrameProfiler = self._profiler
+        with profiler.phase("events"):
             self._pygame_event_handler()
+            self._check_config()
 
+        with profiler.phase("render"):
             self._renderer.render()
+        with profiler.phase("tick"):
             self._clock.tick()
 
-            if not self._game_logic.game_over:
+        if not self._game_logic.game_over:
+            with profiler.phase("logic"):
                 self._game_logic.update()
 
+    def _check_config(self):
+        """Reloads the configuration file if it has changed since the previous check."""
+        if self._config is None:
+            return
+
+        now: int = pygame.time.get_ticks()
+        if now - self._config_checked >= CONFIG_CHECK_INTERVAL:
+            self._config_checked = now
+            self._config.reload_if_changed()
+
     def _pygame_event_handler(self):
         """Handles pygame simple pygame events and delegates rest to ui components.
 
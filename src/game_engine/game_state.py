@@ -1,13 +1,35 @@
-from random import randint, choice
+from dataclasses import dataclass, field
+from random import Random
 
 from pygame.sprite import Group
 
-from sprites import Player, Gem
-from sprites.enemy import Enemy
+from sprites import Player, Gem, SpatialHash, SpritePool
+from sprites.enemy import Enemy, EnemyAnimation, EnemyFactory
+from sprites.sprite_pool import POOL_SIZE
 from utilities.constants import Difficulty
+from .enemy_store import EnemyStore
 
 type SpawnableObject = Gem | Enemy
 
+DEFAULT_LIVES: int = 10
+"""Initial lives before they are divided by the difficulty."""
+
+
+@dataclass(frozen=True)
+class SpawnSettings:
+    """Settings of how a GameState creates and moves gems and enemies.
+
+    Attributes:
+        vectorized_enemies: If True enemies are moved by an EnemyStore. Requires NumPy.
+        rng: Random number generator used for spawn points and enemy directions. Pass a
+            seeded generator for reproducible games.
+        pool_size: Number of collected gems and removed enemies kept for reuse in their
+            pools. 0 creates a new sprite every time.
+    """
+    vectorized_enemies: bool = False
+    rng: Random = field(default_factory=Random)
+    pool_size: int = POOL_SIZE
+
 
 class GameState:
     """A class responsible for keeping and updating game state information.
@@ -19,15 +41,21 @@ class GameState:
 
     Attributes:
         _state_variables: Maintains internal state variables like
-            lives, difficulty, height, width, points, and level.
+            lives, difficulty, height, width, points and level, and the difficulty and
+            lives of the next game once they have been set.
         player: Instance of Player class.
-        gems: pygame sprite group class that contains gem sprites.
-        enemies: pygame sprite group class that contains enemy sprites.
+        gems: Spatial hash sprite group that contains gem sprites.
+        enemies: Spatial hash sprite group that contains enemy sprites.
         sprites: pygame sprite group class that contains all game sprites.
+        enemy_store: EnemyStore that moves the enemies with vectorized NumPy operations
+            or None when vectorized enemies are not in use.
+        _spawn_settings: SpawnSettings used for creating and moving gems and enemies.
+        _pools: Dictionary holding the SpritePools gems and enemies are reused from. The
+            enemies are created by an EnemyFactory holding their shared animation.
     """
 
     def __init__(self, width: int, height: int, difficulty: int = Difficulty.MEDIUM,
-                 lives: int = 10):
+                 lives: int = DEFAULT_LIVES, spawn_settings: SpawnSettings | None = None):
         """Initialize the game state.
 
         Keeps track of the game width and height variables. Initializes the sprites
@@ -39,6 +67,8 @@ class GameState:
             height: The height of the game window.
             difficulty: Difficulty level of the game.
             lives: Number of lives the player has initially.
+            spawn_settings: Settings for creating and moving gems and enemies. Defaults
+                to SpawnSettings().
         """
         self._state_variables: dict[str, int] = {
             "initial_lives": lives,
@@ -46,6 +76,13 @@ class GameState:
             "height": height,
             "width": width,
         }
+        self._spawn_settings: SpawnSettings = spawn_settings or SpawnSettings()
+        pool_size: int = self._spawn_settings.pool_size
+        self._pools: dict[str, SpritePool] = {
+            "gems": SpritePool(Gem, pool_size),
+            "enemies": SpritePool(EnemyFactory(), pool_size),
+        }
+
         self._initialize_gameplay_variables()
 
     def _initialize_gameplay_variables(self):
@@ -54,6 +91,9 @@ class GameState:
         Helper function for initializing game objects. Seperated into its own method
         so it can be called when resetting the game state.
         """
+        if "next_difficulty" in self._state_variables:
+            self._state_variables["difficulty"] = self._state_variables.pop("next_difficulty")
+            self._state_variables["initial_lives"] = self._state_variables.pop("next_lives")
 
         lives: int = self._state_variables["initial_lives"]
 
@@ -61,14 +101,24 @@ class GameState:
             lives = lives // (self.difficulty + 1)
 
         self.player: Player = Player(player_lives=lives)
-        self.gems: Group = Group()
-        self.enemies: Group = Group()
+        self.gems: SpatialHash = SpatialHash()
+        self.enemies: SpatialHash = SpatialHash()
         self.sprites: Group = Group()
+        self.enemy_store: EnemyStore | None = (
+            EnemyStore() if self._spawn_settings.vectorized_enemies else None)
         self._state_variables["points"] = 0
         self._state_variables["level"] = 1
 
         self.sprites.add(self.player)
 
+    @property
+    def enemy_animation(self) -> EnemyAnimation:
+        """EnemyAnimation shared by every enemy of the game state.
+
+        It outlives resets, because the pooled enemies are reused by the next game.
+        """
+        return self._pools["enemies"].factory.animation
+
     @property
     def width(self):
         return self._state_variables["width"]
@@ -137,25 +187,32 @@ class GameState:
         """
         end_x: int = game_object.rect.width
         end_y: int = game_object.rect.height
-        x: int = randint(1, self.width - end_x)
-        y: int = randint(1, self.height - end_y)
+        x: int = self._spawn_settings.rng.randint(1, self.width - end_x)
+        y: int = self._spawn_settings.rng.randint(1, self.height - end_y)
 
         return x, y
 
     def spawn_enemy(self, speed: int = 1):
         """Spawn an enemy into the game.
 
-        Creates an Enemy with a random movement direction and default speed of 1.
-        Adds the created Enemy to enemies and sprites groups.
+        Takes an Enemy from the enemy pool and gives it a random movement direction and
+        default speed of 1. Adds the Enemy to enemies and sprites groups and to the
+        enemy store when vectorized enemies are in use.
 
         Args:
             speed:
         """
-        direction: tuple[int, int] = choice(((1, 1), (-1, 1), (1, -1), (-1, -1)))
+        direction: tuple[int, int] = self._spawn_settings.rng.choice(
+            ((1, 1), (-1, 1), (1, -1), (-1, -1)))
 
-        enemy: Enemy = Enemy(direction=direction, speed=speed)
+        enemy: Enemy = self._pools["enemies"].acquire()
+        enemy.direction_x, enemy.direction_y = direction
+        enemy.speed = speed
         self._add_game_object_to_group(enemy, self.enemies)
 
+        if self.enemy_store is not None:
+            self.enemy_store.add(enemy)
+
         self.sprites.add(enemy)
 
     def spawn_multiple_enemies(self, enemy_count: int, enemy_speed: int):
@@ -176,7 +233,8 @@ class GameState:
 
         Takes the game object sprite given as the parameter and places them on a random
         coordinate value on the map. After object is placed it is added to the group
-        that was given as parameter.
+        that was given as parameter. Spatial hash groups hash the object on addition,
+        so it has to be placed before it is added.
 
         Args:
             game_object: Gem or Enemy sprite object.
@@ -187,20 +245,61 @@ class GameState:
         group.add(game_object)
 
     def reset_game_state(self):
+        """Resets the game state for a new game.
+
+        Gems and enemies of the previous game are released to their pools before the
+        sprite groups are created again.
+        """
+        for gem in self.gems.sprites():
+            self._pools["gems"].release(gem)
+        for enemy in self.enemies.sprites():
+            enemy.unbind()
+            self._pools["enemies"].release(enemy)
+
         self._initialize_gameplay_variables()
 
+    def release_gems(self, gems: list[Gem]):
+        """Releases collected gems to the gem pool so later levels can reuse them.
+
+        Args:
+            gems: Gems that were removed from the game.
+        """
+        for gem in gems:
+            self._pools["gems"].release(gem)
+
+    def get_pool_stats(self) -> dict[str, dict[str, int]]:
+        """Returns the reuse statistics of the gem and enemy pools.
+
+        Returns:
+            Dictionary mapping "gems" and "enemies" to the statistics of their pools.
+        """
+        return {name: pool.get_stats() for name, pool in self._pools.items()}
+
+    def set_next_game_settings(self, difficulty: int, lives: int):
+        """Sets the difficulty and initial lives used from the next game on.
+
+        The current game keeps its settings, so points already earned keep the point
+        multiplier of the difficulty they were earned with.
+
+        Args:
+            difficulty: Difficulty level of the next game.
+            lives: Number of lives the player has initially in the next game.
+        """
+        self._state_variables["next_difficulty"] = difficulty
+        self._state_variables["next_lives"] = lives
+
     def populate_level_with_gems(self, amount: int = 1):
         """Populate the level with the given amount of gems.
 
-        creates the specified amount of gems and adds them to the game state.
-        uses add_game_object_to_group method. which generates a random coordinates
+        takes the specified amount of gems from the gem pool and adds them to the game
+        state. uses add_game_object_to_group method. which generates a random coordinates
         for every object it adds to the game state.
 
         Args:
             amount: The number of gems to add.
         """
         for _ in range(amount):
-            gem: Gem = Gem()
+            gem: Gem = self._pools["gems"].acquire()
             self._add_game_object_to_group(gem, self.gems)
 
         self.sprites.add(self.gems)
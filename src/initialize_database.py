@@ -1,45 +1,49 @@
+import sqlite3
+import sys
 from typing import TYPE_CHECKING
 
 from database.database_connection import get_database_connection
+from database.migrations import migrate
 
 if TYPE_CHECKING:
     from sqlite3 import Connection
 
 
 def _drop_tables(connection: "Connection"):
+    connection.execute("DROP TABLE IF EXISTS period_tops;")
+    connection.execute("DROP TABLE IF EXISTS player_bests;")
     connection.execute("DROP TABLE IF EXISTS scores;")
     connection.execute("DROP TABLE IF EXISTS players;")
+    connection.execute("PRAGMA user_version = 0;")
     connection.commit()
 
 
-def _create_tables(connection: "Connection") -> None:
-    players: str = """
-    CREATE TABLE  players (
-        id INTEGER PRIMARY KEY,
-        name TEXT NOT NULL UNIQUE
-    );
-    """
+def create_schema(connection: "Connection") -> None:
+    """Creates the tables, indexes and triggers of the score database.
 
-    scores: str = """
-    CREATE TABLE  scores (
-        id INTEGER PRIMARY KEY,
-        player_id INTEGER NOT NULL REFERENCES players,
-        level INTEGER NOT NULL,
-        points INTEGER NOT NULL,
-        time DATETIME 
-    );
-    """
+    The schema is created by running every migration, so a new database is identical to
+    a migrated one.
 
-    connection.execute(players)
-    connection.execute(scores)
-    connection.commit()
+    Raises:
+        sqlite3.Error: If a migration failed. The database is left unchanged.
+    """
+    if not migrate(connection, verbose=False):
+        raise sqlite3.Error("Could not create the score database schema")
 
 
 def initialize_database():
+    """Wipes the score database and creates an empty one.
+
+    Existing databases are migrated when the game starts, so this is only needed for
+    clearing every score.
+    """
     connection: Connection = get_database_connection()
 
     _drop_tables(connection)
-    _create_tables(connection)
+    try:
+        create_schema(connection)
+    except sqlite3.Error:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,7 @@
 import os
 import sys
+import time
+from pathlib import Path
 from sqlite3 import Connection
 
 os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "hide"
@@ -14,11 +16,17 @@ os.environ["SDL_AUDIODRIVER"] = "dsp"
 import pygame
 
 from database.database_connection import get_database_connection
+from database.migrations import migrate
 from database.score_service import ScoreService
-from game_engine import Clock, EventQueue, GameLogic, GameLoop, GameState
+from database.score_writer import ScoreWriter
+from game_engine import Clock, EventQueue, GameLogic, GameLoop, GameState, SpawnSettings
+from game_engine.event_queue import HANDLED_EVENT_TYPES
 from ui.renderer import Renderer
 from ui.ui_manager import UIManager
-from utilities.config_manager import ConfigManager
+from utilities.chrome_trace import ChromeTraceWriter, trace_requested
+from utilities.config_manager import ConfigManager, ConfigSnapshot, get_config_manager
+from utilities.constants import Folder
+from utilities.frame_profiler import FrameProfiler, get_profiler
 from utilities.score_manager import ScoreManager
 
 # pylint: enable=wrong-import-position
@@ -28,13 +36,15 @@ type Components = tuple[GameLogic, Renderer, Clock, EventQueue]
 
 
 # Docstrings in this module were written with the help of AI generation.
-def init(config: ConfigManager, connection: Connection) -> GameLoop:
+def init(config: ConfigManager, connection: Connection, score_writer: ScoreWriter) -> GameLoop:
     """ Basic setup for pygame. GameLoop components are initialized in the
     _initialize_loop_components function.
 
     Args:
         config: Configuration manager instance passed to _initialize_loop_components.
+            The clock and the game logic subscribe to its changes.
         connection: Connection instance for database operations.
+        score_writer: Writer saving new scores in the background.
 
     Returns:
         GameLoop: A fully initialized game loop ready to be executed.
@@ -43,20 +53,25 @@ def init(config: ConfigManager, connection: Connection) -> GameLoop:
     pygame.display.set_caption("Gem Poacher")
     pygame.font.init()
 
-    components: tuple = _initialize_loop_components(config, connection)
+    components: tuple = _initialize_loop_components(config, connection, score_writer)
     pygame.mouse.set_visible(False)
 
-    game_loop: GameLoop = GameLoop(*components)
+    game_logic, _, clock, _ = components
+    config.subscribe(clock.apply_config)
+    config.subscribe(game_logic.apply_config)
+    game_loop: GameLoop = GameLoop(*components, config=config)
 
     pygame.init()
     return game_loop
 
 
-def _initialize_loop_components(config: ConfigManager, connection: Connection) -> Components:
+def _initialize_loop_components(config: ConfigManager, connection: Connection,
+                                score_writer: ScoreWriter) -> Components:
     """ Initializes and returns essential components required for the game loop.
 
     This function prepares and configures the game state, game logic, score manager, UI manager,
-    renderer, clock, and event queue based on the provided configuration and connection. If the
+    renderer, clock, and event queue based on the provided configuration and connection. The
+    window size and the framerate are read from the configuration. If the
     difficulty setting is custom, additional properties such as custom difficulty settings and
     player lives are retrieved and used.
 
@@ -64,39 +79,104 @@ def _initialize_loop_components(config: ConfigManager, connection: Connection) -
         config: The configuration manager instance that provides game settings such as difficulty,
             custom difficulty settings, and player lives.
         connection: Connection instance for database operations.
+        score_writer: Writer saving new scores in the background.
 
     Returns:
         tuple: A tuple containing initialized instances of the game logic, renderer, clock,
             and event queue for the game.
     """
-    width: int = 1280
-    height: int = 720
-    display: pygame.Surface = pygame.display.set_mode((width, height))
+    settings: ConfigSnapshot = config.get_snapshot()
+    display: pygame.Surface = pygame.display.set_mode((settings.width, settings.height))
 
+    game_state, game_logic = _initialize_game(config, settings.width, settings.height)
+
+    scores: ScoreManager = ScoreManager(ScoreService(connection), score_writer,
+                                        get_database_connection)
+    ui_manager: UIManager = UIManager(game_state, scores, config.get_glyph_atlas_text())
+
+    renderer: Renderer = Renderer(display, ui_manager,
+                                  dirty_rects=config.get_dirty_rect_rendering())
+
+    clock: Clock = Clock(settings.fps, adaptive=config.get_adaptive_frame_pacing())
+    event_queue = EventQueue(HANDLED_EVENT_TYPES)
+
+    return game_logic, renderer, clock, event_queue
+
+
+def _initialize_game(config: ConfigManager, width: int, height: int) -> tuple[GameState, GameLogic]:
+    """ Initializes the game state and game logic based on the difficulty settings.
+
+    If the difficulty setting is custom, custom difficulty settings and player lives
+    are retrieved from the config and used.
+
+    Args:
+        config: The configuration manager instance that provides the game settings.
+        width: The width of the game area.
+        height: The height of the game area.
+
+    Returns:
+        tuple: A tuple containing the game state and the game logic.
+    """
     difficulty: int = config.get_difficulty()
+    spawn_settings: SpawnSettings = SpawnSettings(
+        vectorized_enemies=config.get_vectorized_enemies())
 
     if difficulty == -1:
         custom_settings = config.get_custom_difficulty_settings()
         player_lives = config.get_player_lives()
-        game_state: GameState = GameState(width, height, difficulty, player_lives)
+        game_state: GameState = GameState(width, height, difficulty, player_lives,
+                                          spawn_settings)
         game_logic: GameLogic = GameLogic(game_state, custom_settings)
     else:
-        game_state: GameState = GameState(width, height, difficulty)
+        game_state: GameState = GameState(width, height, difficulty,
+                                          spawn_settings=spawn_settings)
         game_logic: GameLogic = GameLogic(game_state)
 
-    scores: ScoreManager = ScoreManager(ScoreService(connection))
-    ui_manager: UIManager = UIManager(game_state, scores)
+    return game_state, game_logic
 
-    renderer: Renderer = Renderer(display, ui_manager)
 
-    clock: Clock = Clock()
-    event_queue = EventQueue()
+def write_frame_profile(profiler: FrameProfiler):
+    """Writes the frame phase summary of the profiler to the profiles folder.
+
+    Nothing is written if no phases were measured during the game.
+    """
+    if not profiler.has_samples():
+        return
+
+    path: Path = Path(Folder.PROFILE_DIR) / f"frame_profile_{time.strftime('%Y%m%d_%H%M%S')}.json"
+    if profiler.dump(path):
+        print(f"Frame profile written to {path}")
 
-    return game_logic, renderer, clock, event_queue
 
+def start_trace(config: ConfigManager, profiler: FrameProfiler) -> ChromeTraceWriter | None:
+    """Starts streaming the measured phases to a Chrome trace file if tracing is enabled.
 
-def stop(connection: Connection):
-    """Exits the game application cleanly."""
+    Tracing is enabled with the "chrome trace" setting or the GEM_POACHER_TRACE
+    environment variable. The profiler is enabled for the whole session while tracing.
+
+    Returns:
+        The trace writer, or None if tracing isn't enabled.
+    """
+    if not (config.get_chrome_trace() or trace_requested()):
+        return None
+
+    path: Path = Path(Folder.PROFILE_DIR) / f"trace_{time.strftime('%Y%m%d_%H%M%S')}.json"
+    tracer: ChromeTraceWriter = ChromeTraceWriter(path)
+    profiler.enabled = True
+    profiler.add_listener(tracer.add_span)
+    return tracer
+
+
+def stop(connection: Connection, score_writer: ScoreWriter,
+         tracer: ChromeTraceWriter | None = None):
+    """Exits the game application cleanly.
+
+    Scores still waiting in the score writer are written before the database
+    connection and the trace file are closed.
+    """
+    score_writer.close()
+    if tracer is not None and tracer.close():
+        print(f"Trace written to {tracer.path}")
     connection.close()
     pygame.quit()
     sys.exit()
@@ -104,12 +184,20 @@ def stop(connection: Connection):
 
 def run():
     """Main entry point for the game application."""
-    config: ConfigManager = ConfigManager()
+    config: ConfigManager = get_config_manager()
     config.create_config()
+    get_profiler().enabled = config.get_frame_profiler()
     connection: Connection = get_database_connection()
-    loop: GameLoop = init(config, connection)
+    if not migrate(connection):
+        connection.close()
+        sys.exit(1)
+
+    tracer: ChromeTraceWriter | None = start_trace(config, get_profiler())
+    score_writer: ScoreWriter = ScoreWriter(get_database_connection)
+    loop: GameLoop = init(config, connection, score_writer)
     loop.run()
-    stop(connection)
+    write_frame_profile(get_profiler())
+    stop(connection, score_writer, tracer)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,35 @@
+import argparse
+
+from simulation import init_headless_pygame
+from simulation.headless_runner import create_simulation, SimulationResult
+from utilities.constants import Difficulty
+
+
+def _parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run a headless, deterministic game simulation.")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the random generator")
+    parser.add_argument("--difficulty", default="MEDIUM",
+                        choices=[difficulty.name for difficulty in Difficulty
+                                 if difficulty != Difficulty.CUSTOM])
+    parser.add_argument("--fps", type=int, default=120, help="simulated frames per second")
+    parser.add_argument("--ticks", type=int, default=120 * 60 * 10,
+                        help="maximum number of simulated ticks")
+    return parser.parse_args()
+
+
+def simulate():
+    arguments: argparse.Namespace = _parse_arguments()
+    init_headless_pygame()
+
+    runner = create_simulation(seed=arguments.seed, fps=arguments.fps,
+                               difficulty=Difficulty[arguments.difficulty])
+    result: SimulationResult = runner.run(arguments.ticks)
+
+    print(f"Simulated {result.ticks} ticks ({result.simulated_ms / 1000:.1f} s of game time) "
+          f"in {result.wall_seconds:.2f} s")
+    print(f"Level: {result.level}, points: {result.points}, game over: {result.game_over}")
+    print(f"Ticks per second: {result.ticks_per_second:.0f}")
+
+
+if __name__ == "__main__":
+    simulate()
@@ -0,0 +1,20 @@
+import os
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "hide")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# pylint: disable=wrong-import-position
+import pygame
+# pylint: enable=wrong-import-position
+
+
+def init_headless_pygame():
+    """Initializes pygame without opening a window.
+
+    A tiny display surface is still created with the dummy video driver so images can be
+    converted while sprites are created.
+    """
+    pygame.display.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((1, 1))
@@ -0,0 +1,136 @@
+import math
+from abc import ABC, abstractmethod
+from random import Random
+from typing import Callable
+
+from game_engine import GameState
+
+type Position = tuple[int, int]
+type BotFactory = Callable[[int], "Bot"]
+
+
+class Bot(ABC):
+    """Base class for scripted players used as controllers of a HeadlessRunner.
+
+    A bot is called on every simulated tick with the game state and returns the position
+    the player moves to. Movement is limited to a maximum distance per tick, so the bots
+    can't teleport the way the mouse controlled player can. The target position is kept
+    inside the game borders so the bots don't get injured by walking into them.
+
+    Attributes:
+        _speed: Maximum distance the player moves per tick in pixels.
+        _rng: Random number generator used by the bot.
+    """
+
+    def __init__(self, seed: int, speed: int = 6):
+        """Initializes the bot.
+
+        Args:
+            seed: Seed for the random number generator of the bot.
+            speed: Maximum distance the player moves per tick in pixels.
+        """
+        self._speed: int = speed
+        self._rng: Random = Random(seed)
+
+    def __call__(self, game_state: GameState) -> Position | None:
+        target: Position | None = self.choose_target(game_state)
+        if target is None:
+            return None
+        return self._step_towards(game_state, target)
+
+    @abstractmethod
+    def choose_target(self, game_state: GameState) -> Position | None:
+        """Returns the position the bot wants to move towards, or None to stay still.
+
+        Args:
+            game_state: The game state of the simulated game.
+        """
+
+    def _step_towards(self, game_state: GameState, target: Position) -> Position:
+        """Returns the next position on the way to the target limited by the bot speed."""
+        x, y = game_state.player.rect.center
+        distance_x: int = target[0] - x
+        distance_y: int = target[1] - y
+        distance: float = math.hypot(distance_x, distance_y)
+        if distance > self._speed:
+            distance_x = round(distance_x / distance * self._speed)
+            distance_y = round(distance_y / distance * self._speed)
+
+        return self._clamp(game_state, (x + distance_x, y + distance_y))
+
+    @staticmethod
+    def _clamp(game_state: GameState, position: Position) -> Position:
+        """Keeps the player rect inside the game borders when moved to the position."""
+        half_width: int = game_state.player.rect.width // 2 + 1
+        half_height: int = game_state.player.rect.height // 2 + 1
+        return (min(max(position[0], half_width), game_state.width - half_width),
+                min(max(position[1], half_height), game_state.height - half_height))
+
+
+class GemChaserBot(Bot):
+    """Bot that runs straight for the closest gem and ignores the enemies."""
+
+    def choose_target(self, game_state: GameState) -> Position | None:
+        x, y = game_state.player.rect.center
+        targets: list[Position] = [gem.rect.center for gem in game_state.gems]
+        if not targets:
+            return None
+        return min(targets, key=lambda center: (center[0] - x) ** 2 + (center[1] - y) ** 2)
+
+
+class CautiousBot(GemChaserBot):
+    """Bot that chases the closest gem but steps away from enemies that come too close.
+
+    Attributes:
+        _danger_radius: Distance in pixels at which the bot starts avoiding an enemy.
+    """
+
+    def __init__(self, seed: int, speed: int = 6, danger_radius: int = 120):
+        """Initializes the bot.
+
+        Args:
+            seed: Seed for the random number generator of the bot.
+            speed: Maximum distance the player moves per tick in pixels.
+            danger_radius: Distance in pixels at which the bot starts avoiding an enemy.
+        """
+        super().__init__(seed, speed)
+        self._danger_radius: int = danger_radius
+
+    def choose_target(self, game_state: GameState) -> Position | None:
+        x, y = game_state.player.rect.center
+        push_x: float = 0.0
+        push_y: float = 0.0
+        for enemy in game_state.enemies:
+            distance_x: int = x - enemy.rect.centerx
+            distance_y: int = y - enemy.rect.centery
+            distance: float = math.hypot(distance_x, distance_y)
+            if 0 < distance < self._danger_radius:
+                weight: float = (self._danger_radius - distance) / distance
+                push_x += distance_x * weight
+                push_y += distance_y * weight
+
+        if push_x or push_y:
+            return round(x + push_x), round(y + push_y)
+        return super().choose_target(game_state)
+
+
+class RandomWalkBot(Bot):
+    """Bot that wanders towards random points of the game area."""
+
+    def __init__(self, seed: int, speed: int = 6):
+        super().__init__(seed, speed)
+        self._target: Position | None = None
+
+    def choose_target(self, game_state: GameState) -> Position | None:
+        if self._target is None or self._target == game_state.player.rect.center:
+            self._target = self._clamp(game_state, (self._rng.randrange(game_state.width),
+                                                    self._rng.randrange(game_state.height)))
+        return self._target
+
+
+BOTS: dict[str, BotFactory] = {
+    "chaser": GemChaserBot,
+    "cautious": CautiousBot,
+    "random": RandomWalkBot,
+}
+"""Scripted bots available for simulations by name."""
@@ -0,0 +1,213 @@
+import statistics
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from typing import Sequence
+
+from game_engine.game_logic import PROGRESSION_OPTIONS, ProgressionLogic
+from utilities.constants import Difficulty
+from . import init_headless_pygame
+from .bots import BOTS, Bot
+from .headless_runner import create_simulation, SimulationResult
+
+type GameOutcome = tuple[int, int, int, bool]
+type Job = tuple[int, ProgressionLogic, int, str, range, int, int]
+
+
+def play_games(progression_logic: ProgressionLogic, difficulty: int, bot_name: str,
+               seeds: range, *, max_ticks: int, fps: int) -> list[GameOutcome]:
+    """Plays a batch of headless games with the given progression logic.
+
+    Runs in the worker processes of the tuner, so it only takes and returns picklable
+    values. The progression logic replaces the default progression logic of the given
+    difficulty, so the lives and point multiplier of the difficulty stay the same.
+
+    Args:
+        progression_logic: The progression logic that is tested.
+        difficulty: The difficulty whose progression logic is replaced.
+        bot_name: Name of the bot in BOTS that plays the games.
+        seeds: Seeds of the games. Each seed gives one game.
+        max_ticks: Maximum number of ticks a single game is simulated for.
+        fps: Simulated frames per second.
+
+    Returns:
+        List of (level, points, time in milliseconds, died) tuples, one for each game.
+    """
+    progression_options: list[ProgressionLogic] = list(PROGRESSION_OPTIONS)
+    progression_options[difficulty] = progression_logic
+
+    outcomes: list[GameOutcome] = []
+    for seed in seeds:
+        bot: Bot = BOTS[bot_name](seed)
+        result: SimulationResult = create_simulation(
+            seed=seed, difficulty=difficulty, fps=fps, controller=bot,
+            progression_options=progression_options).run(max_ticks)
+        outcomes.append((result.level, result.points, result.simulated_ms, result.game_over))
+
+    return outcomes
+
+
+def _run_job(job: Job) -> tuple[int, list[GameOutcome]]:
+    candidate_index, progression_logic, difficulty, bot_name, seeds, max_ticks, fps = job
+    return candidate_index, play_games(progression_logic, difficulty, bot_name, seeds,
+                                       max_ticks=max_ticks, fps=fps)
+
+
+def summarize(values: Sequence[float]) -> dict[str, float]:
+    """Returns the mean, the 10th percentile, the median and the 90th percentile of the values.
+
+    Args:
+        values: At least one value.
+    """
+    if len(values) == 1:
+        value: float = float(values[0])
+        return {"mean": value, "p10": value, "median": value, "p90": value}
+
+    deciles: list[float] = statistics.quantiles(values, n=10, method="inclusive")
+    return {"mean": statistics.fmean(values), "p10": deciles[0],
+            "median": statistics.median(values), "p90": deciles[-1]}
+
+
+class CandidateReport:
+    """Distributions collected from the games played with a single progression logic.
+
+    Attributes:
+        progression_logic: The tested progression logic.
+        levels: Levels reached in every game.
+        points: Points collected in every game.
+        times: Game time in seconds each game lasted. Games that were stopped before game
+            over count with the time they lasted.
+        deaths: Number of games that ended in game over.
+        score: Distance of the median time-to-death from the target relative to the target.
+            Lower is better.
+    """
+
+    def __init__(self, progression_logic: ProgressionLogic):
+        self.progression_logic: ProgressionLogic = progression_logic
+        self.levels: list[int] = []
+        self.points: list[int] = []
+        self.times: list[float] = []
+        self.deaths: int = 0
+        self.score: float = 0.0
+
+    def add(self, outcomes: list[GameOutcome]):
+        """Adds the outcomes of played games to the distributions."""
+        for level, points, milliseconds, died in outcomes:
+            self.levels.append(level)
+            self.points.append(points)
+            self.times.append(milliseconds / 1000)
+            self.deaths += died
+
+    @property
+    def games(self) -> int:
+        return len(self.times)
+
+    def rate(self, target_seconds: float):
+        """Scores the candidate by how close its median time-to-death is to the target."""
+        self.score = abs(statistics.median(self.times) - target_seconds) / target_seconds
+
+
+class DifficultyTuner:
+    """Monte Carlo tuner for the progression logic tables used by GameLogic.
+
+    Plays a number of headless games with scripted bots for every candidate
+    progression logic in a process pool, collects the level, points and time-to-death
+    distributions of the games and ranks the candidates by how close their median
+    time-to-death is to the target. Every candidate is played with the same seeds so
+    the candidates are compared over the same spawn positions.
+
+    Attributes:
+        _candidates: The progression logic tables to be tested.
+        _settings: Dictionary holding the difficulty, bot names, number of games per bot,
+            maximum ticks per game, simulated fps, first seed and number of worker processes.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, candidates: Sequence[ProgressionLogic], *,
+                 difficulty: int = Difficulty.MEDIUM, bots: Sequence[str] = tuple(BOTS),
+                 games: int = 200, max_ticks: int = 120 * 60 * 5, fps: int = 120, seed: int = 0,
+                 workers: int | None = None):
+        """Initializes the tuner.
+
+        Args:
+            candidates: The progression logic tables to be tested.
+            difficulty: The difficulty whose lives and point multiplier are used.
+            bots: Names of the bots in BOTS that play the games.
+            games: Number of games played by each bot with each candidate.
+            max_ticks: Maximum number of ticks a single game is simulated for.
+            fps: Simulated frames per second.
+            seed: Seed of the first game. The following games use consecutive seeds.
+            workers: Number of worker processes. Defaults to the number of CPUs.
+        """
+        self._candidates: list[ProgressionLogic] = list(candidates)
+        self._settings: dict = {
+            "difficulty": difficulty,
+            "bots": list(bots),
+            "games": games,
+            "max_ticks": max_ticks,
+            "fps": fps,
+            "seed": seed,
+            "workers": workers,
+        }
+
+    def _jobs(self, batch_size: int) -> list[Job]:
+        """Splits the games into batches played by the worker processes."""
+        settings: dict = self._settings
+        first_seed: int = settings["seed"]
+        last_seed: int = first_seed + settings["games"]
+        jobs: list[Job] = []
+
+        for index, candidate in enumerate(self._candidates):
+            for bot_name in settings["bots"]:
+                for start in range(first_seed, last_seed, batch_size):
+                    seeds: range = range(start, min(start + batch_size, last_seed))
+                    jobs.append((index, candidate, settings["difficulty"], bot_name, seeds,
+                                 settings["max_ticks"], settings["fps"]))
+        return jobs
+
+    def run(self, target_seconds: float, batch_size: int = 10) -> list[CandidateReport]:
+        """Plays the games and ranks the candidates.
+
+        Args:
+            target_seconds: The wanted median time-to-death in seconds.
+            batch_size: Number of games played in a single job of a worker process.
+
+        Returns:
+            Reports of the candidates, the best candidate first.
+        """
+        reports: list[CandidateReport] = [CandidateReport(candidate)
+                                          for candidate in self._candidates]
+        jobs: list[Job] = self._jobs(batch_size)
+
+        with ProcessPoolExecutor(self._settings["workers"],
+                                 initializer=init_headless_pygame) as executor:
+            futures: list[Future] = [executor.submit(_run_job, job) for job in jobs]
+            for finished, future in enumerate(as_completed(futures), start=1):
+                candidate_index, outcomes = future.result()
+                reports[candidate_index].add(outcomes)
+                print(f"\rPlayed {finished}/{len(jobs)} batches", end="", flush=True)
+        print()
+
+        for report in reports:
+            report.rate(target_seconds)
+        return sorted(reports, key=lambda report: report.score)
+
+
+def format_report(reports: list[CandidateReport], target_seconds: float) -> str:
+    """Formats ranked candidate reports into a readable text report.
+
+    Args:
+        reports: Ranked reports returned by DifficultyTuner.run.
+        target_seconds: The target median time-to-death the candidates were ranked by.
+
+    Returns:
+        The report as a string.
+    """
+    lines: list[str] = [f"Target median time-to-death: {target_seconds:.0f} s", ""]
+    for rank, report in enumerate(reports, start=1):
+        lines.append(f"#{rank} {report.progression_logic}  score {report.score:.3f}  "
+                     f"games {report.games}  game overs {report.deaths / report.games:.0%}")
+        for label, values in (("level", report.levels), ("points", report.points),
+                              ("time-to-death (s)", report.times)):
+            summary: dict[str, float] = summarize(values)
+            lines.append(f"    {label:<18} mean {summary['mean']:9.1f}  p10 {summary['p10']:9.1f}"
+                         f"  median {summary['median']:9.1f}  p90 {summary['p90']:9.1f}")
+    return "\n".join(lines)
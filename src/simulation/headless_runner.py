@@ -0,0 +1,164 @@
+import time
+from random import Random
+from typing import Callable, Sequence
+
+from game_engine import FixedStepClock, GameLogic, GameState, SpawnSettings
+from game_engine.game_logic import PROGRESSION_OPTIONS, ProgressionLogic
+from utilities.constants import Difficulty
+
+type PlayerController = Callable[[GameState], tuple[int, int] | None]
+
+
+class SimulationResult:
+    """Results of a single headless simulation run.
+
+    Attributes:
+        ticks: Number of fixed timesteps simulated.
+        simulated_ms: Simulated game time in milliseconds.
+        wall_seconds: Real time the simulation took in seconds.
+        level: Level reached by the player.
+        points: Points collected by the player.
+        game_over: True if the player lost all lives before the simulation was stopped.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, ticks: int, simulated_ms: int, wall_seconds: float, *, level: int,
+                 points: int, game_over: bool):
+        self.ticks: int = ticks
+        self.simulated_ms: int = simulated_ms
+        self.wall_seconds: float = wall_seconds
+        self.level: int = level
+        self.points: int = points
+        self.game_over: bool = game_over
+
+    @property
+    def ticks_per_second(self) -> float:
+        """Simulated ticks per real second."""
+        if self.wall_seconds <= 0:
+            return float("inf")
+        return self.ticks / self.wall_seconds
+
+    def __repr__(self) -> str:
+        return (f"SimulationResult(ticks={self.ticks}, simulated_ms={self.simulated_ms}, "
+                f"level={self.level}, points={self.points}, game_over={self.game_over})")
+
+
+class HeadlessRunner:
+    """Runs GameLogic at a fixed timestep without a display as fast as the CPU allows.
+
+    Game time comes from a FixedStepClock, which has to be the time source of the game
+    state and game logic for the simulation to be deterministic. Player input comes from
+    an optional controller function that is called on every tick with the game state and
+    returns the position the player moves to, or None if the player stays still.
+
+    Attributes:
+        _game_logic: Instance of the GameLogic class.
+        _game_state: Instance of the GameState class.
+        _clock: FixedStepClock that advances the simulated time.
+        _controller: Function deciding where the player moves on each tick.
+        _counter: Dictionary holding the ticks counted during the current second and
+            the latest ticks per second value.
+    """
+
+    def __init__(self, game_state: GameState, game_logic: GameLogic, clock: FixedStepClock,
+                 controller: PlayerController | None = None):
+        """Initializes the runner.
+
+        Args:
+            game_state: The game state used by the game logic.
+            game_logic: The game logic to be stepped.
+            clock: The clock used as the time source of the game state and game logic.
+            controller: Function deciding where the player moves on each tick.
+        """
+        self._game_state: GameState = game_state
+        self._game_logic: GameLogic = game_logic
+        self._clock: FixedStepClock = clock
+        self._controller: PlayerController | None = controller
+        self._counter: dict[str, float] = {"ticks": 0, "started": 0.0, "ticks_per_second": 0.0}
+
+    @property
+    def ticks_per_second(self) -> float:
+        """Ticks simulated during the latest full second of real time."""
+        return self._counter["ticks_per_second"]
+
+    def _count_tick(self):
+        """Updates the ticks per second counter."""
+        self._counter["ticks"] += 1
+        now: float = time.perf_counter()
+        elapsed: float = now - self._counter["started"]
+        if elapsed >= 1:
+            self._counter["ticks_per_second"] = self._counter["ticks"] / elapsed
+            self._counter["ticks"] = 0
+            self._counter["started"] = now
+
+    def step(self):
+        """Simulates a single fixed timestep.
+
+        Follows the order of GameLoop: the player is moved, the clock ticks and the game
+        logic is updated.
+        """
+        if self._controller:
+            position: tuple[int, int] | None = self._controller(self._game_state)
+            if position:
+                self._game_logic.move_player(*position)
+
+        self._clock.tick()
+        self._game_logic.update()
+        self._count_tick()
+
+    def run(self, max_ticks: int) -> SimulationResult:
+        """Starts a new game and simulates it until game over or until max_ticks is reached.
+
+        Args:
+            max_ticks: Maximum number of fixed timesteps to simulate.
+
+        Returns:
+            SimulationResult describing the simulated game.
+        """
+        self._game_logic.start_new_game()
+        started: float = time.perf_counter()
+        self._counter["started"] = started
+        ticks: int = 0
+
+        while ticks < max_ticks and not self._game_logic.game_over:
+            self.step()
+            ticks += 1
+
+        return SimulationResult(ticks, self._clock.get_ticks(), time.perf_counter() - started,
+                                level=self._game_state.level, points=self._game_state.points,
+                                game_over=self._game_logic.game_over)
+
+
+# pylint: disable=too-many-arguments
+def create_simulation(*, seed: int | None = None,
+                      difficulty: Difficulty = Difficulty.MEDIUM, fps: int = 120,
+                      custom_settings: ProgressionLogic | None = None,
+                      controller: PlayerController | None = None, lives: int = 10,
+                      progression_options: Sequence[ProgressionLogic] = PROGRESSION_OPTIONS
+                      ) -> HeadlessRunner:
+    """Creates a deterministic headless simulation.
+
+    The game state and game logic use a FixedStepClock as their time source and the game
+    state uses a random number generator seeded with the given seed.
+
+    Args:
+        seed: Seed for the random number generator. None gives a random seed.
+        difficulty: Difficulty of the game.
+        fps: Simulated frames per second.
+        custom_settings: Progression logic used with the custom difficulty.
+        controller: Function deciding where the player moves on each tick.
+        lives: Initial lives of the player before the difficulty is applied.
+        progression_options: Progression logic for every difficulty, indexed by the
+            difficulty value.
+
+    Returns:
+        HeadlessRunner ready to be run.
+    """
+    clock: FixedStepClock = FixedStepClock(fps)
+    game_state: GameState = GameState(1280, 720, difficulty, lives,
+                                      SpawnSettings(rng=Random(seed)))
+    game_logic: GameLogic = GameLogic(game_state, custom_settings, time_source=clock.get_ticks,
+                                      progression_options=progression_options)
+    game_logic.move_player(game_state.width // 2, game_state.height // 2)
+
+    return HeadlessRunner(game_state, game_logic, clock, controller)
@@ -1,3 +1,5 @@
 from .gem import Gem
 from .player import Player
 from .enemy import Enemy
+from .spatial_hash import SpatialHash
+from .sprite_pool import SpritePool
@@ -1,27 +1,92 @@
+from typing import TYPE_CHECKING
+
 import pygame
 from pygame import Surface, Rect
 
 from utilities import image_handler
+from .spatial_hash import SpatialHash
+
+if TYPE_CHECKING:
+    from game_engine.enemy_store import EnemyStore
 
 FRAME_SWAP_RATE: int = 167
 """Constant rate value used for animating the Enemy sprite."""
 
+FRAME_COUNT: int = 3
+"""Number of image frames in the Enemy sprite animation."""
+
+
+def animation_frame(ticks: int) -> int:
+    """Returns the index of the animation frame every enemy shows at the given time.
+
+    Args:
+        ticks: Elapsed milliseconds.
+    """
+    return ticks // FRAME_SWAP_RATE % FRAME_COUNT
+
+
+class EnemyAnimation:
+    """Animation frame shared by a set of enemies.
+
+    All enemies animate in step, so the frame index is set once per game loop iteration
+    with animate instead of updating every enemy.
+
+    Attributes:
+        frame: Index of the image frame rendered by every enemy sharing the animation.
+    """
+
+    def __init__(self):
+        self.frame: int = 0
+
+    def animate(self, ticks: int):
+        """Swaps the image frame of every enemy to the frame shown at the given time.
+
+        Meant to be called once per game loop iteration with the timestamp of the frame.
+        The cost doesn't depend on the number of enemies.
+
+        Args:
+            ticks: Elapsed milliseconds.
+        """
+        self.frame = animation_frame(ticks)
+
+
+class EnemyFactory:
+    """Creates enemies that all share one EnemyAnimation.
+
+    Meant to be used as the factory of an enemy SpritePool, so the pooled enemies keep
+    sharing the animation when they are reused.
+
+    Attributes:
+        animation: EnemyAnimation shared by every enemy created by the factory.
+    """
+
+    def __init__(self):
+        self.animation: EnemyAnimation = EnemyAnimation()
+
+    def __call__(self) -> "Enemy":
+        return Enemy(animation=self.animation)
+
 
+# pylint: disable=too-many-instance-attributes
 class Enemy(pygame.sprite.Sprite):
     """Enemy pygame sprite.
 
     Attributes:
-        direction_x: Horizontal movement direction. either a positive or a negative value.
-        direction_y: Vertical movement direction. either a positive or a negative value.
-        speed: Movement speed of the Enemy sprite.
+        _movement: Dictionary holding the horizontal and vertical movement directions
+            and the movement speed of the sprite. Used when the sprite is not bound
+            to an EnemyStore.
+        _store: EnemyStore the sprite is bound to or None. A bound sprite reads and writes
+            its movement values and position from the store.
+        _store_index: Index of the sprite inside the EnemyStore.
+        _synced_step: Step of the EnemyStore the rect was last synced on.
         _frames: List holding all image surfaces that are used to render and animate the class
-        image: Pygame image surface that is currently used to render the sprite.
-        rect: Pygame rect object gets it's position and size from image.
-        _previous_frame_swap: Timestamp for when the previous frame was swapped.
-        _current_frame: The numerical index of currently rendered image frame.
+        rect: Pygame rect object gets it's position and size from image. The rect of a
+            bound sprite is synced from the EnemyStore when it is read.
+        _animation: EnemyAnimation holding the index of the rendered image frame.
     """
 
-    def __init__(self, x: int = 0, y: int = 0, direction: tuple[int, int] = (1, 1), speed: int = 1):
+    def __init__(self, x: int = 0, y: int = 0, direction: tuple[int, int] = (1, 1), speed: int = 1,
+                 *, animation: EnemyAnimation | None = None):
         """Initializes the enemy sprite.
 
         Sets sprites initial coordinates and movement speed. The direction tuple represents
@@ -35,36 +100,147 @@ class Enemy(pygame.sprite.Sprite):
             y: y coordinate value for the sprite's starting position.
             direction: The direction the sprite moves to horizontally and vertically.
             speed: Movement speed of the Enemy sprite.
+            animation: EnemyAnimation shared with other enemies. Defaults to an
+                animation of its own.
         """
         super().__init__()
 
-        self.direction_x: int = direction[0]
-        self.direction_y: int = direction[1]
-        self.speed: int = speed
+        self._animation: EnemyAnimation = animation or EnemyAnimation()
+        self._movement: dict[str, int] = {
+            "direction_x": direction[0],
+            "direction_y": direction[1],
+            "speed": speed,
+        }
+        self._store: EnemyStore | None = None
+        self._store_index: int = 0
+        self._synced_step: int = 0
 
         self._load_images()
-        self.image: Surface = self._frames[0]
-        self.rect: Rect = self.image.get_rect()
+        self._rect: Rect = self._frames[0].get_rect()
         self.place(x, y)
 
-        self._previous_frame_swap: int = 0
-        self._current_frame: int = 0
-
     def _load_images(self):
-        """Uses the image handler helper module to load images from the asset folder.
+        """Uses the image handler helper module to get images from the shared image cache.
 
-        Currently, loads 3 slightly different ghost images used for creating simple
+        Currently, uses 3 slightly different ghost images used for creating simple
         sprite animation. Images are kept inside the frames list.
         """
         self._frames: list[Surface] = []
         for i in range(1, 4):
-            self._frames.append(image_handler.load_image(f"ghost_frame_{i}.png"))
+            self._frames.append(image_handler.get_image(f"ghost_frame_{i}.png"))
+
+    def _get_movement_value(self, name: str) -> int:
+        if self._store is None:
+            return self._movement[name]
+        return self._store.get_value(self._store_index, name)
+
+    def _set_movement_value(self, name: str, value: int):
+        if self._store is None:
+            self._movement[name] = value
+        else:
+            self._store.set_value(self._store_index, name, value)
+
+    @property
+    def direction_x(self) -> int:
+        """Horizontal movement direction. either a positive or a negative value."""
+        return self._get_movement_value("direction_x")
+
+    @direction_x.setter
+    def direction_x(self, value: int):
+        self._set_movement_value("direction_x", value)
+
+    @property
+    def direction_y(self) -> int:
+        """Vertical movement direction. either a positive or a negative value."""
+        return self._get_movement_value("direction_y")
+
+    @direction_y.setter
+    def direction_y(self, value: int):
+        self._set_movement_value("direction_y", value)
+
+    @property
+    def speed(self) -> int:
+        """Movement speed of the Enemy sprite."""
+        return self._get_movement_value("speed")
+
+    @speed.setter
+    def speed(self, value: int):
+        self._set_movement_value("speed", value)
+
+    @property
+    def rect(self) -> Rect:
+        """Pygame rect of the sprite, synced from the EnemyStore if the store has stepped."""
+        self._sync_rect()
+        return self._rect
+
+    @rect.setter
+    def rect(self, value: Rect):
+        self._rect = value
+
+    def _sync_rect(self):
+        """Moves the rect to the position calculated by the EnemyStore if it's out of date."""
+        if self._store is not None and self._synced_step != self._store.steps:
+            self._rect.center = self._store.get_center(self._store_index)
+            self._synced_step = self._store.steps
+
+    @property
+    def image(self) -> Surface:
+        """Pygame image surface that is currently used to render the sprite."""
+        return self._frames[self._animation.frame]
+
+    @property
+    def current_frame(self) -> int:
+        """The numerical index of currently rendered image frame."""
+        return self._animation.frame
+
+    @property
+    def store_index(self) -> int:
+        return self._store_index
+
+    def bind(self, store: "EnemyStore", index: int):
+        """Makes the sprite a view to the given EnemyStore.
+
+        Called by the EnemyStore when the sprite is added to it or moved inside it. The rect
+        of a sprite moved inside the store is synced before its index changes.
+
+        Args:
+            store: The EnemyStore holding the sprite's movement values.
+            index: Index of the sprite inside the store.
+        """
+        self._sync_rect()
+        self._store = store
+        self._store_index = index
+        self._synced_step = store.steps
+
+    def unbind(self):
+        """Copies the movement values back from the EnemyStore and detaches the sprite from it."""
+        if self._store is not None:
+            self._sync_rect()
+            self._movement = {name: self._get_movement_value(name) for name in self._movement}
+            self._store = None
+
+    def _position_changed(self):
+        """Informs the EnemyStore and spatial hash groups that the sprite's rect has changed."""
+        if self._store is not None:
+            self._store.set_center(self._store_index, self._rect.center)
+        self.rehash()
+
+    def rehash(self):
+        """Updates the sprite's grid cells in every spatial hash group containing it."""
+        for group in self.groups():
+            if isinstance(group, SpatialHash):
+                group.rehash(self)
 
     def move(self):
-        """Updates the enemy sprite coordinates based on its direction and speed attributes."""
-        new_x: int = self.rect.centerx + self.direction_x * self.speed
-        new_y: int = self.rect.centery + self.direction_y * self.speed
-        self.rect.center = (new_x, new_y)
+        """Updates the enemy sprite coordinates based on its direction and speed attributes.
+
+        Spatial hash groups containing the sprite are updated to match the new position.
+        """
+        rect: Rect = self.rect
+        new_x: int = rect.centerx + self.direction_x * self.speed
+        new_y: int = rect.centery + self.direction_y * self.speed
+        rect.center = (new_x, new_y)
+        self._position_changed()
 
     def place(self, x: int, y: int):
         """Directly places the sprite at the given coordinates.
@@ -75,17 +251,16 @@ class Enemy(pygame.sprite.Sprite):
         """
         self.rect.x = x
         self.rect.y = y
+        self._position_changed()
 
-    def update(self):
+    def update(self, ticks: int | None = None):
         """Method for updating sprite animation.
 
-        Meant to be called during every game iteration so the sprite's images can be
-        updated over time. Checks whether enough time has passed between previous time
-        the frame was swapped and swaps the frame when elapsed time is greater than the
-        value determined by FRAME_SWAP_RATE module constant.
+        The frame is swapped once every FRAME_SWAP_RATE milliseconds. Every enemy sharing
+        the animation shows the same frame, so GameLogic animates the shared animation of
+        the GameState once per frame instead of updating every enemy.
+
+        Args:
+            ticks: Elapsed milliseconds. Defaults to pygame.time.get_ticks.
         """
-        elapsed_time: int = pygame.time.get_ticks() - self._previous_frame_swap
-        if elapsed_time > FRAME_SWAP_RATE:
-            self._current_frame = (self._current_frame + 1) % 3
-            self.image = self._frames[self._current_frame]
-            self._previous_frame_swap = pygame.time.get_ticks()
+        self._animation.animate(pygame.time.get_ticks() if ticks is None else ticks)
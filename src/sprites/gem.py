@@ -31,7 +31,7 @@ class Gem(pygame.sprite.Sprite):
         """
         super().__init__()
         self._value = value
-        self.image: pygame.Surface = image_handler.load_image("sapphire.png")
+        self.image: pygame.Surface = image_handler.get_image("sapphire.png")
 
         self.rect: pygame.Rect = self.image.get_rect()
         self.place(x, y)
@@ -10,11 +10,13 @@ class Player(pygame.sprite.Sprite):
 
     Attributes:
         _lives: Number of lives the player has.
-        _images: Dictionary holding all player images.
-        direction: The direction the player is facing. Options are "right" and "left".
+        _images: Dictionary mapping the direction and vulnerability of the player to its image.
+        _direction: The direction the player is facing. Options are "right" and "left".
         image: Pygame image surface that is currently used to render the sprite.
         rect: Pygame rect object gets it's position and size from image.
         _vulnerable: Boolean value indicating whether the player is currently vulnerable.
+        _image_changed: Whether the direction or vulnerability has changed since the image
+            was last updated.
     """
 
     def __init__(self, x: int = 0, y: int = 0, player_lives: int = 9):
@@ -37,29 +39,29 @@ class Player(pygame.sprite.Sprite):
         self._lives = player_lives
 
         self._load_images()
-        self.direction: str = "right"
-        self.image: Surface = self._images["right"]
+        self._direction: str = "right"
         self._vulnerable: bool = True
+        self.image: Surface = self._images[("right", True)]
+        self._image_changed: bool = False
 
         self.rect: pygame.Rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
 
     def _load_images(self):
-        """Uses the image handler helper module to load and create images of the player.
+        """Uses the image handler helper module to get the images of the player.
 
         This method prepares the images required for rendering the character in various
         states such as moving to the right, moving to the left, and their corresponding
-        damaged versions. The images are processed and stored in a dictionary for easy
-        access within the application.
+        damaged versions. The images come from the shared image cache and are stored in
+        a dictionary keyed by the direction and vulnerability of the player.
         """
-        moving_right: Surface = image_handler.load_image("thief_right_facing.png")
-        damaged_moving_right: Surface = image_handler.create_opaque_image("thief_right_facing.png")
-        self._images: dict[str, Surface] = {
-            "right": moving_right,
-            "left": image_handler.reverse_image_horizontally(moving_right),
-            "damaged_right": damaged_moving_right,
-            "damaged_left": image_handler.reverse_image_horizontally(damaged_moving_right),
+        filename: str = "thief_right_facing.png"
+        self._images: dict[tuple[str, bool], Surface] = {
+            ("right", True): image_handler.get_image(filename),
+            ("left", True): image_handler.get_image(filename, flip=True),
+            ("right", False): image_handler.get_image(filename, opacity=128),
+            ("left", False): image_handler.get_image(filename, flip=True, opacity=128),
         }
 
     def injure(self):
@@ -70,19 +72,25 @@ class Player(pygame.sprite.Sprite):
     def update(self):
         """Updates the image of an object based on its direction and vulnerability status.
 
-        The method checks the current direction and vulnerability of the object to select
-        the appropriate image. The object changes its image to represent its state,
+        The image is looked up only when the direction or the vulnerability has changed
+        since the previous update. The object changes its image to represent its state,
         displaying either a normal or damaged appearance, depending on whether it is
         vulnerable or not.
         """
-        if self.direction == "right" and self.vulnerable:
-            self.image = self._images["right"]
-        elif self.direction == "left" and self.vulnerable:
-            self.image = self._images["left"]
-        elif self.direction == "right" and not self.vulnerable:
-            self.image = self._images["damaged_right"]
-        elif self.direction == "left" and not self.vulnerable:
-            self.image = self._images["damaged_left"]
+        if self._image_changed:
+            self.image = self._images[(self._direction, self._vulnerable)]
+            self._image_changed = False
+
+    @property
+    def direction(self) -> str:
+        """The direction the player is facing. Options are "right" and "left"."""
+        return self._direction
+
+    @direction.setter
+    def direction(self, value: str):
+        if value != self._direction:
+            self._direction = value
+            self._image_changed = True
 
     @property
     def lives(self) -> int:
@@ -107,4 +115,6 @@ class Player(pygame.sprite.Sprite):
         """
         if not isinstance(value, bool):
             raise ValueError("Vulnerability must be a boolean")
-        self._vulnerable = value
+        if value != self._vulnerable:
+            self._vulnerable = value
+            self._image_changed = True
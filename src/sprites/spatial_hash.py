@@ -0,0 +1,187 @@
+import pygame
+from pygame import Rect
+from pygame.sprite import Group, Sprite
+
+CELL_SIZE: int = 64
+"""Default width and height of a single grid cell in pixels."""
+
+type Cell = tuple[int, int]
+type Bounds = tuple[int, int, int, int]
+
+
+class SpatialHash(Group):
+    """pygame sprite group that also buckets its sprites into a uniform grid.
+
+    Works as a regular pygame Group, but every sprite is additionally stored in the
+    grid cells its rect overlaps. Collision queries only look at the sprites sharing
+    cells with the queried rect instead of testing every sprite in the group.
+    Sprites are hashed when they are added to the group and removed from the grid
+    when they are removed from the group or killed. Sprites that move after being
+    added have to be rehashed with the rehash method.
+
+    Attributes:
+        _cell_size: Width and height of a single grid cell in pixels.
+        _cells: Dictionary mapping grid cells to the sprites overlapping them.
+        _sprite_bounds: Dictionary mapping sprites to the first and last grid column and row
+            they overlap.
+        _order: Dictionary mapping sprites to the order they were added to the group in.
+        _added: Running count of added sprites used for keeping the insertion order.
+    """
+
+    def __init__(self, *sprites: Sprite, cell_size: int = CELL_SIZE):
+        """Initializes the spatial hash.
+
+        Args:
+            *sprites: Sprites to be added to the group.
+            cell_size: Width and height of a single grid cell in pixels.
+        """
+        self._cell_size: int = cell_size
+        self._cells: dict[Cell, set[Sprite]] = {}
+        self._sprite_bounds: dict[Sprite, Bounds] = {}
+        self._order: dict[Sprite, int] = {}
+        self._added: int = 0
+        super().__init__(*sprites)
+
+    def _bounds_for(self, rect: Rect) -> Bounds:
+        """Returns the first and last grid column and row the given rect overlaps.
+
+        Args:
+            rect: The rect whose bounds are calculated.
+
+        Returns:
+            Tuple containing the first column, last column, first row and last row.
+        """
+        size: int = self._cell_size
+        return (rect.left // size, max(rect.left, rect.right - 1) // size,
+                rect.top // size, max(rect.top, rect.bottom - 1) // size)
+
+    @staticmethod
+    def _cells_in(bounds: Bounds) -> list[Cell]:
+        first_column, last_column, first_row, last_row = bounds
+        return [(column, row)
+                for column in range(first_column, last_column + 1)
+                for row in range(first_row, last_row + 1)]
+
+    def _insert(self, sprite: Sprite, bounds: Bounds):
+        self._sprite_bounds[sprite] = bounds
+        for cell in self._cells_in(bounds):
+            self._cells.setdefault(cell, set()).add(sprite)
+
+    def _discard(self, sprite: Sprite):
+        bounds: Bounds | None = self._sprite_bounds.pop(sprite, None)
+        if bounds is None:
+            return
+
+        for cell in self._cells_in(bounds):
+            bucket: set[Sprite] = self._cells[cell]
+            bucket.discard(sprite)
+            if not bucket:
+                del self._cells[cell]
+
+    def add_internal(self, sprite: Sprite, layer=None):
+        """Adds the sprite to the group and to the grid cells its rect overlaps."""
+        super().add_internal(sprite, layer)
+        self._order[sprite] = self._added
+        self._added += 1
+        self._insert(sprite, self._bounds_for(sprite.rect))
+
+    def remove_internal(self, sprite: Sprite):
+        """Removes the sprite from the group and from the grid."""
+        super().remove_internal(sprite)
+        self._order.pop(sprite, None)
+        self._discard(sprite)
+
+    def rehash(self, sprite: Sprite):
+        """Moves the sprite to the grid cells matching its current rect.
+
+        Args:
+            sprite: A sprite of this group that has moved since it was last hashed.
+        """
+        bounds: Bounds | None = self._sprite_bounds.get(sprite)
+        if bounds is None:
+            return
+
+        new_bounds: Bounds = self._bounds_for(sprite.rect)
+        if new_bounds != bounds:
+            self._discard(sprite)
+            self._insert(sprite, new_bounds)
+
+    def query(self, rect: Rect) -> list[Sprite]:
+        """Returns the sprites that share at least one grid cell with the given rect.
+
+        The sprites are returned in the order they were added to the group.
+
+        Args:
+            rect: The area to look for sprites from.
+
+        Returns:
+            List of sprites near the given rect.
+        """
+        candidates: set[Sprite] = set()
+        for cell in self._cells_in(self._bounds_for(rect)):
+            bucket: set[Sprite] | None = self._cells.get(cell)
+            if bucket:
+                candidates.update(bucket)
+
+        return sorted(candidates, key=self._order.__getitem__)
+
+    def collide(self, sprite: Sprite, dokill: bool = False) -> list[Sprite]:
+        """Finds the sprites in this group that collide with the given sprite.
+
+        Gives the same result as pygame.sprite.spritecollide with rect collision,
+        but only tests the sprites that share grid cells with the given sprite.
+
+        Args:
+            sprite: The sprite tested against this group.
+            dokill: If True the collided sprites are killed.
+
+        Returns:
+            List of collided sprites in the order they were added to the group.
+        """
+        rect: Rect = sprite.rect
+        collided: list[Sprite] = [candidate for candidate in self.query(rect)
+                                  if rect.colliderect(candidate.rect)]
+        if dokill:
+            for candidate in collided:
+                candidate.kill()
+
+        return collided
+
+    def border_candidates(self, width: int, height: int) -> list[Sprite]:
+        """Returns the sprites that are in grid cells on or outside the given area's borders.
+
+        Every sprite crossing the borders of the area is included, but the result can also
+        contain sprites that are close to the borders without crossing them.
+
+        Args:
+            width: Width of the area.
+            height: Height of the area.
+
+        Returns:
+            List of sprites in the order they were added to the group.
+        """
+        last_column: int = width // self._cell_size
+        last_row: int = height // self._cell_size
+        candidates: set[Sprite] = set()
+
+        for (column, row), bucket in self._cells.items():
+            if column < 0 or row < 0 or column >= last_column or row >= last_row:
+                candidates.update(bucket)
+
+        return sorted(candidates, key=self._order.__getitem__)
+
+
+def spritecollide(sprite: Sprite, group: Group, dokill: bool) -> list[Sprite]:
+    """Drop-in replacement for pygame.sprite.spritecollide that uses the grid when it can.
+
+    Args:
+        sprite: The sprite tested against the group.
+        group: A SpatialHash or any other pygame group.
+        dokill: If True the collided sprites are killed.
+
+    Returns:
+        List of collided sprites.
+    """
+    if isinstance(group, SpatialHash):
+        return group.collide(sprite, dokill)
+    return pygame.sprite.spritecollide(sprite, group, dokill)
@@ -0,0 +1,64 @@
+from typing import Callable
+
+from pygame.sprite import Sprite
+
+POOL_SIZE: int = 256
+"""Default number of released sprites a pool keeps for reuse."""
+
+
+class SpritePool:
+    """Free list of sprites that are reused instead of creating new ones.
+
+    Sprites that are no longer needed are released back to the pool. Acquiring a sprite
+    returns the most recently released one, or a new sprite from the factory when the
+    pool is empty. Reused sprites keep their previous state, so the caller resets them
+    with place and their attribute setters.
+
+    Attributes:
+        _factory: Function creating a new sprite when the pool is empty.
+        _free: Released sprites waiting for reuse.
+        _max_size: Maximum number of released sprites kept. Sprites released to a full
+            pool are left for the garbage collector.
+        _stats: Dictionary counting reused sprites, created sprites and released sprites.
+    """
+
+    def __init__(self, factory: Callable[[], Sprite], max_size: int = POOL_SIZE):
+        """Initializes an empty pool.
+
+        Args:
+            factory: Function creating a new sprite when the pool is empty.
+            max_size: Maximum number of released sprites kept. 0 disables reuse.
+        """
+        self._factory: Callable[[], Sprite] = factory
+        self._free: list[Sprite] = []
+        self._max_size: int = max_size
+        self._stats: dict[str, int] = {"hits": 0, "misses": 0, "released": 0}
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+    @property
+    def factory(self) -> Callable[[], Sprite]:
+        """Function creating a new sprite when the pool is empty."""
+        return self._factory
+
+    def acquire(self) -> Sprite:
+        """Returns a released sprite, or a new one if there are no released sprites."""
+        if self._free:
+            self._stats["hits"] += 1
+            return self._free.pop()
+
+        self._stats["misses"] += 1
+        return self._factory()
+
+    def release(self, sprite: Sprite):
+        """Removes the sprite from its groups and keeps it for reuse if the pool isn't full."""
+        if sprite.alive():
+            sprite.kill()
+        if len(self._free) < self._max_size:
+            self._free.append(sprite)
+            self._stats["released"] += 1
+
+    def get_stats(self) -> dict[str, int]:
+        """Returns the numbers of reused, created and released sprites and free sprites."""
+        return {**self._stats, "free": len(self._free)}
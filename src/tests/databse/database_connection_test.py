@@ -0,0 +1,55 @@
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from database.database_connection import ConnectionFactory
+
+
+class TestConnectionFactory(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.database = str(Path(self.temporary_directory.name) / "test.db")
+        self.factory = ConnectionFactory(self.database)
+
+    def tearDown(self):
+        self.factory.close()
+        self.temporary_directory.cleanup()
+
+    def test_same_thread_reuses_the_connection(self):
+        self.assertIs(self.factory.get_connection(), self.factory.get_connection())
+
+    def test_each_thread_gets_its_own_connection(self):
+        connections = []
+
+        def connect():
+            connections.append(self.factory.get_connection())
+            self.factory.close()
+
+        thread = threading.Thread(target=connect)
+        thread.start()
+        thread.join()
+
+        self.assertIsNot(connections[0], self.factory.get_connection())
+
+    def test_closed_connection_is_replaced(self):
+        connection = self.factory.get_connection()
+        connection.close()
+
+        self.assertIsNot(connection, self.factory.get_connection())
+
+    def test_pragmas_depend_on_tuning(self):
+        test_cases = ((True, "wal", 1), (False, "delete", 2))
+
+        for tuned, journal_mode, synchronous in test_cases:
+            with self.subTest(tuned=tuned):
+                connection = ConnectionFactory(self.database, tuned).connect()
+                if not tuned:
+                    connection.execute("PRAGMA journal_mode = DELETE;")
+
+                self.assertEqual(journal_mode,
+                                 connection.execute("PRAGMA journal_mode;").fetchone()[0])
+                self.assertEqual(synchronous,
+                                 connection.execute("PRAGMA synchronous;").fetchone()[0])
+                connection.close()
@@ -0,0 +1,165 @@
+import sqlite3
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+
+import initialize_database
+from database.migrations import MIGRATIONS, get_version, migrate
+
+LEGACY_SCHEMA = """
+CREATE TABLE players (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE scores (
+    id INTEGER PRIMARY KEY,
+    player_id INTEGER NOT NULL REFERENCES players,
+    level INTEGER NOT NULL,
+    points INTEGER NOT NULL,
+    time DATETIME
+);
+"""
+
+
+def _scores(count):
+    start = datetime(2025, 1, 1, 12)
+    return [(i % 3 + 1, i % 7, (i * 37) % 50, str(start + timedelta(hours=i * 9)))
+            for i in range(count)]
+
+
+def _insert_scores(connection, scores):
+    connection.executemany("INSERT OR IGNORE INTO players (id, name) VALUES (?, ?);",
+                           [(player_id, f"Player {player_id}") for player_id in (1, 2, 3)])
+    connection.executemany(
+        "INSERT INTO scores (player_id, level, points, time) VALUES (?, ?, ?, ?);", scores)
+    connection.commit()
+
+
+def _leaderboards(connection):
+    return (connection.execute("SELECT * FROM player_bests ORDER BY player_id;").fetchall(),
+            connection.execute("SELECT * FROM period_tops "
+                               "ORDER BY period, start, points DESC, time;").fetchall())
+
+
+class TestMigrations(unittest.TestCase):
+
+    def setUp(self):
+        self.connection = sqlite3.connect(":memory:")
+        self.print_patcher = patch("builtins.print")
+        self.mock_print = self.print_patcher.start()
+
+    def tearDown(self):
+        self.print_patcher.stop()
+        self.connection.close()
+
+    def test_new_database_is_migrated_to_the_latest_version(self):
+        self.assertTrue(migrate(self.connection))
+
+        tables = {row[0] for row in self.connection.execute(
+            "SELECT name FROM sqlite_schema WHERE type = 'table';")}
+        self.assertEqual({"players", "scores", "player_bests", "period_tops"}, tables)
+        self.assertEqual(len(MIGRATIONS), get_version(self.connection))
+
+    def test_progress_is_printed_for_every_migration(self):
+        migrate(self.connection)
+
+        lines = [call.args[0] for call in self.mock_print.call_args_list]
+        self.assertEqual(f"Migrating the score database from version 0 to {len(MIGRATIONS)}",
+                         lines[0])
+        self.assertEqual(len(MIGRATIONS) + 1, len(lines))
+        for number, (line, (description, _)) in enumerate(zip(lines[1:], MIGRATIONS), start=1):
+            with self.subTest(migration=number):
+                self.assertTrue(line.startswith(f"  {number}: {description} ("))
+
+    def test_only_missing_migrations_are_run(self):
+        first, second = Mock(), Mock()
+        migrations = [("First", first), ("Second", second)]
+
+        migrate(self.connection, migrations[:1])
+        migrate(self.connection, migrations)
+        migrate(self.connection, migrations)
+
+        first.assert_called_once_with(self.connection)
+        second.assert_called_once_with(self.connection)
+        self.assertEqual(2, get_version(self.connection))
+
+    def test_failed_migration_rolls_back_every_migration(self):
+        def create_table(connection):
+            connection.execute("CREATE TABLE created (id INTEGER);")
+
+        def fail(connection):
+            connection.execute("INSERT INTO missing VALUES (1);")
+
+        self.assertFalse(migrate(self.connection, [("Create", create_table), ("Fail", fail)]))
+
+        self.assertEqual(0, get_version(self.connection))
+        self.assertEqual([], self.connection.execute("SELECT * FROM sqlite_schema;").fetchall())
+
+    def test_newer_database_is_left_untouched(self):
+        migration = Mock()
+        self.connection.execute("PRAGMA user_version = 5;")
+
+        self.assertTrue(migrate(self.connection, [("Only", migration)]))
+
+        migration.assert_not_called()
+        self.assertEqual(5, get_version(self.connection))
+
+    def test_database_created_before_migrations_keeps_its_scores(self):
+        self.connection.executescript(LEGACY_SCHEMA)
+        _insert_scores(self.connection, _scores(50))
+
+        self.assertTrue(migrate(self.connection))
+
+        self.assertEqual(50, self.connection.execute("SELECT COUNT(*) FROM scores;").fetchone()[0])
+        self.assertEqual(len(MIGRATIONS), get_version(self.connection))
+
+    def test_leaderboards_are_filled_like_the_triggers_fill_them(self):
+        scores = _scores(200)
+        self.connection.executescript(LEGACY_SCHEMA)
+        _insert_scores(self.connection, scores)
+        migrate(self.connection)
+
+        migrated = sqlite3.connect(":memory:")
+        migrate(migrated)
+        _insert_scores(migrated, scores)
+
+        self.assertEqual(_leaderboards(migrated), _leaderboards(self.connection))
+        migrated.close()
+
+    def test_earlier_score_with_equal_points_replaces_the_player_best(self):
+        migrate(self.connection)
+        _insert_scores(self.connection, [(1, 2, 40, "2025-01-02 12:00:00"),
+                                         (1, 1, 40, "2025-01-01 12:00:00"),
+                                         (1, 3, 40, "2025-01-03 12:00:00")])
+
+        self.assertEqual([(1, 1, 40, "2025-01-01 12:00:00")], _leaderboards(self.connection)[0])
+
+    def test_create_schema_raises_if_a_migration_fails(self):
+        with patch("initialize_database.migrate", return_value=False), \
+                self.assertRaises(sqlite3.Error):
+            initialize_database.create_schema(self.connection)
+
+    def test_period_tops_keep_the_earliest_of_tied_scores(self):
+        migrate(self.connection)
+        _insert_scores(self.connection, [(1, 1, 40, f"2025-01-01 12:00:{second:02}")
+                                         for second in range(15, 0, -1)])
+
+        day_top = self.connection.execute(
+            "SELECT time FROM period_tops WHERE period = 'day' ORDER BY time;").fetchall()
+        self.assertEqual([(f"2025-01-01 12:00:{second:02}",) for second in range(1, 11)],
+                         day_top)
+
+    def test_period_top_keeps_only_scores_that_beat_the_tenth(self):
+        migrate(self.connection)
+        _insert_scores(self.connection, [(1, 1, points, f"2025-01-01 12:{points:02}:00")
+                                         for points in range(20, 30)])
+
+        def day_top():
+            return [row[0] for row in self.connection.execute(
+                "SELECT points FROM period_tops WHERE period = 'day' ORDER BY points DESC;")]
+
+        _insert_scores(self.connection, [(2, 1, 19, "2025-01-01 13:00:00")])
+        self.assertEqual(list(range(29, 19, -1)), day_top())
+
+        _insert_scores(self.connection, [(2, 1, 21, "2025-01-01 14:00:00")])
+        self.assertEqual([29, 28, 27, 26, 25, 24, 23, 22, 21, 21], day_top())
@@ -1,4 +1,6 @@
+import itertools
 import os
+import sqlite3
 import unittest
 from datetime import timedelta, datetime
 from pathlib import Path
@@ -6,6 +8,7 @@ from unittest.mock import patch
 
 import initialize_database
 from database.database_connection import get_database_connection
+from database import score_service
 from database.score_service import ScoreService
 
 
@@ -13,7 +16,7 @@ class TestScoreService(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        with patch("database.database_connection.ConfigManager") as mock_config_manager:
+        with patch("database.database_connection.get_config_manager") as mock_config_manager:
             cls.test_db = Path(__file__).resolve().parent / "test.db"
             mock_instance = mock_config_manager.return_value
             mock_instance.get_database_path.return_value = cls.test_db
@@ -76,10 +79,16 @@ class TestScoreService(unittest.TestCase):
         cursor = self.connection.cursor()
         cursor.execute("DELETE FROM scores;")
         cursor.execute("DELETE FROM players;")
+        cursor.execute("DELETE FROM player_bests;")
+        cursor.execute("DELETE FROM period_tops;")
         cursor.close()
 
         self.connection.commit()
 
+    def test_connection_uses_the_test_database(self):
+        database_file = self.connection.execute("PRAGMA database_list;").fetchone()[2]
+        self.assertEqual(self.test_db, Path(database_file))
+
     def test_get_scores_returns_correct_scores(self):
         scores = self.score_service.get_scores()
         self.assertEqual(self.score_list, scores)
@@ -101,3 +110,173 @@ class TestScoreService(unittest.TestCase):
                 self.score_service.add_new_score(name, level, points, self.date)
                 score = self.score_service.get_scores()[index]
                 self.assertEqual(name, score[0])
+
+    def test_get_page_returns_scores_after_the_given_score(self):
+        test_cases = (
+            (None, 2, self.score_list[:2]),
+            ((9001, str(self.date)), 2, self.score_list[2:]),
+            ((9001, str(self.date + timedelta(days=2))), 10, self.score_list[3:]),
+            ((9000, str(self.date)), 10, []),
+        )
+
+        for after, limit, expected in test_cases:
+            with self.subTest(after=after, limit=limit):
+                self.assertEqual(expected, self.score_service.get_page(after, limit))
+
+    def test_get_page_before_returns_scores_before_the_given_score(self):
+        test_cases = (
+            (None, 3, self.score_list[1:]),
+            ((9000, str(self.date)), 2, self.score_list[1:3]),
+            ((9001, str(self.date)), 10, self.score_list[:1]),
+            ((9001, str(self.date - timedelta(days=2))), 10, []),
+        )
+
+        for before, limit, expected in test_cases:
+            with self.subTest(before=before, limit=limit):
+                self.assertEqual(expected, self.score_service.get_page_before(before, limit))
+
+    def test_pages_cover_every_score_once(self):
+        pages, after = [], None
+        while page := self.score_service.get_page(after, 3):
+            pages.extend(page)
+            after = (page[-1][2], page[-1][3])
+
+        self.assertEqual(self.score_service.get_scores(), pages)
+
+    def test_get_rank_returns_position_of_score(self):
+        test_cases = (
+            (9002, str(self.date), 1),
+            (9001, str(self.date), 2),
+            (9001, str(self.date + timedelta(days=1)), 3),
+            (9000, str(self.date), 4),
+            (1, str(self.date), 5),
+        )
+
+        for points, time, expected in test_cases:
+            with self.subTest(points=points, time=time):
+                self.assertEqual(expected, self.score_service.get_rank(points, time))
+
+    def test_count_scores_returns_number_of_scores(self):
+        self.assertEqual(4, self.score_service.count_scores())
+
+    def test_page_queries_use_the_scores_index(self):
+        sql = "EXPLAIN QUERY PLAN SELECT points, time FROM scores ORDER BY points DESC, time;"
+        plan = " ".join(row[-1] for row in self.connection.execute(sql))
+        self.assertIn("scores_by_rank", plan)
+
+    def test_get_player_bests_returns_best_score_of_every_player(self):
+        self.score_service.add_new_score("Make", 5, 9500, self.date)
+        self.score_service.add_new_score("Jake", 6, 9001, self.date + timedelta(days=3))
+        self.score_service.add_new_score("Kake", 7, 10, self.date)
+
+        self.assertEqual([
+            ("Make", 5, 9500, str(self.date)),
+            ("Jake", 1, 9001, str(self.date)),
+            ("Take", 2, 9001, str(self.date + timedelta(days=2))),
+            ("Kake", 3, 9000, str(self.date)),
+        ], self.score_service.get_player_bests())
+        self.assertEqual(2, len(self.score_service.get_player_bests(limit=2)))
+
+    def test_daily_and_weekly_tops_keep_the_best_scores_of_the_period(self):
+        monday = datetime(2025, 1, 6, 12)
+        scores = [("Make", 1, points, monday + timedelta(hours=points % 5, days=points % 2))
+                  for points in range(1, 25)]
+        scores.append(("Jake", 1, 1000, monday - timedelta(days=1)))
+        self.score_service.add_new_scores(scores)
+
+        daily = self.score_service.get_daily_top(monday.date(), limit=20)
+        weekly = self.score_service.get_weekly_top(monday.date(), limit=20)
+
+        self.assertEqual(list(range(24, 4, -2)), [points for _, _, points, _ in daily])
+        self.assertEqual(list(range(24, 14, -1)), [points for _, _, points, _ in weekly])
+        self.assertEqual(3, len(self.score_service.get_daily_top(monday.date(), limit=3)))
+        self.assertEqual([("Jake", 1, 1000, str(monday - timedelta(days=1)))],
+                         self.score_service.get_weekly_top(monday.date() - timedelta(days=7)))
+
+    def test_view_queries_use_the_view_indexes(self):
+        test_cases = (
+            ("SELECT * FROM player_bests ORDER BY points DESC, time LIMIT 10;",
+             "player_bests_by_rank"),
+            ("SELECT * FROM period_tops WHERE period = 'day' AND start = '2025-01-06' "
+             "ORDER BY points DESC, time LIMIT 10;", "period_tops_by_rank"),
+        )
+
+        for sql, index in test_cases:
+            with self.subTest(index=index):
+                plan = " ".join(row[-1] for row in
+                                self.connection.execute(f"EXPLAIN QUERY PLAN {sql}"))
+                self.assertIn(index, plan)
+                self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_add_new_scores_inserts_every_score(self):
+        self.score_service.add_new_scores([("Fake", 1, 5, self.date), ("Make", 2, 6, self.date)])
+        scores = self.score_service.get_scores()
+
+        self.assertEqual(("Make", 2, 6, str(self.date)), scores[-2])
+        self.assertEqual(("Fake", 1, 5, str(self.date)), scores[-1])
+
+    def test_connection_uses_wal_journaling(self):
+        journal_mode = self.connection.execute("PRAGMA journal_mode;").fetchone()[0]
+        self.assertEqual("wal", journal_mode)
+
+    def _statements(self, action):
+        statements = []
+        self.connection.set_trace_callback(statements.append)
+        try:
+            action()
+        finally:
+            self.connection.set_trace_callback(None)
+        # Statements run by triggers are traced as repeats of the statement firing them.
+        return [statement.split()[0] for statement, _ in itertools.groupby(statements)
+                if statement.split()[0] in ("INSERT", "SELECT")]
+
+    def test_new_scores_are_stored_with_existing_and_new_players(self):
+        for upsert in (False, score_service.RETURNING_SUPPORTED):
+            with self.subTest(upsert=upsert):
+                service = ScoreService(self.connection, upsert=upsert)
+                service.add_new_score("Jake", 5, 10, self.date)
+                service.add_new_score(f"New {upsert}", 6, 11, self.date)
+
+                scores = service.get_scores()
+                self.assertIn(("Jake", 5, 10, str(self.date)), scores)
+                self.assertIn((f"New {upsert}", 6, 11, str(self.date)), scores)
+                self.assertEqual(1, self.connection.execute(
+                    "SELECT COUNT(*) FROM players WHERE name = 'Jake';").fetchone()[0])
+
+    def test_repeat_submissions_insert_only_the_score(self):
+        test_cases = (
+            ({"upsert": False}, ["INSERT", "SELECT", "INSERT"], ["INSERT"]),
+            ({"upsert": False, "player_cache_size": 0},
+             ["INSERT", "SELECT", "INSERT"], ["INSERT", "SELECT", "INSERT"]),
+        )
+        if score_service.RETURNING_SUPPORTED:
+            test_cases += (({"upsert": True}, ["INSERT", "INSERT"], ["INSERT"]),)
+
+        for options, first, repeat in test_cases:
+            with self.subTest(**options):
+                service = ScoreService(self.connection, **options)
+                name = f"Player {options}"
+                self.assertEqual(first, self._statements(
+                    lambda: service.add_new_score(name, 1, 1, self.date)))
+                self.assertEqual(repeat, self._statements(
+                    lambda: service.add_new_score(name, 1, 2, self.date)))
+
+    def test_failed_batch_clears_cached_player_ids(self):
+        with patch.object(self.score_service, "_insert_score",
+                          side_effect=sqlite3.IntegrityError("failed")):
+            with self.assertRaises(sqlite3.IntegrityError):
+                self.score_service.add_new_scores([("Rolled back", 1, 1, self.date)])
+
+        self.score_service.add_new_score("Rolled back", 2, 2, self.date)
+        self.assertIn(("Rolled back", 2, 2, str(self.date)), self.score_service.get_scores())
+
+    def test_failed_batch_leaves_no_rows_and_no_open_transaction(self):
+        count_sql = "SELECT (SELECT COUNT(*) FROM players), (SELECT COUNT(*) FROM scores);"
+        counts = self.connection.execute(count_sql).fetchone()
+
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.score_service.add_new_scores([("Batch", 1, 1, self.date),
+                                               ("Batch", 1, None, self.date)])
+
+        self.assertFalse(self.connection.in_transaction)
+        self.assertEqual(counts, self.connection.execute(count_sql).fetchone())
@@ -0,0 +1,126 @@
+import io
+import json
+import sqlite3
+import unittest
+
+import initialize_database
+from database.score_service import ScoreService
+from database.score_transfer import export_scores, import_scores
+
+SCORES = [
+    ("Make", 3, 9001, "2025-01-01 12:00:00"),
+    ("Jake", 1, 120, "2025-01-02 12:00:00"),
+    ("Make", 5, 15000, "2025-01-03 12:00:00"),
+    ("Åke", 2, 500, "2025-01-04 12:00:00"),
+]
+
+
+class TestScoreTransfer(unittest.TestCase):
+
+    def setUp(self):
+        self.source = self._create_database()
+        self.target = self._create_database()
+        ScoreService(self.source).add_new_scores(SCORES)
+
+    def tearDown(self):
+        self.source.close()
+        self.target.close()
+
+    @staticmethod
+    def _create_database():
+        connection = sqlite3.connect(":memory:")
+        initialize_database.create_schema(connection)
+        return connection
+
+    @staticmethod
+    def _stored_scores(connection):
+        return connection.execute("""
+        SELECT name, level, points, time
+        FROM scores JOIN players ON players.id = scores.player_id
+        ORDER BY scores.id;
+        """).fetchall()
+
+    def _export(self):
+        file = io.StringIO()
+        count = export_scores(self.source, file)
+        file.seek(0)
+        return count, file
+
+    def test_export_writes_header_and_one_line_per_score(self):
+        count, file = self._export()
+        lines = file.read().splitlines()
+
+        self.assertEqual(4, count)
+        self.assertEqual({"format": "gem-poacher-scores", "version": 1,
+                          "columns": ["name", "level", "points", "time"]}, json.loads(lines[0]))
+        self.assertEqual([list(score) for score in SCORES], [json.loads(line) for line in lines[1:]])
+
+    def test_import_restores_exported_scores(self):
+        _, file = self._export()
+
+        self.assertEqual(4, import_scores(self.target, file))
+        self.assertEqual(SCORES, self._stored_scores(self.target))
+
+    def test_import_inserts_in_batches(self):
+        _, file = self._export()
+
+        self.assertEqual(4, import_scores(self.target, file, batch_size=3))
+        self.assertEqual(SCORES, self._stored_scores(self.target))
+
+    def test_import_reuses_existing_players(self):
+        ScoreService(self.target).add_new_score("Jake", 9, 1, "2024-12-31 12:00:00")
+        _, file = self._export()
+
+        import_scores(self.target, file)
+
+        players = self.target.execute("SELECT id, name FROM players ORDER BY id;").fetchall()
+        self.assertEqual([(1, "Jake"), (2, "Make"), (3, "Åke")], players)
+        self.assertEqual([("Jake", 9, 1, "2024-12-31 12:00:00")] + SCORES,
+                         self._stored_scores(self.target))
+
+    def test_imported_times_are_stored_in_the_form_the_game_writes(self):
+        header = '{"format": "gem-poacher-scores", "version": 1, ' \
+                 '"columns": ["name", "level", "points", "time"]}\n'
+        content = header + '["Make", 1, 10, "2025-01-01T12:00:00"]\n' \
+                           '["Jake", 1, 20, "2025-01-02"]\n'
+
+        import_scores(self.target, io.StringIO(content))
+
+        self.assertEqual([("Make", 1, 10, "2025-01-01 12:00:00"),
+                          ("Jake", 1, 20, "2025-01-02 00:00:00")],
+                         self._stored_scores(self.target))
+
+    def test_score_without_a_time_is_rejected_on_export_and_import(self):
+        # Only a database created before the leaderboard triggers can have such a score.
+        self.source.execute("DROP TRIGGER update_period_tops;")
+        self.source.execute("INSERT INTO scores (player_id, level, points, time) "
+                            "VALUES (1, 2, 300, NULL);")
+        with self.assertRaises(ValueError):
+            export_scores(self.source, io.StringIO())
+
+        header = '{"format": "gem-poacher-scores", "version": 1, ' \
+                 '"columns": ["name", "level", "points", "time"]}\n'
+        with self.assertRaises(ValueError):
+            import_scores(self.target, io.StringIO(header + '["Make", 2, 300, null]\n'))
+        self.assertEqual([], self._stored_scores(self.target))
+
+    def test_invalid_files_are_rejected_and_rolled_back(self):
+        valid = '["Make", 1, 10, "2025-01-01 12:00:00"]\n'
+        header = '{"format": "gem-poacher-scores", "version": 1, ' \
+                 '"columns": ["name", "level", "points", "time"]}\n'
+        cases = {
+            "empty file": "",
+            "not a score file": '{"format": "something else"}\n',
+            "newer version": header.replace('"version": 1', '"version": 2'),
+            "broken json": header + valid + "[\n",
+            "missing value": header + valid + '["Make", 1, 10]\n',
+            "wrong type": header + valid + '["Make", "1", 10, "2025-01-01 12:00:00"]\n',
+            "bad time": header + valid + '["Make", 1, 10, "yesterday"]\n',
+            "aware time": header + valid + '["Make", 1, 10, "2025-01-01T12:00:00+02:00"]\n',
+        }
+
+        for case, content in cases.items():
+            with self.subTest(case), self.assertRaises(ValueError):
+                import_scores(self.target, io.StringIO(content), batch_size=1)
+            self.assertEqual([], self._stored_scores(self.target))
+            self.assertEqual([], self.target.execute("SELECT * FROM players;").fetchall())
@@ -0,0 +1,134 @@
+import sqlite3
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import initialize_database
+from database.score_service import ScoreService
+from database.score_writer import ScoreWriter
+
+
+class TestScoreWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.database = Path(self.temporary_directory.name) / "test.db"
+        self.connection = sqlite3.connect(self.database)
+        initialize_database.create_schema(self.connection)
+
+        self.score_writer = ScoreWriter(lambda: sqlite3.connect(self.database))
+        self.date = datetime.now()
+
+    def tearDown(self):
+        self.score_writer.close()
+        self.connection.close()
+        self.temporary_directory.cleanup()
+
+    def _scores(self):
+        return ScoreService(self.connection).get_scores()
+
+    def test_flush_waits_until_submitted_scores_are_written(self):
+        self.score_writer.submit("Jake", 1, 100, self.date)
+        self.score_writer.submit("Make", 2, 200, self.date)
+        self.score_writer.flush()
+
+        self.assertEqual([("Make", 2, 200, str(self.date)), ("Jake", 1, 100, str(self.date))],
+                         self._scores())
+
+    def test_close_writes_remaining_scores(self):
+        for i in range(100):
+            self.score_writer.submit(f"player_{i % 10}", i, i + 1, self.date + timedelta(i))
+        self.score_writer.close()
+
+        self.assertEqual(100, len(self._scores()))
+
+    def test_pending_scores_are_written_in_batches(self):
+        batches = []
+        release = threading.Event()
+        original = ScoreService.add_new_scores
+
+        def record_batch(service, scores):
+            release.wait()
+            batches.append(len(scores))
+            original(service, scores)
+
+        with patch.object(ScoreService, "add_new_scores", record_batch):
+            self.score_writer.submit("First", 1, 1, self.date)
+            while self.score_writer._queue.qsize():
+                pass
+            for i in range(10):
+                self.score_writer.submit("Jake", i, i + 1, self.date + timedelta(i))
+            release.set()
+            self.score_writer.flush()
+
+        self.assertEqual([1, 10], batches)
+        self.assertEqual(11, len(self._scores()))
+
+    def test_listeners_are_called_with_written_scores(self):
+        written = []
+        self.score_writer.add_listener(written.extend)
+
+        self.score_writer.submit("Jake", 1, 100, self.date)
+        self.score_writer.flush()
+
+        self.assertEqual([("Jake", 1, 100, self.date)], written)
+
+    def test_failed_batch_does_not_stop_the_writer(self):
+        with patch.object(ScoreService, "add_new_scores",
+                          side_effect=sqlite3.OperationalError("disk I/O error")), \
+                patch("builtins.print") as mock_print:
+            self.score_writer.submit("Jake", 1, 100, self.date)
+            self.score_writer.flush()
+
+        mock_print.assert_called_once()
+        self.score_writer.submit("Make", 1, 100, self.date)
+        self.score_writer.flush()
+        self.assertEqual(["Make"], [score[0] for score in self._scores()])
+
+    def test_failed_batch_is_passed_to_failure_listeners(self):
+        failed = []
+        self.score_writer.add_failure_listener(failed.extend)
+
+        with patch.object(ScoreService, "add_new_scores", side_effect=ValueError("bad score")), \
+                patch("builtins.print"):
+            self.score_writer.submit("Jake", 1, 100, self.date)
+            self.score_writer.flush()
+
+        self.assertEqual([("Jake", 1, 100, self.date)], failed)
+
+    def test_scores_fail_when_the_database_cannot_be_opened(self):
+        failed = []
+        with patch("builtins.print") as mock_print:
+            score_writer = ScoreWriter(Mock(side_effect=sqlite3.OperationalError("no disk")))
+            score_writer.add_failure_listener(failed.extend)
+            score_writer.submit("Jake", 1, 100, self.date)
+            score_writer.close()
+
+        mock_print.assert_called_once()
+        self.assertEqual([("Jake", 1, 100, self.date)], failed)
+        self.assertEqual([], self._scores())
+
+    def test_failing_listener_does_not_stop_the_writer(self):
+        self.score_writer.add_listener(Mock(side_effect=RuntimeError("listener failed")))
+
+        with patch("builtins.print") as mock_print:
+            self.score_writer.submit("Jake", 1, 100, self.date)
+            self.score_writer.flush()
+
+        mock_print.assert_called_once()
+        self.score_writer.submit("Make", 1, 100, self.date)
+        self.score_writer.flush()
+        self.assertEqual(2, len(self._scores()))
+
+    def test_missing_tables_are_reported_without_quitting(self):
+        self.connection.execute("DROP TABLE scores;")
+
+        with patch("builtins.print") as mock_print:
+            self.score_writer.submit("Jake", 1, 100, self.date)
+            self.score_writer.flush()
+
+        self.assertIn("no such table", mock_print.call_args.args[0])
+        self.assertTrue(self.score_writer._thread.is_alive())
@@ -2,6 +2,8 @@ import unittest
 from unittest.mock import patch
 
 import game_engine
+from game_engine.clock import BUSY_LOOP_RETRY_WINDOWS, FramePacer
+from utilities.config_manager import ConfigSnapshot
 
 
 class ClockTest(unittest.TestCase):
@@ -31,3 +33,83 @@ class ClockTest(unittest.TestCase):
     def test_clock_tick(self):
         self.clock.tick()
         self.mock_clock.return_value.tick.assert_called_with(120)
+
+    def test_apply_config_sets_the_framerate(self):
+        self.clock.apply_config(ConfigSnapshot(fps=60))
+        self.assertEqual(60, self.clock.fps)
+
+
+class FixedStepClockTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = game_engine.FixedStepClock(fps=100)
+
+    def test_clock_starts_from_zero(self):
+        self.assertEqual(0, self.clock.get_ticks())
+
+    def test_tick_advances_time_by_one_frame(self):
+        for _ in range(3):
+            self.clock.tick()
+        self.assertEqual(30, self.clock.get_ticks())
+
+    def test_changing_framerate_keeps_elapsed_time(self):
+        self.clock.tick()
+        self.clock.set_framerate(50)
+        self.clock.tick()
+
+        self.assertEqual(30, self.clock.get_ticks())
+
+
+class FramePacerTest(unittest.TestCase):
+    def setUp(self):
+        self.pacer = FramePacer(120)
+        self.time = 0.0
+        self.pacer.record(self.time, self.time)
+
+    def _play(self, work_ms: float, frame_ms: float, windows: int = 1):
+        for _ in range(windows):
+            for _ in range(self.pacer.fps):
+                self.pacer.record(self.time + work_ms / 1000, self.time + frame_ms / 1000)
+                self.time += frame_ms / 1000
+
+    def test_consistent_overruns_lower_the_framerate(self):
+        self._play(work_ms=12, frame_ms=12)
+        self.assertEqual(75, self.pacer.fps)
+
+        self._play(work_ms=40, frame_ms=40)
+        self.assertEqual(30, self.pacer.fps)
+
+    def test_raised_target_restores_the_minimum_framerate(self):
+        self.pacer.set_target(20)
+        self.pacer.set_target(120)
+
+        self._play(work_ms=60, frame_ms=60, windows=3)
+
+        self.assertEqual(30, self.pacer.fps)
+
+    def test_framerate_is_raised_back_when_frames_are_fast(self):
+        self._play(work_ms=12, frame_ms=12)
+        self._play(work_ms=2, frame_ms=1000 / 75, windows=2)
+
+        self.assertEqual(120, self.pacer.fps)
+
+    def test_imprecise_sleeping_switches_to_busy_loop(self):
+        self._play(work_ms=2, frame_ms=8.3)
+        self.assertFalse(self.pacer.busy_loop)
+
+        self._play(work_ms=2, frame_ms=11)
+        self.assertTrue(self.pacer.busy_loop)
+
+    def test_sleeping_is_measured_again_after_busy_waiting(self):
+        self._play(work_ms=2, frame_ms=11)
+        self._play(work_ms=2, frame_ms=1000 / 120, windows=BUSY_LOOP_RETRY_WINDOWS)
+
+        self.assertFalse(self.pacer.busy_loop)
+
+    def test_adaptive_clock_busy_waits_when_the_pacer_says_so(self):
+        with patch("pygame.time.Clock") as mock_clock:
+            clock = game_engine.Clock(fps=120, adaptive=True)
+            clock._pacer.busy_loop = True
+            clock.tick()
+
+        mock_clock.return_value.tick_busy_loop.assert_called_once_with(120)
+        mock_clock.return_value.tick.assert_not_called()
@@ -0,0 +1,146 @@
+import random
+import unittest
+from unittest.mock import patch
+
+import pygame
+
+from game_engine.enemy_store import EnemyStore
+from sprites import Enemy, SpatialHash
+
+
+@unittest.skipUnless(EnemyStore.is_available(), "NumPy is not installed")
+class EnemyStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.image_handler_patcher = patch("sprites.enemy.image_handler")
+        mock_image_handler = self.image_handler_patcher.start()
+        mock_image_handler.get_image.return_value = pygame.Surface((26, 48))
+
+        self.rng = random.Random(5)
+        self.store = EnemyStore(capacity=2)
+
+    def tearDown(self):
+        self.image_handler_patcher.stop()
+
+    def _create_enemies(self, count):
+        enemies = []
+        for _ in range(count):
+            direction = self.rng.choice(((1, 1), (-1, 1), (1, -1), (-1, -1)))
+            enemy = Enemy(self.rng.randint(0, 1254), self.rng.randint(0, 672), direction,
+                          self.rng.randint(1, 5))
+            enemies.append(enemy)
+        return enemies
+
+    @staticmethod
+    def _reflect(enemy):
+        if enemy.rect.left < 0:
+            enemy.direction_x = 1
+        elif enemy.rect.right > 1280:
+            enemy.direction_x = -1
+
+        if enemy.rect.top < 0:
+            enemy.direction_y = 1
+        elif enemy.rect.bottom > 720:
+            enemy.direction_y = -1
+
+    def test_step_matches_moving_enemies_one_by_one(self):
+        self.rng.seed(3)
+        expected_enemies = self._create_enemies(20)
+        self.rng.seed(3)
+        stored_enemies = self._create_enemies(20)
+        for enemy in stored_enemies:
+            self.store.add(enemy)
+
+        for _ in range(500):
+            for enemy in expected_enemies:
+                enemy.move()
+                self._reflect(enemy)
+            self.store.step(1280, 720)
+
+        for expected, stored in zip(expected_enemies, stored_enemies):
+            with self.subTest(enemy=stored.store_index):
+                self.assertEqual(expected.rect, stored.rect)
+                self.assertEqual((expected.direction_x, expected.direction_y),
+                                 (stored.direction_x, stored.direction_y))
+
+    def test_bound_enemy_reads_and_writes_values_through_the_store(self):
+        enemy = self._create_enemies(1)[0]
+        self.store.add(enemy)
+        enemy.speed = 7
+        enemy.direction_x = -1
+
+        self.assertEqual(7, self.store.get_value(enemy.store_index, "speed"))
+        self.assertEqual(-1, self.store.get_value(enemy.store_index, "direction_x"))
+
+    def test_placing_a_bound_enemy_moves_it_in_the_store(self):
+        enemy = self._create_enemies(1)[0]
+        self.store.add(enemy)
+        enemy.place(100, 100)
+
+        self.assertEqual(enemy.rect.centerx, self.store.get_value(0, "center_x"))
+        self.assertEqual(enemy.rect.centery, self.store.get_value(0, "center_y"))
+
+    def test_removing_an_enemy_keeps_the_other_enemies_intact(self):
+        enemies = self._create_enemies(3)
+        for enemy in enemies:
+            self.store.add(enemy)
+        enemies[2].speed = 9
+
+        self.store.remove(enemies[0])
+
+        with self.subTest("store shrinks"):
+            self.assertEqual(2, len(self.store))
+
+        with self.subTest("last enemy takes the freed index"):
+            self.assertEqual(0, enemies[2].store_index)
+            self.assertEqual(9, enemies[2].speed)
+
+        with self.subTest("removed enemy keeps its values"):
+            enemies[0].speed = 4
+            self.assertEqual(4, enemies[0].speed)
+            self.assertEqual(9, self.store.get_value(0, "speed"))
+
+    def test_step_rehashes_enemies_in_spatial_hash_groups(self):
+        enemy = self._create_enemies(1)[0]
+        enemy.place(600, 300)
+        spatial_hash = SpatialHash(enemy)
+        self.store.add(enemy)
+
+        for _ in range(200):
+            self.store.step(1280, 720)
+
+        self.assertEqual([enemy], spatial_hash.query(enemy.rect))
+
+    def test_step_only_rehashes_enemies_that_change_grid_cells(self):
+        enemies = self._create_enemies(2)
+        enemies[0].place(10, 10)
+        enemies[0].direction_x, enemies[0].direction_y = 1, 1
+        enemies[1].place(63, 10)
+        enemies[1].direction_x, enemies[1].direction_y = 1, 1
+        for enemy in enemies:
+            enemy.speed = 1
+            self.store.add(enemy)
+
+        with patch.object(Enemy, "rehash") as mock_rehash:
+            self.store.step(1280, 720)
+
+        self.assertEqual(1, mock_rehash.call_count)
+
+    def test_removing_an_enemy_keeps_the_rects_of_stepped_enemies(self):
+        self.rng.seed(3)
+        expected_enemies = self._create_enemies(3)
+        self.rng.seed(3)
+        stored_enemies = self._create_enemies(3)
+        for enemy in stored_enemies:
+            self.store.add(enemy)
+
+        for _ in range(50):
+            for enemy in expected_enemies:
+                enemy.move()
+                self._reflect(enemy)
+            self.store.step(1280, 720)
+        self.store.remove(stored_enemies[0])
+
+        for expected, stored in zip(expected_enemies, stored_enemies):
+            with self.subTest(enemy=stored.store_index):
+                self.assertEqual(expected.rect, stored.rect)
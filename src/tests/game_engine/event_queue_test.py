@@ -4,15 +4,57 @@ from unittest.mock import patch
 import pygame
 
 from game_engine import EventQueue
+from game_engine.event_queue import HANDLED_EVENT_TYPES
+
+
+def motion(x, y, rel=(1, 1)):
+    return pygame.event.Event(pygame.MOUSEMOTION,
+                              {"pos": (x, y), "rel": rel, "buttons": (0, 0, 0)})
 
 
 class EventQueueTest(unittest.TestCase):
 
     @patch.object(pygame.event, "get")
     def test_event_queue_calls_pygame_event(self, mock_get):
-        mock_get.return_value = pygame.KEYDOWN
+        key_event = pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_a})
+        mock_get.return_value = [key_event]
         eq = EventQueue()
-        event = eq.get()
+        events = eq.get()
 
         mock_get.assert_called_once()
-        self.assertEqual(event, pygame.KEYDOWN)
+        self.assertEqual([key_event], events)
+
+    @patch.object(pygame.event, "get")
+    def test_motion_events_are_collapsed_into_the_newest(self, mock_get):
+        key_event = pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_a})
+        mock_get.return_value = [motion(1, 1), key_event, motion(2, 2), motion(5, 3, rel=(3, 1))]
+
+        events = EventQueue().get()
+
+        self.assertEqual([pygame.KEYDOWN, pygame.MOUSEMOTION], [event.type for event in events])
+        self.assertEqual((5, 3), events[1].pos)
+        self.assertEqual((5, 3), events[1].rel)
+
+    @patch.object(pygame.event, "get")
+    def test_stats_count_raw_and_delivered_events(self, mock_get):
+        mock_get.return_value = [motion(x, x) for x in range(100)]
+        eq = EventQueue()
+
+        eq.get()
+        eq.get()
+
+        self.assertEqual({"raw": 200, "delivered": 2}, eq.get_stats())
+
+    @patch.object(pygame.event, "set_allowed")
+    @patch.object(pygame.event, "set_blocked")
+    def test_only_allowed_event_types_are_let_into_the_queue(self, mock_blocked, mock_allowed):
+        EventQueue([pygame.QUIT, pygame.KEYDOWN])
+
+        mock_blocked.assert_called_once_with(None)
+        mock_allowed.assert_called_once_with([pygame.QUIT, pygame.KEYDOWN])
+
+    def test_window_events_are_allowed(self):
+        for event_type in (pygame.WINDOWEXPOSED, pygame.WINDOWMINIMIZED, pygame.WINDOWRESTORED,
+                           pygame.VIDEOEXPOSE, pygame.ACTIVEEVENT):
+            with self.subTest(event_type=pygame.event.event_name(event_type)):
+                self.assertIn(event_type, HANDLED_EVENT_TYPES)
@@ -5,6 +5,8 @@ import pygame
 from pygame.sprite import Group
 
 from game_engine import GameLogic
+from sprites.enemy import EnemyAnimation
+from utilities.config_manager import ConfigSnapshot
 
 
 class StubGem(pygame.sprite.Sprite):
@@ -57,6 +59,8 @@ class StubGameState:
         self.gems = Group()
         self.enemies = Group()
         self.sprites = Group()
+        self.enemy_store = None
+        self.enemy_animation = EnemyAnimation()
         self.points = 0
         self.level = 0
         self.difficulty = 0
@@ -73,6 +77,8 @@ class StubGameState:
         self.populate_amount = 0
         self.spawn_enemy_called = []
         self.reset_game_state_called = 0
+        self.next_game_settings = None
+        self.released_gems = []
 
     def populate_level_with_gems(self, amount: int = 1):
         self.populate_called += 1
@@ -81,6 +87,9 @@ class StubGameState:
     def add_points(self, value):
         self.points += value
 
+    def release_gems(self, gems):
+        self.released_gems.extend(gems)
+
     def increase_level(self):
         self.level += 1
 
@@ -91,6 +100,9 @@ class StubGameState:
         for _ in range(enemy_count):
             self.spawn_enemy(enemy_speed)
 
+    def set_next_game_settings(self, difficulty, lives):
+        self.next_game_settings = (difficulty, lives)
+
     def reset_game_state(self):
         self.reset_game_state_called += 1
         self.player = StubPlayer(lives=2)
@@ -185,6 +197,12 @@ class GameLogicTest(unittest.TestCase):
         self.game_logic.update()
         self.assertEqual(0, len(gems))
 
+    def test_collected_gems_are_released_to_the_game_state(self):
+        gem = self.game_state.gems.sprites()[0]
+        self.game_logic.move_player(800, 800)
+        self.game_logic.update()
+        self.assertEqual([gem], self.game_state.released_gems)
+
     def test_player_gem_collision_adds_points_to_game_state(self):
         self.game_logic.move_player(800, 800)
         self.game_logic.update()
@@ -345,6 +363,29 @@ class GameLogicTest(unittest.TestCase):
         with self.subTest(player_vulnerable=False):
             self.assertFalse(self.player.vulnerable)
 
+    def test_apply_config_replaces_custom_settings_and_sets_next_game(self):
+        config = ConfigSnapshot(difficulty=-1, player_lives=7,
+                                custom_difficulty_settings=((1, 2), (3, 4), (5, 6)))
+        length = len(self.game_logic._progression_options)
+
+        self.game_logic.apply_config(config)
+
+        self.assertEqual(length, len(self.game_logic._progression_options))
+        self.assertEqual(((1, 2), (3, 4), (5, 6)), self.game_logic._progression_options[-1])
+        self.assertEqual((-1, 7), self.game_state.next_game_settings)
+
+        self.game_logic.apply_config(ConfigSnapshot(difficulty=2))
+        self.assertEqual((2, 10), self.game_state.next_game_settings)
+
+    def test_apply_config_keeps_every_default_progression_option(self):
+        defaults = ((3, 6), (2, 3), (2, 3))
+        game_logic = GameLogic(self.game_state, progression_options=[defaults, defaults])
+
+        game_logic.apply_config(ConfigSnapshot(custom_difficulty_settings=((1, 2), (3, 4), (5, 6))))
+
+        self.assertEqual([defaults, defaults, ((1, 2), (3, 4), (5, 6))],
+                         game_logic._progression_options)
+
     def test_reset_game_calls_reset_game_state_method(self):
         self.game_logic.reset_game()
         self.assertEqual(1, self.game_state.reset_game_state_called)
@@ -365,3 +406,16 @@ class GameLogicTest(unittest.TestCase):
         self.game_logic.reset_game()
 
         self.assertNotEqual(enemies, self.game_state.enemies)
+
+    def test_invulnerability_uses_injected_time_source(self):
+        ticks = [0]
+        self.game_logic = GameLogic(self.game_state, time_source=lambda: ticks[0])
+        self.game_logic.activate_player_invulnerability()
+
+        ticks[0] = 1000
+        self.game_logic.update()
+        self.assertFalse(self.player.vulnerable)
+
+        ticks[0] = 1001
+        self.game_logic.update()
+        self.assertTrue(self.player.vulnerable)
@@ -1,10 +1,11 @@
 import time
 import unittest
-from unittest.mock import Mock, call
+from unittest.mock import Mock, call, patch
 
 import pygame
 
 from game_engine import GameLoop
+from utilities.frame_profiler import FrameProfiler
 
 
 class GameLoopTest(unittest.TestCase):
@@ -41,6 +42,27 @@ class GameLoopTest(unittest.TestCase):
         self.game_loop.run()
         self.renderer.render.assert_called_once()
 
+    def test_run_measures_the_phases_of_the_frame(self):
+        profiler = FrameProfiler(enabled=True)
+        self.game_logic.game_over = False
+        self.game_loop = GameLoop(self.game_logic, self.renderer, self.clock, self.event_queue,
+                                  profiler=profiler)
+
+        self.game_loop.run()
+
+        self.assertEqual({"frame", "events", "render", "tick", "logic"},
+                         set(profiler.summary()))
+
+    def test_run_checks_the_config_for_changes(self):
+        config = Mock()
+        self.game_loop = GameLoop(self.game_logic, self.renderer, self.clock, self.event_queue,
+                                  config=config)
+
+        with patch("game_engine.game_loop.pygame.time.get_ticks", return_value=1000):
+            self.game_loop.run()
+
+        config.reload_if_changed.assert_called_once()
+
     def test_run_calls_clock_tick(self):
         self.game_loop.run()
         self.clock.tick.assert_called_once()
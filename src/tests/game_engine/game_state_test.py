@@ -1,14 +1,18 @@
+import random
 import unittest
 from unittest.mock import patch
 
 import pygame
 
-from game_engine import GameState, game_state
+from game_engine import GameState, SpawnSettings, game_state
+from sprites.enemy import FRAME_SWAP_RATE
+from utilities import image_handler
 
 
 class GameStateTest(unittest.TestCase):
 
     def setUp(self):
+        image_handler.clear_cache()
         self.player_patch = patch("sprites.player.image_handler")
         self.player_patch.start()
 
@@ -20,6 +24,7 @@ class GameStateTest(unittest.TestCase):
     def tearDown(self):
         self.player_patch.stop()
         self.enemy_patch.stop()
+        image_handler.clear_cache()
 
     def test_game_state_initializes_properly(self):
         self.assertEqual(1280, self.game_state.width)
@@ -41,6 +46,15 @@ class GameStateTest(unittest.TestCase):
         self.game_state.difficulty = 1
         self.assertEqual(1, self.game_state.difficulty)
 
+    def test_next_game_settings_are_used_after_reset(self):
+        self.game_state.set_next_game_settings(-1, 7)
+        self.assertEqual(0, self.game_state.difficulty)
+
+        self.game_state.reset_game_state()
+
+        self.assertEqual(-1, self.game_state.difficulty)
+        self.assertEqual(7, self.game_state.player.lives)
+
     def test_level_gives_the_correct_level(self):
         self.assertEqual(1, self.game_state.level)
 
@@ -134,6 +148,52 @@ class GameStateTest(unittest.TestCase):
         with self.subTest(sprite="sprites"):
             self.assertNotEqual(original_sprite, self.game_state.sprites)
 
+    def test_released_gems_are_reused_by_the_next_level(self):
+        self.game_state.populate_level_with_gems(3)
+        collected = self.game_state.gems.sprites()
+        for gem in collected:
+            gem.kill()
+        self.game_state.release_gems(collected)
+
+        self.game_state.populate_level_with_gems(3)
+
+        self.assertCountEqual(collected, self.game_state.gems.sprites())
+        self.assertEqual({"hits": 3, "misses": 3, "released": 3, "free": 0},
+                         self.game_state.get_pool_stats()["gems"])
+
+    def test_reset_game_state_reuses_enemies_with_new_settings(self):
+        self.game_state.spawn_enemy(5)
+        enemy = self.game_state.enemies.sprites()[0]
+
+        self.game_state.reset_game_state()
+        self.game_state.spawn_enemy(2)
+
+        self.assertIs(enemy, self.game_state.enemies.sprites()[0])
+        self.assertEqual(2, enemy.speed)
+        self.assertEqual([self.game_state.player, enemy], self.game_state.sprites.sprites())
+
+    def test_enemies_share_the_animation_of_the_game_state_after_reset(self):
+        self.game_state.spawn_enemy()
+        enemy = self.game_state.enemies.sprites()[0]
+        self.game_state.reset_game_state()
+        self.game_state.spawn_multiple_enemies(enemy_count=2, enemy_speed=1)
+
+        self.game_state.enemy_animation.animate(FRAME_SWAP_RATE)
+
+        self.assertIn(enemy, self.game_state.enemies)
+        self.assertEqual([1, 1], [spawned.current_frame for spawned in self.game_state.enemies])
+
+    def test_pool_size_zero_creates_new_sprites(self):
+        game_state = GameState(1280, 720, spawn_settings=SpawnSettings(pool_size=0))
+        game_state.spawn_enemy()
+        enemy = game_state.enemies.sprites()[0]
+
+        game_state.reset_game_state()
+        game_state.spawn_enemy()
+
+        self.assertIsNot(enemy, game_state.enemies.sprites()[0])
+        self.assertEqual(0, game_state.get_pool_stats()["enemies"]["hits"])
+
     def test_reset_game_states_resset_game_variables(self):
         self.game_state.increase_level()
         self.game_state.increase_level()
@@ -147,3 +207,21 @@ class GameStateTest(unittest.TestCase):
 
         with self.subTest(game_state="points"):
             self.assertEqual(0, self.game_state.points)
+
+    def test_spawned_enemies_are_found_by_spatial_hash_after_moving(self):
+        self.game_state.spawn_enemy()
+        enemy = self.game_state.enemies.sprites()[0]
+        for _ in range(100):
+            enemy.move()
+
+        self.assertEqual([enemy], self.game_state.enemies.query(enemy.rect))
+
+    def test_seeded_game_states_spawn_objects_identically(self):
+        positions = []
+        for _ in range(2):
+            state = GameState(1280, 720, spawn_settings=SpawnSettings(rng=random.Random(42)))
+            state.spawn_multiple_enemies(enemy_count=5, enemy_speed=1)
+            positions.append([(enemy.rect.topleft, enemy.direction_x, enemy.direction_y)
+                              for enemy in state.enemies])
+
+        self.assertEqual(positions[0], positions[1])
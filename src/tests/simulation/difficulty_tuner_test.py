@@ -0,0 +1,67 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pygame
+
+from game_engine.game_logic import PROGRESSION_OPTIONS
+from simulation.difficulty_tuner import (CandidateReport, DifficultyTuner, format_report,
+                                         play_games, summarize)
+from utilities import image_handler
+
+
+class DifficultyTunerTest(unittest.TestCase):
+
+    def setUp(self):
+        image_handler.clear_cache()
+        self.load_patcher = patch("utilities.image_handler.load_image")
+        self.load_patcher.start().side_effect = lambda *args, **kwargs: pygame.Surface((30, 40))
+
+    def tearDown(self):
+        self.load_patcher.stop()
+        image_handler.clear_cache()
+
+    def test_play_games_returns_one_outcome_per_seed(self):
+        outcomes = play_games(PROGRESSION_OPTIONS[1], 1, "chaser", range(3), max_ticks=600, fps=120)
+        self.assertEqual(3, len(outcomes))
+
+    def test_play_games_is_deterministic(self):
+        first = play_games(PROGRESSION_OPTIONS[1], 1, "cautious", range(2), max_ticks=1200, fps=120)
+        second = play_games(PROGRESSION_OPTIONS[1], 1, "cautious", range(2), max_ticks=1200, fps=120)
+        self.assertEqual(first, second)
+
+    def test_games_are_split_into_batches_for_every_candidate_and_bot(self):
+        tuner = DifficultyTuner(PROGRESSION_OPTIONS[:2], bots=["chaser", "random"], games=25)
+        jobs = tuner._jobs(batch_size=10)
+
+        self.assertEqual(2 * 2 * 3, len(jobs))
+        self.assertEqual(range(20, 25), jobs[2][4])
+
+    def test_candidates_are_ranked_by_distance_from_target(self):
+        tuner = DifficultyTuner(PROGRESSION_OPTIONS[:2], bots=["chaser"], games=2, max_ticks=300)
+        with patch("simulation.difficulty_tuner.ProcessPoolExecutor", ThreadPoolExecutor):
+            reports = tuner.run(target_seconds=2.5)
+
+        self.assertEqual(2, len(reports))
+        self.assertLessEqual(reports[0].score, reports[1].score)
+        self.assertTrue(all(report.games == 2 for report in reports))
+
+    def test_summarize_gives_percentiles(self):
+        summary = summarize(list(range(11)))
+        self.assertEqual({"mean": 5, "p10": 1, "median": 5, "p90": 9}, summary)
+
+    def test_summarize_single_value(self):
+        self.assertEqual({"mean": 3, "p10": 3, "median": 3, "p90": 3}, summarize([3]))
+
+    def test_report_lists_candidates_in_rank_order(self):
+        reports = []
+        for candidate, time in zip(PROGRESSION_OPTIONS[:2], (60000, 30000)):
+            report = CandidateReport(candidate)
+            report.add([(3, 100, time, True)])
+            report.rate(60)
+            reports.append(report)
+
+        text = format_report(reports, 60)
+        self.assertIn(f"#1 {PROGRESSION_OPTIONS[0]}", text)
+        self.assertIn(f"#2 {PROGRESSION_OPTIONS[1]}", text)
+        self.assertEqual(0.5, reports[1].score)
@@ -0,0 +1,59 @@
+import unittest
+from unittest.mock import patch
+
+import pygame
+
+from simulation.headless_runner import create_simulation
+from utilities import image_handler
+
+
+def chase_first_gem(game_state):
+    gems = game_state.gems.sprites()
+    if not gems:
+        return None
+
+    player = game_state.player.rect.center
+    target = gems[0].rect.center
+    step_x = max(-4, min(4, target[0] - player[0]))
+    step_y = max(-4, min(4, target[1] - player[1]))
+    return player[0] + step_x, player[1] + step_y
+
+
+class HeadlessRunnerTest(unittest.TestCase):
+
+    def setUp(self):
+        image_handler.clear_cache()
+        self.load_patcher = patch("utilities.image_handler.load_image")
+        self.load_patcher.start().side_effect = lambda *args, **kwargs: pygame.Surface((30, 40))
+
+    def tearDown(self):
+        self.load_patcher.stop()
+        image_handler.clear_cache()
+
+    def _run(self, seed, max_ticks=3000):
+        runner = create_simulation(seed=seed, controller=chase_first_gem)
+        result = runner.run(max_ticks)
+        return result.ticks, result.level, result.points, result.game_over
+
+    def test_same_seed_gives_the_same_result(self):
+        self.assertEqual(self._run(seed=7), self._run(seed=7))
+
+    def test_different_seeds_give_different_results(self):
+        self.assertNotEqual(self._run(seed=1), self._run(seed=2))
+
+    def test_simulation_stops_at_max_ticks(self):
+        runner = create_simulation(seed=1)
+        result = runner.run(10)
+        self.assertEqual(10, result.ticks)
+
+    def test_simulated_time_follows_the_fixed_timestep(self):
+        runner = create_simulation(seed=1, fps=100)
+        result = runner.run(50)
+        self.assertEqual(500, result.simulated_ms)
+
+    def test_simulation_runs_until_game_over(self):
+        runner = create_simulation(seed=1, lives=1)
+        result = runner.run(10 ** 6)
+
+        self.assertTrue(result.game_over)
+        self.assertLess(result.ticks, 10 ** 6)
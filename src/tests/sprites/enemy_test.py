@@ -23,7 +23,7 @@ class EnemyTest(unittest.TestCase):
         self.assertEqual((400, 420), enemy_position)
 
     def test_enemy_moves_to_correct_position(self):
-        rect_mock = self.mock_image_handler.load_image.return_value.get_rect.return_value
+        rect_mock = self.mock_image_handler.get_image.return_value.get_rect.return_value
         rect_mock.center = 420, 420
         rect_mock.centerx = 420
         rect_mock.centery = 420
@@ -58,12 +58,26 @@ class EnemyTest(unittest.TestCase):
             with self.subTest(elapsed_time=elapsed_time, expected_frame_value=expected_frame_value):
                 mock_ticks.return_value = elapsed_time
                 self.enemy.update()
-                self.assertEqual(expected_frame_value, self.enemy._current_frame)
+                self.assertEqual(expected_frame_value, self.enemy.current_frame)
 
     @patch("sprites.enemy.pygame.time.get_ticks")
     def test_enemy_doesnt_change_frame_value_if_enough_time_has_not_passed(self, mock_ticks):
-        self.enemy._current_frame = 1
-        mock_ticks.return_value = sprites.enemy.FRAME_SWAP_RATE // 2
+        swap_rate = sprites.enemy.FRAME_SWAP_RATE
+        mock_ticks.return_value = swap_rate + 1
+        self.enemy.update()
 
+        mock_ticks.return_value = swap_rate * 2 - 1
         self.enemy.update()
-        self.assertEqual(1, self.enemy._current_frame)
+        self.assertEqual(1, self.enemy.current_frame)
+
+    def test_every_enemy_shows_the_frame_of_their_shared_animation(self):
+        frames = ["frame_1", "frame_2", "frame_3"]
+        animation = sprites.enemy.EnemyAnimation()
+        shared = [sprites.Enemy(animation=animation) for _ in range(2)]
+        for enemy in shared + [self.enemy]:
+            enemy._frames = frames
+
+        animation.animate(sprites.enemy.FRAME_SWAP_RATE * 2)
+
+        self.assertEqual(["frame_3", "frame_3"], [enemy.image for enemy in shared])
+        self.assertEqual("frame_1", self.enemy.image)
@@ -30,16 +30,16 @@ class PlayerTest(unittest.TestCase):
 
     def test_update_returns_correct_value(self):
         with patch.dict(self.player._images, {
-            "right": "right_substitute",
-            "left": "left_substitute",
-            "damaged_right": "damaged_right_substitute",
-            "damaged_left": "damaged_left_substitute",
+            ("right", True): "right_substitute",
+            ("left", True): "left_substitute",
+            ("right", False): "damaged_right_substitute",
+            ("left", False): "damaged_left_substitute",
         }):
             test_cases = [
-                ("right", True, "right_substitute"),
                 ("left", True, "left_substitute"),
                 ("right", False, "damaged_right_substitute"),
                 ("left", False, "damaged_left_substitute"),
+                ("right", True, "right_substitute"),
             ]
             for direction, vulnerability, expected_substitute_image in test_cases:
                 with self.subTest(direction=direction, vulnerability=vulnerability):
@@ -51,3 +51,14 @@ class PlayerTest(unittest.TestCase):
     def test_setting_incorrect_value_in_vulnerable_raises_value_error(self):
         with self.assertRaises(ValueError):
             self.player.vulnerable = "LMAO"
+
+    def test_update_looks_up_the_image_only_after_a_change(self):
+        self.player.update()
+        with patch.dict(self.player._images, {("right", True): "right_substitute"}):
+            self.player.update()
+            self.assertNotEqual("right_substitute", self.player.image)
+
+            self.player.direction = "left"
+            self.player.direction = "right"
+            self.player.update()
+            self.assertEqual("right_substitute", self.player.image)
@@ -0,0 +1,81 @@
+import random
+import unittest
+
+import pygame
+from pygame.sprite import Group
+
+from sprites.spatial_hash import SpatialHash, spritecollide
+
+
+class StubSprite(pygame.sprite.Sprite):
+    def __init__(self, x=0, y=0, width=30, height=30):
+        super().__init__()
+        self.rect = pygame.Rect(x, y, width, height)
+
+
+class SpatialHashTest(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = random.Random(1)
+        self.sprites = [StubSprite(self.rng.randint(-40, 1300), self.rng.randint(-40, 740))
+                        for _ in range(300)]
+        self.spatial_hash = SpatialHash(*self.sprites)
+        self.group = Group(*self.sprites)
+        self.player = StubSprite(width=50, height=50)
+
+    def test_collide_matches_pygame_spritecollide(self):
+        for _ in range(200):
+            self.player.rect.center = (self.rng.randint(-60, 1340), self.rng.randint(-60, 780))
+            with self.subTest(center=self.player.rect.center):
+                expected = pygame.sprite.spritecollide(self.player, self.group, False)
+                self.assertEqual(expected, self.spatial_hash.collide(self.player))
+
+    def test_collide_with_dokill_removes_sprites(self):
+        sprite = StubSprite(100, 100)
+        spatial_hash = SpatialHash(sprite)
+        self.player.rect.topleft = (110, 110)
+
+        self.assertEqual([sprite], spatial_hash.collide(self.player, dokill=True))
+        self.assertEqual(0, len(spatial_hash))
+        self.assertEqual([], spatial_hash.query(self.player.rect))
+
+    def test_killed_sprites_are_removed_from_grid(self):
+        sprite = StubSprite(100, 100)
+        spatial_hash = SpatialHash(sprite)
+        sprite.kill()
+
+        self.assertEqual([], spatial_hash.query(sprite.rect))
+
+    def test_rehash_follows_moved_sprite(self):
+        sprite = StubSprite(100, 100)
+        spatial_hash = SpatialHash(sprite)
+        sprite.rect.topleft = (600, 400)
+        spatial_hash.rehash(sprite)
+        self.player.rect.topleft = (610, 410)
+
+        with self.subTest(position="new"):
+            self.assertEqual([sprite], spatial_hash.collide(self.player))
+
+        with self.subTest(position="old"):
+            self.assertEqual([], spatial_hash.query(pygame.Rect(100, 100, 30, 30)))
+
+    def test_border_candidates_contain_every_sprite_crossing_the_border(self):
+        expected = [sprite for sprite in self.sprites
+                    if sprite.rect.left < 0 or sprite.rect.right > 1280
+                    or sprite.rect.top < 0 or sprite.rect.bottom > 720]
+        candidates = self.spatial_hash.border_candidates(1280, 720)
+
+        for sprite in expected:
+            self.assertIn(sprite, candidates)
+
+    def test_border_candidates_skip_sprites_in_the_middle(self):
+        sprite = StubSprite(600, 300)
+        spatial_hash = SpatialHash(sprite)
+
+        self.assertEqual([], spatial_hash.border_candidates(1280, 720))
+
+    def test_spritecollide_works_with_regular_groups(self):
+        sprite = StubSprite(100, 100)
+        self.player.rect.topleft = (110, 110)
+
+        self.assertEqual([sprite], spritecollide(self.player, Group(sprite), False))
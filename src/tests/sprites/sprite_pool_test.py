@@ -0,0 +1,43 @@
+import unittest
+
+from pygame.sprite import Group, Sprite
+
+from sprites import SpritePool
+
+
+class TestSpritePool(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = SpritePool(Sprite, max_size=2)
+
+    def test_empty_pool_creates_new_sprites(self):
+        first = self.pool.acquire()
+        second = self.pool.acquire()
+
+        self.assertIsNot(first, second)
+        self.assertEqual(2, self.pool.get_stats()["misses"])
+
+    def test_released_sprite_is_reused(self):
+        sprite = self.pool.acquire()
+        self.pool.release(sprite)
+
+        self.assertIs(sprite, self.pool.acquire())
+        self.assertEqual(1, self.pool.get_stats()["hits"])
+
+    def test_released_sprite_is_removed_from_its_groups(self):
+        group = Group()
+        sprite = self.pool.acquire()
+        group.add(sprite)
+
+        self.pool.release(sprite)
+
+        self.assertEqual(0, len(group))
+        self.assertFalse(sprite.alive())
+
+    def test_full_pool_drops_released_sprites(self):
+        for _ in range(3):
+            self.pool.release(Sprite())
+
+        self.assertEqual(2, len(self.pool))
+        self.assertEqual({"hits": 0, "misses": 0, "released": 2, "free": 2},
+                         self.pool.get_stats())
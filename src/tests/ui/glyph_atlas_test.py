@@ -0,0 +1,53 @@
+import unittest
+from pathlib import Path
+from unittest.mock import Mock
+
+import pygame
+
+from ui.glyph_atlas import GlyphAtlas
+from ui.text_object import TextObject
+from utilities.constants import Folder
+
+
+class TestGlyphAtlas(unittest.TestCase):
+
+    def setUp(self):
+        pygame.font.init()
+        self.font = pygame.font.Font(Path(Folder.FONTS_DIR) / "Cinzel-Medium.ttf", 24)
+        self.atlas = GlyphAtlas(self.font, (230, 215, 165))
+
+    def test_every_glyph_is_rendered_only_once(self):
+        font = Mock(wraps=self.font)
+        atlas = GlyphAtlas(font, (230, 215, 165))
+
+        atlas.render("Points: 100")
+        atlas.render("Points: 1001")
+
+        self.assertEqual(len(set("Points: 1001")), font.render.call_count)
+
+    def test_rendered_text_matches_the_font_size(self):
+        for text in ("Points: 9001", "Level: 12", ""):
+            with self.subTest(text=text):
+                width, height = self.font.size(text)
+                surface = self.atlas.render(text)
+
+                self.assertEqual(height, surface.get_height())
+                self.assertAlmostEqual(width, surface.get_width(), delta=len(text) // 2 + 1)
+
+    def test_glyphs_are_drawn_with_the_text_color(self):
+        surface = self.atlas.render("I")
+        visible = [surface.get_at((x, y)) for x in range(surface.get_width())
+                   for y in range(surface.get_height()) if surface.get_at((x, y)).a > 0]
+
+        self.assertTrue(any(color.a == 255 for color in visible))
+        self.assertTrue(all(color[:3] == (230, 215, 165) for color in visible))
+
+    def test_text_object_uses_the_atlas(self):
+        font = Mock(wraps=self.font)
+        text_object = TextObject("Lives: 3", (230, 215, 165), font, glyph_atlas=self.atlas)
+
+        text_object.update("Lives: 2")
+
+        font.render.assert_not_called()
+        self.assertIn("2", self.atlas)
+        self.assertEqual(self.atlas.size("Lives: 2"), text_object.surface.get_size())
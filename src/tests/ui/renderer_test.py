@@ -0,0 +1,101 @@
+import unittest
+from unittest.mock import Mock, patch
+
+import pygame
+from pygame.sprite import Group, Sprite
+
+from ui.renderer import Renderer
+
+
+class RecordingSurface(pygame.Surface):
+    def __init__(self, size):
+        super().__init__(size)
+        self.blitted = []
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        self.blitted.append(source)
+        return super().blit(source, dest, area, special_flags)
+
+    def blits(self, blit_sequence, doreturn=1):
+        for blit in blit_sequence:
+            self.blit(*blit)
+
+
+class StubSprite(Sprite):
+    def __init__(self, x, y):
+        super().__init__()
+        self.image = pygame.Surface((10, 10))
+        self.rect = self.image.get_rect(topleft=(x, y))
+
+
+class TestDirtyRectRenderer(unittest.TestCase):
+
+    def setUp(self):
+        self.display = RecordingSurface((400, 400))
+        self.background = pygame.Surface((400, 400))
+        self.text = pygame.Surface((50, 20))
+        self.sprites = Group(StubSprite(x, y)
+                             for x in range(0, 400, 40) for y in range(40, 400, 40))
+
+        self.ui_manager = Mock()
+        self.ui_manager.game_state.game_over = False
+        self.ui_manager.game_state.sprites = self.sprites
+        self.ui_manager.get_renderable_surfaces.side_effect = lambda: [
+            (self.background, (0, 0)), (self.text, (0, 0))]
+        self.renderer = Renderer(self.display, self.ui_manager, dirty_rects=True)
+
+        self.update_patcher = patch("pygame.display.update")
+        self.mock_update = self.update_patcher.start()
+
+    def tearDown(self):
+        self.update_patcher.stop()
+
+    def _render_again(self):
+        self.display.blitted.clear()
+        self.mock_update.reset_mock()
+        self.renderer.render()
+
+    def test_first_frame_redraws_the_whole_screen(self):
+        self.renderer.render()
+
+        self.assertEqual([self.background, self.text], self.display.blitted)
+        self.ui_manager.draw_callbacks.assert_called_once_with(self.display)
+        self.mock_update.assert_called_once_with()
+
+    def test_unchanged_frame_draws_nothing(self):
+        self.renderer.render()
+        self._render_again()
+
+        self.assertEqual([], self.display.blitted)
+        self.mock_update.assert_not_called()
+
+    def test_dirty_path_draws_only_the_sprites_near_the_moved_sprite(self):
+        self.renderer.render()
+        moved, neighbour = self.sprites.sprites()[:2]
+        moved.rect.move_ip(2, 32)
+
+        self._render_again()
+
+        self.assertEqual([self.background, self.background, moved.image, neighbour.image],
+                         self.display.blitted)
+        self.mock_update.assert_called_once_with([pygame.Rect(0, 40, 10, 10),
+                                                  pygame.Rect(2, 72, 10, 10)])
+
+    def test_overlapping_rects_of_a_moved_sprite_are_joined(self):
+        self.renderer.render()
+        moved = self.sprites.sprites()[0]
+        moved.rect.move_ip(2, 5)
+
+        self._render_again()
+
+        self.assertEqual([self.background, moved.image], self.display.blitted)
+        self.mock_update.assert_called_once_with([pygame.Rect(0, 40, 12, 15)])
+
+    def test_changed_text_is_redrawn_with_the_sprites_under_it(self):
+        self.renderer.render()
+        self.text = pygame.Surface((50, 50))
+
+        self._render_again()
+
+        self.assertIn(self.text, self.display.blitted)
+        self.assertEqual(2, sum(sprite.image in self.display.blitted for sprite in self.sprites))
@@ -0,0 +1,80 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from utilities.chrome_trace import ChromeTraceWriter
+from utilities.frame_profiler import FrameProfiler
+
+
+class TestChromeTraceWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "traces" / "trace.json"
+        self.tracer = ChromeTraceWriter(self.path, buffer_size=4)
+
+    def tearDown(self):
+        self.tracer.close()
+        self.directory.cleanup()
+
+    def _read_events(self) -> list[dict]:
+        with open(self.path, encoding="utf-8") as file:
+            return json.load(file)
+
+    def test_closed_trace_is_a_json_array_of_complete_events(self):
+        self.tracer.add_span("logic.movement", 1.0, 1.0025)
+        self.tracer.close()
+
+        spans = [event for event in self._read_events() if event["ph"] == "X"]
+
+        self.assertEqual(1, len(spans))
+        self.assertEqual("logic.movement", spans[0]["name"])
+        self.assertEqual("logic", spans[0]["cat"])
+        self.assertAlmostEqual(2500, spans[0]["dur"], delta=0.1)
+
+    def test_events_are_written_when_the_buffer_is_full(self):
+        # The first span of a thread also adds an event naming the thread.
+        for frame in range(2):
+            self.tracer.add_span("frame", frame, frame + 0.5)
+        self.assertFalse(self.path.exists())
+
+        self.tracer.add_span("frame", 2, 2.5)
+
+        self.assertGreater(self.path.stat().st_size, 0)
+
+    def test_spans_added_after_closing_are_ignored(self):
+        self.tracer.close()
+        self.tracer.add_span("frame", 0, 1)
+
+        self.assertEqual([], self._read_events())
+
+    def test_thread_is_named_once(self):
+        for frame in range(10):
+            self.tracer.add_span("frame", frame, frame + 0.5)
+        self.tracer.close()
+
+        metadata = [event for event in self._read_events() if event["ph"] == "M"]
+
+        self.assertEqual(1, len(metadata))
+        self.assertEqual("MainThread", metadata[0]["args"]["name"])
+
+    def test_profiler_phases_are_traced(self):
+        profiler = FrameProfiler(enabled=True)
+        profiler.add_listener(self.tracer.add_span)
+
+        with profiler.phase("render"):
+            pass
+        self.tracer.close()
+
+        self.assertIn("render", [event["name"] for event in self._read_events()])
+
+    def test_close_returns_whether_the_trace_was_written(self):
+        self.assertTrue(self.tracer.close())
+        self.assertFalse(self.tracer.close())
+
+    def test_close_returns_false_if_the_file_cant_be_written(self):
+        with patch("builtins.open", side_effect=OSError("read-only file system")), \
+                patch("builtins.print"):
+            self.assertFalse(self.tracer.close())
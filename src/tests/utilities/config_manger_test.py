@@ -1,10 +1,10 @@
 import unittest
 from configparser import ConfigParser
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from utilities import constants
-from utilities.config_manager import ConfigManager
+from utilities.config_manager import ConfigManager, get_config_manager
 
 
 class TestConfigManager(unittest.TestCase):
@@ -52,3 +52,102 @@ class TestConfigManager(unittest.TestCase):
     def test_get_player_lives_returns_correct_value(self):
         lives = self.config_manager.get_player_lives()
         self.assertEqual(9, lives)
+
+    def test_vectorized_enemies_are_disabled_by_default(self):
+        self.config_manager.create_config(force=True)
+        self.assertFalse(self.config_manager.get_vectorized_enemies())
+
+    def test_dirty_rect_rendering_is_disabled_by_default(self):
+        self.config_manager.create_config(force=True)
+        self.assertFalse(self.config_manager.get_dirty_rect_rendering())
+
+    def test_glyph_atlas_text_is_disabled_by_default(self):
+        self.config_manager.create_config(force=True)
+        self.assertFalse(self.config_manager.get_glyph_atlas_text())
+
+    def test_adaptive_frame_pacing_is_disabled_by_default(self):
+        self.config_manager.create_config(force=True)
+        self.assertFalse(self.config_manager.get_adaptive_frame_pacing())
+
+    def test_frame_profiler_is_disabled_by_default(self):
+        self.config_manager.create_config(force=True)
+        self.assertFalse(self.config_manager.get_frame_profiler())
+
+    def test_chrome_trace_is_disabled_by_default(self):
+        self.config_manager.create_config(force=True)
+        self.assertFalse(self.config_manager.get_chrome_trace())
+
+    def test_window_size_and_fps_are_read_from_the_config(self):
+        self.config_manager.create_config(force=True)
+        snapshot = self.config_manager.get_snapshot()
+
+        self.assertEqual((1280, 720, 120), (snapshot.width, snapshot.height, snapshot.fps))
+
+    def _write_setting(self, section: str, option: str, value: str):
+        self.config_parser.set(section, option, value)
+        with open(self.config_ini, "w", encoding="utf-8") as configfile:
+            self.config_parser.write(configfile)
+
+    def test_file_is_parsed_once_for_every_setting(self):
+        with patch.object(ConfigParser, "read", autospec=True,
+                          side_effect=ConfigParser.read) as mock_read:
+            self.config_manager.get_database_path()
+            self.config_manager.get_difficulty()
+            self.config_manager.get_custom_difficulty_settings()
+            self.config_manager.get_player_lives()
+            self.config_manager.get_dirty_rect_rendering()
+
+        mock_read.assert_called_once()
+
+    def test_subscribers_are_notified_only_when_the_file_changes(self):
+        listener = Mock()
+        self.config_manager.subscribe(listener)
+        self.config_manager.get_snapshot()
+
+        self.assertFalse(self.config_manager.reload_if_changed())
+        listener.assert_not_called()
+
+        self._write_setting("GAME SETTINGS", "fps", "60")
+
+        self.assertTrue(self.config_manager.reload_if_changed())
+        listener.assert_called_once()
+        self.assertEqual(60, listener.call_args.args[0].fps)
+
+    def test_invalid_game_settings_use_defaults(self):
+        for value in ("0", "-30", "fast"):
+            with self.subTest(value=value):
+                self._write_setting("GAME SETTINGS", "fps", value)
+                self.assertEqual(120, self.config_manager.get_snapshot().fps)
+
+    def test_missing_performance_settings_are_disabled_silently(self):
+        self.config_manager.create_config(force=True)
+        self.config_parser.read(self.config_ini)
+        self.config_parser.remove_section("PERFORMANCE SETTINGS")
+        with open(self.config_ini, "w", encoding="utf-8") as configfile:
+            self.config_parser.write(configfile)
+
+        with patch("builtins.print") as mock_print:
+            performance = self.config_manager.get_snapshot().performance
+
+        self.assertFalse(any(performance.values()))
+        mock_print.assert_not_called()
+
+    def test_invalid_performance_setting_is_reported_and_disabled(self):
+        self._write_setting("PERFORMANCE SETTINGS", "vectorized enemies", "maybe")
+
+        with patch("builtins.print") as mock_print:
+            self.assertFalse(self.config_manager.get_vectorized_enemies())
+
+        mock_print.assert_called()
+
+    def test_vectorized_enemies_are_disabled_without_numpy(self):
+        self._write_setting("PERFORMANCE SETTINGS", "vectorized enemies", "yes")
+
+        with patch("utilities.config_manager.find_spec", return_value=None), \
+                patch("builtins.print") as mock_print:
+            self.assertFalse(self.config_manager.get_vectorized_enemies())
+
+        mock_print.assert_called_once_with("NumPy is not installed, vectorized enemies are disabled")
+
+    def test_get_config_manager_returns_a_shared_instance(self):
+        self.assertIs(get_config_manager(), get_config_manager())
@@ -0,0 +1,98 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import Mock
+
+from utilities.frame_profiler import FrameProfiler, RollingHistogram, get_profiler, profiled
+
+
+class TestRollingHistogram(unittest.TestCase):
+
+    def setUp(self):
+        self.histogram = RollingHistogram(size=100)
+        for duration in range(1, 101):
+            self.histogram.add(float(duration))
+
+    def test_percentiles_use_the_nearest_rank(self):
+        for percent, expected in ((50, 50.0), (95, 95.0), (99, 99.0), (100, 100.0)):
+            with self.subTest(percent=percent):
+                self.assertEqual(expected, self.histogram.percentile(percent))
+
+    def test_only_the_newest_durations_are_kept(self):
+        for _ in range(100):
+            self.histogram.add(1000.0)
+
+        summary = self.histogram.summary()
+
+        self.assertEqual(100, len(self.histogram))
+        self.assertEqual(200, summary["count"])
+        self.assertEqual(1000.0, summary["p50"])
+
+    def test_empty_histogram_reports_zero(self):
+        summary = RollingHistogram().summary()
+
+        self.assertEqual({"count": 0, "mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0}, summary)
+
+
+class TestFrameProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.profiler = FrameProfiler(enabled=True)
+
+    def test_phases_are_recorded_in_milliseconds(self):
+        self.profiler.record("logic", 1.0, 1.002)
+
+        self.assertAlmostEqual(2.0, self.profiler.summary()["logic"]["p50"])
+
+    def test_phase_context_manager_records_the_phase(self):
+        with self.profiler.phase("render"):
+            pass
+
+        self.assertEqual(1, self.profiler.summary()["render"]["count"])
+
+    def test_disabled_profiler_records_nothing(self):
+        self.profiler.enabled = False
+
+        with self.profiler.phase("render"):
+            pass
+
+        self.assertFalse(self.profiler.has_samples())
+
+    def test_listeners_are_called_with_every_phase(self):
+        listener = Mock()
+        self.profiler.add_listener(listener)
+
+        self.profiler.record("frame", 1.0, 1.5)
+
+        listener.assert_called_once_with("frame", 1.0, 1.5)
+
+    def test_dump_writes_the_summary_as_json(self):
+        self.profiler.record("frame", 0.0, 0.008)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "profiles" / "profile.json"
+            self.assertTrue(self.profiler.dump(path))
+            with open(path, encoding="utf-8") as file:
+                profile = json.load(file)
+
+        self.assertEqual("ms", profile["unit"])
+        self.assertAlmostEqual(8.0, profile["phases"]["frame"]["p99"])
+
+
+class TestProfiled(unittest.TestCase):
+
+    def setUp(self):
+        self.profiler = get_profiler()
+        self.profiler.enabled = True
+
+    def tearDown(self):
+        self.profiler.enabled = False
+
+    def test_decorated_function_calls_are_measured(self):
+        @profiled("test.decorated")
+        def add(first, second):
+            return first + second
+
+        self.assertEqual(3, add(1, 2))
+        self.assertEqual(1, self.profiler.summary()["test.decorated"]["count"])
@@ -0,0 +1,208 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import pygame
+
+from utilities import image_handler
+
+
+class TestImageHandlerCache(unittest.TestCase):
+
+    def setUp(self):
+        image_handler.clear_cache()
+        self.load_patcher = patch("utilities.image_handler.load_image")
+        self.mock_load = self.load_patcher.start()
+        self.mock_load.side_effect = lambda *args, **kwargs: pygame.Surface((20, 10))
+
+    def tearDown(self):
+        self.load_patcher.stop()
+        image_handler.clear_cache()
+
+    def test_same_arguments_return_the_same_surface(self):
+        first = image_handler.get_image("sapphire.png")
+        second = image_handler.get_image("sapphire.png")
+
+        self.assertIs(first, second)
+        self.mock_load.assert_called_once()
+
+    def test_cache_counts_hits_and_misses(self):
+        for _ in range(3):
+            image_handler.get_image("sapphire.png")
+        image_handler.get_image("sapphire.png", flip=True)
+
+        stats = image_handler.get_cache_stats()
+        self.assertEqual({"hits": 2, "misses": 2, "size": 2}, stats)
+
+    def test_different_arguments_create_different_surfaces(self):
+        test_cases = (
+            {"alpha": False},
+            {"size": (40, 40)},
+            {"scale": 2},
+            {"flip": True},
+            {"opacity": 128},
+        )
+        base = image_handler.get_image("sapphire.png")
+
+        for kwargs in test_cases:
+            with self.subTest(**kwargs):
+                self.assertIsNot(base, image_handler.get_image("sapphire.png", **kwargs))
+
+    def test_scale_and_opacity_are_applied(self):
+        image = image_handler.get_image("sapphire.png", scale=2, opacity=128)
+
+        self.assertEqual((40, 20), image.get_size())
+        self.assertEqual(128, image.get_alpha())
+
+    def test_clear_cache_resets_counters(self):
+        image_handler.get_image("sapphire.png")
+        image_handler.clear_cache()
+
+        self.assertEqual({"hits": 0, "misses": 0, "size": 0}, image_handler.get_cache_stats())
+
+
+class TestImageConversion(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        cls.display = pygame.display.set_mode((1280, 720))
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.display.quit()
+
+    def test_loaded_image_uses_display_pixel_format(self):
+        image = image_handler.load_image("castle_dungeon_background.png", False, (1280, 720))
+
+        self.assertEqual((1280, 720), image.get_size())
+        self.assertEqual(self.display.get_masks(), image.get_masks())
+
+    def test_alpha_image_keeps_per_pixel_transparency(self):
+        image = image_handler.load_image("sapphire.png")
+        self.assertTrue(image.get_flags() & pygame.SRCALPHA)
+
+    def test_image_is_not_converted_without_display(self):
+        image = pygame.Surface((10, 10), depth=24)
+        with patch("pygame.display.get_surface", return_value=None):
+            self.assertIs(image, image_handler.convert_image(image))
+
+    def test_get_image_returns_surface_in_display_format(self):
+        image_handler.clear_cache()
+        image = image_handler.get_image("castle_dungeon_background.png", False, (1280, 720))
+        image_handler.clear_cache()
+
+        self.assertEqual(self.display.get_bitsize(), image.get_bitsize())
+        self.assertEqual(self.display.get_masks(), image.get_masks())
+
+    def test_every_get_image_path_returns_surface_in_display_format(self):
+        alpha_format = pygame.Surface((1, 1)).convert_alpha()
+        test_cases = (
+            ("sapphire.png", {}, alpha_format),
+            ("sapphire.png", {"size": (20, 20)}, alpha_format),
+            ("sapphire.png", {"scale": 0.5}, alpha_format),
+            ("sapphire.png", {"flip": True}, alpha_format),
+            ("sapphire.png", {"opacity": 128}, alpha_format),
+            ("sapphire.png", {"alpha": False}, self.display),
+            ("sapphire.png", {"alpha": False, "size": (20, 20), "opacity": 128}, self.display),
+            ("castle_dungeon_background.png",
+             {"alpha": False, "size": (64, 36), "disk_cache": True}, self.display),
+        )
+
+        with tempfile.TemporaryDirectory() as cache_dir, \
+                patch("utilities.image_handler.IMAGE_CACHE_DIR", cache_dir):
+            for filename, kwargs, expected in test_cases:
+                with self.subTest(filename=filename, **kwargs):
+                    for _ in range(2):
+                        image_handler.clear_cache()
+                        image = image_handler.get_image(filename, **kwargs)
+
+                        self.assertEqual(expected.get_bitsize(), image.get_bitsize())
+                        self.assertEqual(expected.get_masks(), image.get_masks())
+        image_handler.clear_cache()
+
+
+class TestDiskCache(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        directory = Path(self.temporary_directory.name)
+        self.images_dir = directory / "images"
+        self.cache_dir = directory / "cache"
+        self.images_dir.mkdir()
+        self._save_image((200, 50, 25))
+
+        self.patchers = [patch("utilities.image_handler.IMAGES_DIR", str(self.images_dir)),
+                         patch("utilities.image_handler.IMAGE_CACHE_DIR", str(self.cache_dir))]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+        self.temporary_directory.cleanup()
+
+    def _save_image(self, color, filename="background.png"):
+        image = pygame.Surface((40, 20))
+        image.fill(color)
+        pygame.image.save(image, str(self.images_dir / filename))
+
+    def _cache_files(self):
+        return sorted(path.name for path in self.cache_dir.iterdir())
+
+    def test_first_load_writes_the_scaled_image_to_the_cache(self):
+        image = image_handler.load_cached_image("background.png", (20, 10))
+
+        self.assertEqual((20, 10), image.get_size())
+        self.assertEqual(1, len(self._cache_files()))
+        self.assertTrue(self._cache_files()[0].startswith("background-20x10-"))
+
+    def test_cached_image_is_loaded_without_decoding(self):
+        first = image_handler.load_cached_image("background.png", (20, 10))
+        with patch("pygame.image.load") as mock_load:
+            second = image_handler.load_cached_image("background.png", (20, 10))
+
+        mock_load.assert_not_called()
+        self.assertEqual(pygame.image.tobytes(first, "RGB"), pygame.image.tobytes(second, "RGB"))
+
+    def test_changed_source_or_size_invalidates_the_cache(self):
+        image_handler.load_cached_image("background.png", (20, 10))
+        original = self._cache_files()
+        test_cases = (
+            ("size", lambda: None, (30, 15)),
+            ("content", lambda: self._save_image((10, 20, 30)), (30, 15)),
+        )
+
+        for name, change, size in test_cases:
+            with self.subTest(name):
+                change()
+                image = image_handler.load_cached_image("background.png", size)
+
+                self.assertEqual(1, len(self._cache_files()))
+                self.assertNotEqual(original, self._cache_files())
+                self.assertEqual(size, image.get_size())
+                original = self._cache_files()
+
+        self.assertEqual((10, 20, 30, 255), tuple(image.get_at((0, 0))))
+
+    def test_images_with_a_common_stem_keep_their_own_cache_files(self):
+        self._save_image((10, 20, 30), "background-night.png")
+        image_handler.load_cached_image("background-night.png", (20, 10))
+        image_handler.load_cached_image("background.png", (20, 10))
+        image_handler.load_cached_image("background.png", (30, 15))
+
+        cache_files = self._cache_files()
+        self.assertEqual(2, len(cache_files))
+        self.assertTrue(cache_files[0].startswith("background-30x15-"))
+        self.assertTrue(cache_files[1].startswith("background-night-20x10-"))
+
+    def test_broken_cache_file_is_replaced(self):
+        image_handler.load_cached_image("background.png", (20, 10))
+        cache_file = self.cache_dir / self._cache_files()[0]
+        cache_file.write_bytes(b"broken")
+
+        image = image_handler.load_cached_image("background.png", (20, 10))
+
+        self.assertEqual((200, 50, 25, 255), tuple(image.get_at((0, 0))))
+        self.assertEqual(20 * 10 * 4, cache_file.stat().st_size)
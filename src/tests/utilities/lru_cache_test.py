@@ -0,0 +1,43 @@
+import unittest
+
+from utilities.lru_cache import LRUCache
+
+
+class TestLRUCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = LRUCache(max_size=3)
+        for key in range(3):
+            self.cache.put(key, str(key))
+
+    def test_get_returns_cached_value_or_default(self):
+        self.assertEqual("1", self.cache.get(1))
+        self.assertIsNone(self.cache.get(5))
+        self.assertEqual("default", self.cache.get(5, "default"))
+
+    def test_least_recently_used_entry_is_evicted_when_full(self):
+        self.cache.put(3, "3")
+
+        self.assertEqual(3, len(self.cache))
+        self.assertNotIn(0, self.cache)
+
+    def test_reading_an_entry_keeps_it_in_the_cache(self):
+        self.cache.get(0)
+        self.cache.put(3, "3")
+
+        self.assertIn(0, self.cache)
+        self.assertNotIn(1, self.cache)
+
+    def test_remove_where_removes_matching_keys(self):
+        removed = self.cache.remove_where(lambda key: key >= 1)
+
+        self.assertEqual(2, removed)
+        self.assertEqual(1, len(self.cache))
+        self.assertIn(0, self.cache)
+
+    def test_pop_and_clear_remove_entries(self):
+        self.assertEqual("2", self.cache.pop(2))
+        self.assertIsNone(self.cache.pop(2))
+
+        self.cache.clear()
+        self.assertEqual(0, len(self.cache))
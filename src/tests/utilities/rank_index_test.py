@@ -0,0 +1,95 @@
+import random
+import threading
+import unittest
+from bisect import bisect_left
+from unittest.mock import patch
+
+from utilities.rank_index import RankIndex, RankIndexLoader
+
+
+class TestRankIndex(unittest.TestCase):
+
+    def test_rank_counts_the_smaller_values(self):
+        index = RankIndex([5, 1, 3, 3, 9])
+
+        for value, expected_rank in ((0, 0), (1, 0), (3, 1), (4, 3), (9, 4), (10, 5)):
+            with self.subTest(value=value):
+                self.assertEqual(expected_rank, index.rank(value))
+
+    def test_empty_index_ranks_everything_first(self):
+        index = RankIndex()
+
+        self.assertEqual(0, len(index))
+        self.assertEqual(0, index.rank(42))
+
+    def test_ranks_match_a_sorted_list_after_inserts_split_blocks(self):
+        rng = random.Random(0)
+        index = RankIndex(block_size=4)
+        values = []
+
+        for _ in range(500):
+            value = rng.randint(-1000, 1000)
+            index.add(value)
+            values.append(value)
+
+        values.sort()
+        self.assertEqual(500, len(index))
+        for value in range(-1001, 1002, 7):
+            self.assertEqual(bisect_left(values, value), index.rank(value))
+
+    def test_removing_values_keeps_the_ranks_of_the_others(self):
+        rng = random.Random(1)
+        values = [rng.randint(-100, 100) for _ in range(200)]
+        index = RankIndex(values, block_size=4)
+
+        for value in values[::2]:
+            self.assertTrue(index.remove(value))
+            values.remove(value)
+
+        values.sort()
+        self.assertFalse(index.remove(1000))
+        self.assertEqual(100, len(index))
+        for value in range(-101, 102, 3):
+            self.assertEqual(bisect_left(values, value), index.rank(value))
+
+
+class TestRankIndexLoader(unittest.TestCase):
+
+    def test_rank_is_unknown_until_the_index_is_loaded(self):
+        release = threading.Event()
+
+        def load():
+            release.wait()
+            return [1, 2, 3]
+
+        loader = RankIndexLoader(load)
+        self.assertIsNone(loader.rank(2))
+
+        release.set()
+        self.assertTrue(loader.wait(5))
+        self.assertEqual(1, loader.rank(2))
+
+    def test_values_added_while_loading_are_counted_once(self):
+        release = threading.Event()
+
+        def load():
+            release.wait()
+            # 20 was saved before the values were read, 30 only after.
+            return [10, 20]
+
+        loader = RankIndexLoader(load)
+        loader.add(20)
+        loader.add(30)
+        release.set()
+        loader.wait(5)
+        loader.add(40)
+
+        self.assertEqual([0, 1, 2, 3, 4], [loader.rank(value) for value in (10, 20, 30, 40, 50)])
+
+    def test_failed_load_is_reported(self):
+        with patch("builtins.print") as mock_print:
+            loader = RankIndexLoader(lambda: 1 / 0)
+            self.assertFalse(loader.wait(5))
+
+        mock_print.assert_called_once()
+        self.assertIsNone(loader.rank(1))
@@ -1,12 +1,26 @@
+import sqlite3
+import tempfile
+import threading
 import unittest
 from datetime import datetime, timedelta
+from functools import partial
+from pathlib import Path
 from unittest.mock import Mock, patch
 
+import initialize_database
+
 from database.score_service import ScoreService
+from database.score_writer import ScoreWriter
+from utilities.constants import ScoreView
 from utilities.score import Score
 from utilities.score_manager import ScoreManager
 
 
+def _count_rank(score_list, points, time):
+    return 1 + sum(stored_points > points or (stored_points == points and stored_time < time)
+                   for _, _, stored_points, stored_time in score_list)
+
+
 class TestScoreManager(unittest.TestCase):
 
     def setUp(self):
@@ -21,38 +35,276 @@ class TestScoreManager(unittest.TestCase):
 
         self.score_service = Mock(spec=ScoreService)
         self.score_service.get_scores.return_value = self.score_list
+        self.score_service.count_scores.return_value = len(self.score_list)
+        self.score_service.get_rank.side_effect = partial(_count_rank, self.score_list)
         self.score_manager = ScoreManager(self.score_service)
 
-    def test_score_manager_creates_correct_list_upon_initialization(self):
+    def test_get_scores_returns_every_score_from_the_service(self):
         score_object_list = [Score(val[0], val[1], val[2], val[3]) for val in self.score_list]
 
         self.assertEqual(score_object_list, self.score_manager.get_scores())
 
     def test_score_manager_works_fine_with_an_empty_list(self):
         self.score_service.get_scores.return_value = []
+        self.score_service.count_scores.return_value = 0
         score_manager = ScoreManager(self.score_service)
 
         self.assertEqual([], score_manager.get_scores())
+        self.assertEqual([], score_manager.get_page(0))
+
+    def test_scores_are_not_fetched_on_initialization(self):
+        self.score_service.get_scores.assert_not_called()
+        self.score_service.get_page.assert_not_called()
 
     def test_score_doesnt_get_added_if_points_are_less_than_1(self):
         self.score_manager.add_score("Jake", 1, 0)
-        self.assertEqual(4, len(self.score_manager.get_scores()))
+        self.score_service.add_new_score.assert_not_called()
+        self.assertEqual(4, self.score_manager.count())
 
-    def test_scores_get_added_in_correct_order(self):
-        test_cases = (
-            ("Lake-less", 420, 8000, 4),
-            ("Make-more", 420, 9001, 2),
-            ("Jake-more", 420, 9002, 0),
-        )
+    def test_adding_score_increases_count(self):
+        self.score_manager.count()
+        self.score_manager.add_score("Fake", 0, 8999)
 
-        for name, level, points, index in test_cases:
-            with self.subTest(expected_name=name):
-                self.score_manager.add_score(name, level, points)
-                score = self.score_manager.get_scores()[index]
-                self.assertEqual(name, score.name)
+        self.assertEqual(5, self.score_manager.count())
+        self.score_service.count_scores.assert_called_once()
 
     def test_add_score_service_add_new_score_gets_called_with_correct_parameters(self):
         with patch("utilities.score_manager.datetime") as mock_datetime:
             mock_datetime.now.return_value = self.date
             self.score_manager.add_score("Fake", 0, 8999)
             self.score_service.add_new_score.assert_called_once_with("Fake", 0, 8999, self.date)
+
+    def test_get_page_seeks_from_neighbouring_pages(self):
+        self.score_service.count_scores.return_value = 4
+        self.score_service.get_page.side_effect = lambda after, limit: (
+            self.score_list[:2] if after is None else self.score_list[2:])
+        self.score_service.get_page_before.side_effect = lambda before, limit: (
+            self.score_list[2:] if before is None else self.score_list[:2])
+
+        self.assertEqual("Take", self.score_manager.get_page(0, 2)[1].name)
+        self.assertEqual("Make", self.score_manager.get_page(1, 2)[0].name)
+        self.score_service.get_page.assert_called_with((9001, str(self.date)), 2)
+
+        self.score_manager.add_score("Fake", 0, 1)
+        self.score_service.count_scores.return_value = 5
+        self.score_manager.get_page(1, 2)
+        self.score_service.get_page_before.assert_not_called()
+
+    def test_adding_score_forgets_only_the_pages_it_moves(self):
+        self.score_service.get_page.side_effect = lambda after, limit: (
+            self.score_list[:2] if after is None else self.score_list[2:])
+        self.score_manager.get_page(0, 2)
+        self.score_manager.get_page(1, 2)
+
+        self.score_manager.add_score("Fake", 0, 9000)
+        self.score_service.count_scores.return_value = 5
+        self.score_service.get_page.reset_mock()
+        self.score_manager.get_page(1, 2)
+
+        self.score_service.get_page.assert_called_once_with((9001, str(self.date)), 2)
+        self.score_service.get_page_before.assert_not_called()
+
+    def test_listeners_are_called_with_the_rank_of_the_added_score(self):
+        listener = Mock()
+        self.score_manager.add_listener(listener)
+
+        with patch("utilities.score_manager.datetime") as mock_datetime:
+            mock_datetime.now.return_value = self.date - timedelta(days=1)
+            self.score_manager.add_score("Fake", 0, 9001)
+        self.score_manager.add_score("Jake", 1, 0)
+
+        listener.assert_called_once_with(2)
+
+    def test_last_page_is_fetched_from_the_end(self):
+        self.score_service.get_page_before.return_value = self.score_list[3:]
+
+        scores = self.score_manager.get_page(1, 3)
+
+        self.score_service.get_page_before.assert_called_once_with(None, 1)
+        self.assertEqual(["Lake"], [score.name for score in scores])
+
+    def test_pages_outside_the_list_are_empty(self):
+        for page in (-1, 2):
+            with self.subTest(page=page):
+                self.assertEqual([], self.score_manager.get_page(page, 2))
+
+    def test_get_rank_uses_points_and_time_of_the_score(self):
+        test_cases = [
+            (9002, self.date, 1),
+            (9001, self.date - timedelta(days=1), 2),
+            (9001, self.date, 2),
+            (9000, self.date + timedelta(seconds=1), 5),
+            (100, self.date, 5),
+        ]
+        for points, time, expected_rank in test_cases:
+            with self.subTest(points=points, time=time):
+                score = Score("Fake", 1, points, str(time))
+                self.assertEqual(expected_rank, self.score_manager.get_rank(score))
+
+    def test_rank_is_counted_by_the_database_without_reading_every_score(self):
+        score = Score("Take", 1, 9001, str(self.date))
+
+        self.assertEqual(2, self.score_manager.get_rank(score))
+        self.score_service.get_rank.assert_called_once_with(9001, score.time)
+        self.score_service.get_score_keys.assert_not_called()
+
+
+class TestScoreManagerWithWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.date = datetime.now()
+        self.score_list = [
+            ("Jake", 0, 9001, str(self.date - timedelta(days=2))),
+            ("Lake", 3, 9000, str(self.date)),
+        ]
+
+        self.score_service = Mock(spec=ScoreService)
+        self.score_service.get_scores.return_value = self.score_list
+        self.score_service.count_scores.return_value = len(self.score_list)
+        self.score_service.get_page.side_effect = lambda after, limit: self.score_list[:limit]
+        self.score_service.get_rank.side_effect = partial(_count_rank, self.score_list)
+        self.score_writer = Mock(spec=ScoreWriter)
+        self.score_manager = ScoreManager(self.score_service, self.score_writer)
+
+    def test_new_score_is_submitted_to_the_writer(self):
+        with patch("utilities.score_manager.datetime") as mock_datetime:
+            mock_datetime.now.return_value = self.date
+            self.score_manager.add_score("Fake", 0, 8999)
+
+        self.score_writer.submit.assert_called_once_with("Fake", 0, 8999, self.date)
+        self.score_service.add_new_score.assert_not_called()
+
+    def test_pending_score_is_shown_right_away(self):
+        self.score_manager.add_score("Fake", 0, 9000)
+
+        page = self.score_manager.get_page(0)
+        self.assertEqual(["Jake", "Lake", "Fake"], [score.name for score in page])
+        self.assertEqual(3, self.score_manager.count())
+
+    def test_written_score_is_not_shown_twice(self):
+        self.score_manager.add_score("Fake", 0, 9000)
+        listener = self.score_writer.add_listener.call_args.args[0]
+        pending = self.score_manager.get_scores()[-1]
+
+        self.score_list.append(pending.tuple)
+        listener([(pending.name, pending.level, pending.points, pending.time)])
+
+        self.assertEqual(3, len(self.score_manager.get_page(0)))
+        self.assertEqual(3, len(self.score_manager.get_scores()))
+
+    def test_score_that_failed_to_save_is_no_longer_pending(self):
+        self.score_manager.add_score("Fake", 0, 9000)
+        listener = self.score_writer.add_failure_listener.call_args.args[0]
+        pending = self.score_manager.get_scores()[-1]
+
+        listener([(pending.name, pending.level, pending.points, pending.time)])
+
+        self.assertEqual(["Jake", "Lake"],
+                         [score.name for score in self.score_manager.get_scores()])
+
+    def test_views_are_read_with_one_query_each(self):
+        self.score_service.get_player_bests.return_value = self.score_list
+        self.score_service.get_daily_top.return_value = self.score_list[1:]
+        self.score_service.get_weekly_top.return_value = self.score_list
+        today = self.date.date()
+        test_cases = (
+            (ScoreView.PLAYER_BESTS, self.score_service.get_player_bests, (5,)),
+            (ScoreView.TODAY, self.score_service.get_daily_top, (today, 5)),
+            (ScoreView.THIS_WEEK, self.score_service.get_weekly_top,
+             (today - timedelta(days=today.weekday()), 5)),
+        )
+
+        for view, query, arguments in test_cases:
+            with self.subTest(view=view):
+                scores = self.score_manager.get_view(view, 5)
+                query.assert_called_once_with(*arguments)
+                self.assertEqual([Score(*row) for row in query.return_value], scores)
+
+    def test_all_time_view_is_the_first_page(self):
+        self.assertEqual(self.score_manager.get_page(0, 1),
+                         self.score_manager.get_view(ScoreView.ALL_TIME, 1))
+
+    def test_pending_scores_are_merged_into_views(self):
+        self.score_service.get_player_bests.return_value = self.score_list
+        self.score_service.get_daily_top.return_value = self.score_list[1:]
+        self.score_manager.add_score("Lake", 1, 9500)
+        self.score_manager.add_score("Jake", 1, 10)
+
+        bests = self.score_manager.get_view(ScoreView.PLAYER_BESTS)
+        today = self.score_manager.get_view(ScoreView.TODAY, 2)
+
+        self.assertEqual([("Lake", 9500), ("Jake", 9001)],
+                         [(score.name, score.points) for score in bests])
+        self.assertEqual([("Lake", 9500), ("Lake", 9000)],
+                         [(score.name, score.points) for score in today])
+
+    def test_rank_counts_pending_scores_before_the_score(self):
+        self.score_manager.add_score("Fake", 0, 9500)
+
+        self.assertEqual(3, self.score_manager.get_rank(Score("Take", 0, 9000, str(self.date))))
+
+
+class TestScoreManagerRankIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.database = Path(self.temporary_directory.name) / "test.db"
+        self.connection = sqlite3.connect(self.database)
+        initialize_database.create_schema(self.connection)
+        self.date = datetime(2025, 1, 1, 12)
+        self.score_service = ScoreService(self.connection)
+        self.score_service.add_new_scores(
+            [(f"player_{i}", 1, i * 10, self.date + timedelta(minutes=i)) for i in range(1, 21)])
+
+    def tearDown(self):
+        self.connection.close()
+        self.temporary_directory.cleanup()
+
+    def _score_manager(self, load_started=None, release=None):
+        def connect():
+            if load_started is not None:
+                load_started.set()
+                release.wait()
+            return sqlite3.connect(self.database)
+
+        return ScoreManager(self.score_service, connect=connect)
+
+    def test_ranks_are_read_from_the_loaded_index(self):
+        score_manager = self._score_manager()
+        self.assertTrue(score_manager._ranks.wait(5))
+
+        with patch.object(self.score_service, "get_rank") as mock_get_rank:
+            rank = score_manager.get_rank(Score("Fake", 1, 105, str(self.date)))
+
+        self.assertEqual(11, rank)
+        mock_get_rank.assert_not_called()
+
+    def test_scores_added_while_loading_are_counted_once(self):
+        load_started, release = threading.Event(), threading.Event()
+        score_manager = self._score_manager(load_started, release)
+        load_started.wait(5)
+
+        score_manager.add_score("Fake", 1, 1000)
+        self.assertEqual(2, score_manager.get_rank(Score("Fake", 1, 999, str(self.date))))
+
+        release.set()
+        self.assertTrue(score_manager._ranks.wait(5))
+        self.assertEqual(2, score_manager.get_rank(Score("Fake", 1, 999, str(self.date))))
+
+    def test_score_that_failed_to_save_is_removed_from_the_count_and_ranks(self):
+        score_writer = ScoreWriter(partial(sqlite3.connect, self.database))
+        score_manager = ScoreManager(self.score_service, score_writer,
+                                     partial(sqlite3.connect, self.database))
+        self.assertTrue(score_manager._ranks.wait(5))
+
+        with patch.object(ScoreService, "add_new_scores",
+                          side_effect=sqlite3.OperationalError("disk I/O error")), \
+                patch("builtins.print"):
+            score_manager.add_score("Fake", 1, 1000)
+            score_writer.flush()
+        score_writer.close()
+
+        self.assertEqual(21, score_manager._count)
+        self.assertEqual(20, score_manager.count())
+        self.assertEqual(2, score_manager.page_count())
+        self.assertEqual(1, score_manager.get_rank(Score("Fake", 1, 999, str(self.date))))
@@ -1,7 +1,7 @@
 import unittest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
-from utilities.score import Score
+from utilities.score import Score, to_timestamp
 
 
 class TestScore(unittest.TestCase):
@@ -60,3 +60,20 @@ class TestScore(unittest.TestCase):
         earlier_time = self.time - timedelta(seconds=1)
         earlier_score = Score("Bester Tester", 2, 100, str(earlier_time))
         self.assertLess(earlier_score, self.score)
+
+    def test_time_is_stored_as_an_integer_timestamp(self):
+        score = Score("Tester Bester", 1, 100, datetime(1970, 1, 1, 0, 0, 1, 5))
+
+        self.assertEqual(1_000_005, score.timestamp)
+        self.assertEqual("1970-01-01 00:00:01.000005", score.time)
+
+    def test_time_with_a_timezone_is_converted_to_local_time(self):
+        aware = datetime(2025, 1, 1, 12, tzinfo=timezone(timedelta(hours=2)))
+        local = aware.astimezone().replace(tzinfo=None)
+
+        for time in (aware, aware.isoformat()):
+            with self.subTest(time=time):
+                self.assertEqual(to_timestamp(local), to_timestamp(time))
+
+    def test_score_has_no_instance_dictionary(self):
+        self.assertFalse(hasattr(self.score, "__dict__"))
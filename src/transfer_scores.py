@@ -0,0 +1,66 @@
+import argparse
+import gzip
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, TextIO
+
+from database.database_connection import get_database_connection
+from database.migrations import migrate
+from database.score_transfer import export_scores, import_scores
+
+if TYPE_CHECKING:
+    from sqlite3 import Connection
+
+
+def _parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Export the score database to a newline-delimited JSON file "
+                    "or import the scores of such a file.")
+    parser.add_argument("command", choices=["export", "import"])
+    parser.add_argument("path", type=Path,
+                        help="score file, compressed with gzip if it ends with .gz")
+    return parser.parse_args()
+
+
+def _open(path: Path, mode: str) -> TextIO:
+    """Opens the score file as text, through gzip if the file name ends with .gz."""
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8", newline="\n")
+
+
+def _transfer(connection: "Connection", command: str, path: Path) -> int:
+    """Exports or imports the scores and returns the number of transferred rows."""
+    if command == "export":
+        with _open(path, "w") as file:
+            return export_scores(connection, file)
+    with _open(path, "r") as file:
+        return import_scores(connection, file)
+
+
+def transfer_scores():
+    arguments: argparse.Namespace = _parse_arguments()
+    connection: "Connection" = get_database_connection()
+    if not migrate(connection):
+        connection.close()
+        sys.exit(1)
+
+    start: float = time.perf_counter()
+    try:
+        rows: int = _transfer(connection, arguments.command, arguments.path)
+    except (OSError, ValueError, sqlite3.Error) as error:
+        print(f"Could not {arguments.command} the scores: {error}")
+        sys.exit(1)
+    finally:
+        connection.close()
+    elapsed: float = time.perf_counter() - start
+
+    action: str = "Exported" if arguments.command == "export" else "Imported"
+    print(f"{action} {rows} scores in {elapsed:.2f} s "
+          f"({rows / max(elapsed, 1e-9):.0f} rows per second)")
+
+
+if __name__ == "__main__":
+    transfer_scores()
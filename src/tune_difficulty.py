@@ -0,0 +1,74 @@
+import argparse
+import json
+from pathlib import Path
+
+from game_engine.game_logic import PROGRESSION_OPTIONS, ProgressionLogic
+from simulation.bots import BOTS
+from simulation.difficulty_tuner import CandidateReport, DifficultyTuner, format_report
+from utilities.config_manager import ConfigManager, get_config_manager
+from utilities.constants import Difficulty
+
+
+def _parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Rank progression logic tables by playing headless games with bots.")
+    parser.add_argument("--candidates", type=Path,
+                        help="JSON file with a list of progression logic tables, "
+                             "defaults to the built-in tables and the custom difficulty table "
+                             "of the configuration file")
+    parser.add_argument("--difficulty", default="MEDIUM",
+                        choices=[difficulty.name for difficulty in Difficulty
+                                 if difficulty != Difficulty.CUSTOM],
+                        help="difficulty whose lives and point multiplier are used")
+    parser.add_argument("--bots", nargs="+", default=list(BOTS), choices=list(BOTS))
+    parser.add_argument("--games", type=int, default=200,
+                        help="games played by each bot with each table")
+    parser.add_argument("--minutes", type=float, default=5,
+                        help="maximum game time of a single game in minutes")
+    parser.add_argument("--target", type=float, default=120,
+                        help="wanted median time-to-death in seconds")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument("--workers", type=int, help="worker processes, defaults to CPU count")
+    parser.add_argument("--output", type=Path, help="file the ranked report is written to")
+    return parser.parse_args()
+
+
+def _load_candidates(path: Path | None) -> list[ProgressionLogic]:
+    """Loads the candidate tables from a JSON file.
+
+    Without a file, returns the unique built-in tables and the custom difficulty table of
+    the configuration file if it is valid.
+    """
+    if path is None:
+        config: ConfigManager = get_config_manager()
+        config.create_config()
+        custom: ProgressionLogic | None = config.get_custom_difficulty_settings()
+        tables: list[ProgressionLogic] = list(PROGRESSION_OPTIONS)
+        if custom is not None:
+            tables.append(custom)
+        return list(dict.fromkeys(tables))
+
+    with open(path, encoding="utf-8") as file:
+        tables: list = json.load(file)
+    return [tuple(tuple(pair) for pair in table) for table in tables]
+
+
+def tune_difficulty():
+    arguments: argparse.Namespace = _parse_arguments()
+    fps: int = 120
+
+    tuner = DifficultyTuner(_load_candidates(arguments.candidates),
+                            difficulty=Difficulty[arguments.difficulty], bots=arguments.bots,
+                            games=arguments.games, max_ticks=round(arguments.minutes * 60 * fps),
+                            fps=fps, seed=arguments.seed, workers=arguments.workers)
+    reports: list[CandidateReport] = tuner.run(arguments.target)
+    report: str = format_report(reports, arguments.target)
+
+    print(report)
+    if arguments.output:
+        arguments.output.write_text(report + "\n", encoding="utf-8")
+        print(f"Report written to {arguments.output}")
+
+
+if __name__ == "__main__":
+    tune_difficulty()
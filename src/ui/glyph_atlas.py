@@ -0,0 +1,104 @@
+import pygame
+from pygame import Rect, Surface
+from pygame.font import Font
+
+from utilities import image_handler
+
+
+class GlyphAtlas:
+    """Draws text by blitting pre-rendered glyphs instead of rendering the whole string.
+
+    Every character is rendered with the font only once, the first time it is drawn, and
+    stored side by side in a single atlas surface. Strings are drawn by blitting the
+    glyphs of their characters from the atlas next to each other.
+
+    Glyphs are placed by the whole pixel advance of their character and kerning between
+    character pairs isn't applied, so text can be a few pixels narrower than the same
+    text drawn with Font.render. The difference isn't visible in the game.
+
+    Attributes:
+        _font: The font the glyphs are rendered with.
+        _color: The color of the glyphs.
+        _atlas: Surface holding every rendered glyph side by side.
+        _glyphs: Dictionary mapping characters to the area of their glyph in the atlas and
+            the advance of the character.
+    """
+
+    def __init__(self, font: Font, color: tuple[int, int, int]):
+        """Initializes an empty atlas.
+
+        Args:
+            font: The font the glyphs are rendered with.
+            color: The color of the glyphs.
+        """
+        self._font: Font = font
+        self._color: tuple[int, int, int] = color
+        self._atlas: Surface = Surface((0, font.get_height()), pygame.SRCALPHA)
+        self._glyphs: dict[str, tuple[Rect, int]] = {}
+
+    @property
+    def height(self) -> int:
+        return self._atlas.get_height()
+
+    def __contains__(self, character: str) -> bool:
+        return character in self._glyphs
+
+    def _add_glyphs(self, text: str):
+        """Renders the characters of the text that aren't in the atlas yet and adds them to it."""
+        glyphs: list[tuple[str, Surface]] = [
+            (character, self._font.render(character, True, self._color))
+            for character in dict.fromkeys(text) if character not in self._glyphs]
+        if not glyphs:
+            return
+
+        x: int = self._atlas.get_width()
+        width: int = x + sum(glyph.get_width() for _, glyph in glyphs)
+        height: int = max([self._atlas.get_height()] + [glyph.get_height() for _, glyph in glyphs])
+
+        atlas: Surface = Surface((width, height), pygame.SRCALPHA)
+        atlas.blit(self._atlas, (0, 0))
+        for character, glyph in glyphs:
+            atlas.blit(glyph, (x, 0))
+            metrics: list = self._font.metrics(character)
+            advance: int = metrics[0][4] if metrics and metrics[0] else glyph.get_width()
+            self._glyphs[character] = (Rect(x, 0, glyph.get_width(), glyph.get_height()), advance)
+            x += glyph.get_width()
+
+        self._atlas = image_handler.convert_image(atlas, alpha=True)
+
+    def _layout(self, text: str) -> tuple[list[tuple[int, Rect]], int]:
+        """Returns the x-coordinate and atlas area of every glyph and the width of the text."""
+        self._add_glyphs(text)
+
+        x: int = 0
+        width: int = 0
+        glyphs: list[tuple[int, Rect]] = []
+        for character in text:
+            area, advance = self._glyphs[character]
+            glyphs.append((x, area))
+            width = max(width, x + area.width)
+            x += advance
+        return glyphs, width
+
+    def size(self, text: str) -> tuple[int, int]:
+        """Returns the width and height of the surface the text would be drawn on."""
+        return self._layout(text)[1], self.height
+
+    def render(self, text: str) -> Surface:
+        """Draws the text on a new transparent surface.
+
+        Args:
+            text: The text to be drawn.
+
+        Returns:
+            A surface with per pixel alpha, sized to fit the text.
+        """
+        glyphs, width = self._layout(text)
+        surface: Surface = Surface((width, self.height), pygame.SRCALPHA)
+        # The new surface is fully transparent black, so taking the maximum of each channel
+        # copies the glyphs as they are instead of blending their antialiased edges
+        # towards black. Overlapping glyph edges keep the more opaque pixel.
+        surface.blits([(self._atlas, (x, 0), area, pygame.BLEND_RGBA_MAX)
+                       for x, area in glyphs], doreturn=False)
+
+        return surface
@@ -0,0 +1,98 @@
+import pygame
+from pygame import Surface
+from pygame.font import Font
+
+from ui.text_object import TextObject
+from utilities.frame_profiler import FrameProfiler
+
+REFRESH_INTERVAL: int = 500
+"""Milliseconds between updates of the overlay text."""
+
+TEXT_COLOR: tuple[int, int, int] = (230, 215, 165)
+BACKGROUND_COLOR: tuple[int, int, int, int] = (0, 0, 0, 170)
+MARGIN: int = 8
+
+
+class PerformanceOverlay:
+    """Shows the p50, p95 and p99 durations of every frame phase on top of the game.
+
+    The text is updated only once every REFRESH_INTERVAL milliseconds, so the overlay
+    itself doesn't noticeably change the frame times it shows.
+
+    Attributes:
+        visible: Whether the overlay is drawn.
+        _profiler: The profiler whose phases are shown.
+        _font: The font the text is drawn with.
+        _lines: Text objects holding the title and a line for every phase.
+        _background: Translucent panel drawn behind the text.
+        _refreshed: Time of the previous text update in milliseconds, or None.
+        _enabled_profiler: Whether showing the overlay enabled the profiler, in which case
+            hiding it disables the profiler again.
+    """
+
+    def __init__(self, profiler: FrameProfiler, font: Font):
+        """Initializes a hidden overlay.
+
+        Args:
+            profiler: The profiler whose phases are shown.
+            font: The font the text is drawn with. A monospace font keeps the columns
+                aligned.
+        """
+        self.visible: bool = False
+        self._profiler: FrameProfiler = profiler
+        self._font: Font = font
+        self._lines: list[TextObject] = []
+        self._background: Surface = Surface((0, 0))
+        self._refreshed: int | None = None
+        self._enabled_profiler: bool = False
+
+    def toggle(self):
+        """Shows or hides the overlay.
+
+        The profiler is enabled while the overlay is shown, unless it was already enabled
+        from the configuration file.
+        """
+        self.visible = not self.visible
+        if self.visible and not self._profiler.enabled:
+            self._profiler.enabled = True
+            self._enabled_profiler = True
+        elif not self.visible and self._enabled_profiler:
+            self._profiler.enabled = False
+            self._enabled_profiler = False
+        self._refreshed = None
+
+    def blits(self) -> list[tuple[Surface, tuple[int, int]]]:
+        """Returns the background panel and text lines to be drawn, or nothing when hidden."""
+        if not self.visible:
+            return []
+
+        now: int = pygame.time.get_ticks()
+        if self._refreshed is None or now - self._refreshed >= REFRESH_INTERVAL:
+            self._refreshed = now
+            self._refresh()
+
+        return [(self._background, (0, 0))] + [(line.surface, line.location)
+                                                for line in self._lines]
+
+    def _refresh(self):
+        """Updates the text lines and the background panel from the profiler summary."""
+        texts: list[str] = [f"{'phase (ms)':<30}{'p50':>7}{'p95':>7}{'p99':>7}"]
+        for name, summary in self._profiler.summary().items():
+            texts.append(f"{name:<30}{summary['p50']:>7.2f}{summary['p95']:>7.2f}"
+                         f"{summary['p99']:>7.2f}")
+
+        line_height: int = self._font.get_linesize()
+        del self._lines[len(texts):]
+        for index, text in enumerate(texts):
+            location: tuple[int, int] = (MARGIN, MARGIN + index * line_height)
+            if index < len(self._lines):
+                if self._lines[index].text != text:
+                    self._lines[index].update(text)
+            else:
+                self._lines.append(TextObject(text, TEXT_COLOR, self._font, location))
+
+        width: int = max(line.surface.get_width() for line in self._lines) + 2 * MARGIN
+        height: int = len(self._lines) * line_height + 2 * MARGIN
+        if self._background.get_size() != (width, height):
+            self._background = Surface((width, height), pygame.SRCALPHA)
+            self._background.fill(BACKGROUND_COLOR)
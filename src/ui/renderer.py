@@ -1,11 +1,16 @@
 from typing import TYPE_CHECKING
 
 import pygame
-from pygame import Surface
+from pygame import Rect, Surface
+from pygame.sprite import Group, Sprite
+
+from utilities.frame_profiler import FrameProfiler, get_profiler
 
 if TYPE_CHECKING:
     from ui.ui_manager import UIManager
 
+type Blit = tuple[Surface, tuple[int, int]]
+
 
 # Docstrings in this class were written with the help of AI generation.
 class Renderer:
@@ -20,9 +25,13 @@ class Renderer:
             game elements and related data.
         text_controller: Manages the text elements on the screen, updating them
             according to the game state.
+        _dirty_rects: Whether only the changed regions of the screen are redrawn
+            during gameplay.
+        _previous_frame: The background, sprite group, text blits and sprite rects and
+            images drawn on the previous frame in dirty rect mode.
     """
 
-    def __init__(self, display: Surface, ui_manager: "UIManager"):
+    def __init__(self, display: Surface, ui_manager: "UIManager", dirty_rects: bool = False):
         """Initializes the renderer.
 
         Sets up the display surface and UI manager rendering.
@@ -31,15 +40,129 @@ class Renderer:
         Args:
             display: The display surface where the game's UI elements will be rendered.
             ui_manager: Gives renderer the objects it needs to render based on games states
+            dirty_rects: If True, only the regions of the screen where sprites or text
+                changed are redrawn and updated during gameplay.
         """
         self._display: Surface = display
         self.ui_manager = ui_manager
+        self._dirty_rects: bool = dirty_rects
+        self._previous_frame: dict = {}
 
     def render(self):
-        self.ui_manager.update()
-        self._display.blits((self.ui_manager.get_renderable_surfaces()))
-        self.ui_manager.draw_callbacks(self._display)
-        pygame.display.update()
+        """Updates the UI and draws the frame on the display.
+
+        Each step is measured as a sub-phase of the "render" phase of the frame profiler.
+        """
+        profiler: FrameProfiler = get_profiler()
+        with profiler.phase("render.ui_update"):
+            self.ui_manager.update()
+        if self._dirty_rects:
+            self._render_dirty(profiler)
+            return
+
+        with profiler.phase("render.blits"):
+            self._display.blits((self.ui_manager.get_renderable_surfaces()))
+        with profiler.phase("render.callbacks"):
+            self.ui_manager.draw_callbacks(self._display)
+        with profiler.phase("render.flip"):
+            pygame.display.update()
+
+    def _render_dirty(self, profiler: FrameProfiler):
+        """Redraws and updates only the regions of the screen that changed since the last frame.
+
+        The previous and current rects of moved, changed, added and removed sprites and
+        the rects of changed text surfaces are restored from the background, after which
+        the text and sprites overlapping them are drawn again. The whole screen is redrawn
+        on the game over screen and whenever the background or the sprite group changes.
+        """
+        with profiler.phase("render.blits"):
+            blits: list[Blit] = list(self.ui_manager.get_renderable_surfaces())
+            background: Surface = blits[0][0]
+            texts: list[Blit] = blits[1:]
+            sprites: Group = self.ui_manager.game_state.sprites
+            previous: dict = self._previous_frame
+
+            full_redraw: bool = (self.ui_manager.game_state.game_over
+                                 or background is not previous.get("background")
+                                 or sprites is not previous.get("sprites"))
+            if full_redraw:
+                self._display.blits(blits)
+                self.ui_manager.draw_callbacks(self._display)
+            else:
+                dirty: list[Rect] = self._find_dirty_text_rects(texts)
+                dirty.extend(self._find_dirty_sprite_rects(sprites))
+                dirty = [rect for rect in (rect.clip(self._display.get_rect()) for rect in dirty)
+                         if rect]
+                self._redraw_regions(dirty, background, texts, sprites)
+
+        with profiler.phase("render.flip"):
+            if full_redraw:
+                pygame.display.update()
+            elif dirty:
+                pygame.display.update(dirty)
+
+        self._remember_frame(background, sprites, texts)
+
+    def _redraw_regions(self, dirty: list[Rect], background: Surface, texts: list[Blit],
+                        sprites: Group):
+        """Restores the regions from the background and draws the text and sprites inside them.
+
+        The rects of the text and sprites are collected once per frame, and the ones
+        overlapping a region are found with Rect.collidelistall, so the per region work
+        stays in pygame instead of a Python loop over every sprite. Drawing is clipped to
+        the region so the sprites and text overlapping its edges don't cover anything
+        outside of it.
+        """
+        text_rects: list[Rect] = [surface.get_rect(topleft=location) for surface, location in texts]
+        sprite_list: list[Sprite] = sprites.sprites()
+        sprite_rects: list[Rect] = [sprite.rect for sprite in sprite_list]
+
+        for rect in dirty:
+            self._display.set_clip(rect)
+            self._display.blit(background, rect, rect)
+            for index in rect.collidelistall(text_rects):
+                self._display.blit(*texts[index])
+            for index in rect.collidelistall(sprite_rects):
+                self._display.blit(sprite_list[index].image, sprite_rects[index])
+        self._display.set_clip(None)
+
+    def _find_dirty_text_rects(self, texts: list[Blit]) -> list[Rect]:
+        """Returns the rects of text surfaces that were removed, added or replaced."""
+        previous: list[Blit] = self._previous_frame["texts"]
+        changed: list[Blit] = [blit for blit in previous if blit not in texts]
+        changed.extend(blit for blit in texts if blit not in previous)
+        return [surface.get_rect(topleft=location) for surface, location in changed]
+
+    def _find_dirty_sprite_rects(self, sprites: Group) -> list[Rect]:
+        """Returns the previous and current rects of sprites that moved or changed image.
+
+        Sprites that were removed since the previous frame give their previous rect and
+        added sprites give their current rect. The overlapping previous and current rects
+        of a sprite that moved only a little are joined into one rect.
+        """
+        previous: dict[Sprite, tuple[Rect, Surface]] = self._previous_frame["sprite_states"]
+        dirty: list[Rect] = []
+
+        for sprite in sprites:
+            state: tuple[Rect, Surface] | None = previous.get(sprite)
+            if state is None:
+                dirty.append(sprite.rect.copy())
+            elif state[0] != sprite.rect or state[1] is not sprite.image:
+                if state[0].colliderect(sprite.rect):
+                    dirty.append(state[0].union(sprite.rect))
+                else:
+                    dirty.extend((state[0], sprite.rect.copy()))
+
+        dirty.extend(state[0] for sprite, state in previous.items() if sprite not in sprites)
+        return dirty
+
+    def _remember_frame(self, background: Surface, sprites: Group, texts: list[Blit]):
+        self._previous_frame = {
+            "background": background,
+            "sprites": sprites,
+            "texts": texts,
+            "sprite_states": {sprite: (sprite.rect.copy(), sprite.image) for sprite in sprites},
+        }
 
     def distribute_ui_events(self, event: pygame.event.Event):
         self.ui_manager.handle_ui_events(event)
@@ -4,6 +4,7 @@ import pygame.font
 from pygame import Surface
 from pygame.font import Font
 
+from ui.glyph_atlas import GlyphAtlas
 from ui.text_object import TextObject
 from utilities import image_handler
 from utilities.constants import Folder
@@ -13,10 +14,12 @@ type Blit = tuple[Surface, tuple[int, int]]
 
 
 class TextInputBox:
-    def __init__(self, position: tuple[int, int], title: str, scale: float = 0):
+    def __init__(self, position: tuple[int, int], title: str, scale: float = 0,
+                 glyph_atlas: bool = False):
         super().__init__()
 
         self._text: str = ""
+        self._glyph_atlas: bool = glyph_atlas
         self._init_image(scale)
 
         self._variables: dict[str, int | float | bool | tuple[int, int]] = {
@@ -33,10 +36,8 @@ class TextInputBox:
         self._init_cursor()
 
     def _init_image(self, scale: float):
-        self._image: Surface = image_handler.load_image("text_box_narrow_titled.png")
-
-        if scale:
-            self._image = image_handler.scale_image(self._image, scale)
+        self._image: Surface = image_handler.get_image("text_box_narrow_titled.png",
+                                                       scale=scale or None)
 
     def _init_title_text(self, title: str):
 
@@ -48,7 +49,8 @@ class TextInputBox:
     def _init_input_text_object(self):
         input_font: Font = pygame.font.Font(CINZEL_MEDIUM, int(80 * self.scale))
 
-        self._input_text_object = TextObject(self._text, (0, 0, 0), input_font)
+        atlas: GlyphAtlas | None = GlyphAtlas(input_font, (0, 0, 0)) if self._glyph_atlas else None
+        self._input_text_object = TextObject(self._text, (0, 0, 0), input_font, glyph_atlas=atlas)
 
         self._align_text_object(self._input_text_object, height=130)
 
@@ -1,15 +1,18 @@
 from pygame import Surface
 from pygame.font import Font
 
+from ui.glyph_atlas import GlyphAtlas
+
 
 class TextObject:
 
     def __init__(self, text: str, color: tuple[int, int, int], font: Font,
-                 location: tuple[int, int] = (0, 0), ):
+                 location: tuple[int, int] = (0, 0), glyph_atlas: GlyphAtlas | None = None):
         self._text = text
         self._color = color
         self._font = font
         self._location = location
+        self._glyph_atlas = glyph_atlas
         self._create_surface()
 
     def update(self, text: str):
@@ -17,7 +20,10 @@ class TextObject:
         self._create_surface()
 
     def _create_surface(self):
-        self._surface: Surface = self._font.render(self._text, True, self._color)
+        if self._glyph_atlas is not None:
+            self._surface: Surface = self._glyph_atlas.render(self._text)
+        else:
+            self._surface: Surface = self._font.render(self._text, True, self._color)
 
     @property
     def location(self) -> tuple[int, int]:
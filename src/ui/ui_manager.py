@@ -6,10 +6,13 @@ import pygame
 from pygame import Surface
 
 from ui import ui_text
+from ui.performance_overlay import PerformanceOverlay
 from ui.text_box import TextInputBox
 from ui.ui_text import UITextController
 from utilities import constants
 from utilities import image_handler
+from utilities.constants import ScoreView
+from utilities.frame_profiler import get_profiler
 from utilities.score_manager import ScoreManager
 
 if TYPE_CHECKING:
@@ -18,26 +21,42 @@ if TYPE_CHECKING:
 
 class UIManager:
 
-    def __init__(self, game_state: "GameState", score_manager: "ScoreManager"):
-        self.text_controller: UITextController = UITextController(game_state, score_manager)
+    def __init__(self, game_state: "GameState", score_manager: "ScoreManager",
+                 glyph_atlas: bool = False):
+        self.text_controller: UITextController = UITextController(game_state, score_manager,
+                                                                  glyph_atlas)
         self.game_state = game_state
         self.loop_state = 0
         self.score_page = 0
+        self.score_view: ScoreView = ScoreView.ALL_TIME
         self.score_manager: ScoreManager = score_manager
         self._init_backgrounds()
 
-        self.text_box = TextInputBox((240, 271), "Enter Your Name", constants.SCALE_720P)
+        self.text_box: TextInputBox = self._create_text_box(glyph_atlas)
+        self.performance_overlay: PerformanceOverlay = PerformanceOverlay(
+            get_profiler(), pygame.font.SysFont("Courier New", 14))
 
     def _init_backgrounds(self):
-        game_bg: Surface = image_handler.load_image("castle_dungeon_background.png", False,
-                                                    (1280, 720))
-        end_bg: Surface = image_handler.load_image("end_game.png", False, (1280, 720))
+        size: tuple[int, int] = (self.game_state.width, self.game_state.height)
+        game_bg: Surface = image_handler.get_image("castle_dungeon_background.png", False,
+                                                   size, disk_cache=True)
+        end_bg: Surface = image_handler.get_image("end_game.png", False, size,
+                                                  disk_cache=True)
 
         self.backgrounds: dict[str, Surface] = {
             "game": game_bg,
             "end": end_bg
         }
 
+    def _create_text_box(self, glyph_atlas: bool) -> TextInputBox:
+        """Creates the name input box scaled and positioned for the size of the game screen."""
+        base_width, base_height = constants.BASE_RESOLUTION
+        position: tuple[int, int] = (round(240 * self.game_state.width / base_width),
+                                     round(271 * self.game_state.height / base_height))
+        scale: float = constants.SCALE_720P * self.game_state.height / base_height
+
+        return TextInputBox(position, "Enter Your Name", scale, glyph_atlas)
+
     def draw_callbacks(self, surface):
         if not self.game_state.game_over:
             self.game_state.sprites.draw(surface)
@@ -51,7 +70,8 @@ class UIManager:
     def _gameplay_screen_(self) -> chain[tuple[Surface, tuple[int, int]]]:
         return itertools.chain(
             [(self.backgrounds["game"], (0, 0))],
-            self.text_controller.get_text_surface_group(ui_text.Group.GAMEPLAY))
+            self.text_controller.get_text_surface_group(ui_text.Group.GAMEPLAY),
+            self.performance_overlay.blits())
 
     def _end_game_screen(self) -> chain[tuple[Surface, tuple[int, int]]]:
 
@@ -60,10 +80,11 @@ class UIManager:
 
         return itertools.chain(
             [(self.backgrounds["end"], (0, 0))],
-            self.text_controller.get_text_surface_group(ui_text.Group.HIGH_SCORES, first, last),
+            self.text_controller.get_text_surface_group(ui_text.Group.HIGH_SCORES, first, last,
+                                                        self.score_view),
             self.text_controller.get_text_surface_group(ui_text.Group.GAME_OVER_SCREEN),
-            self.text_box.blits() if self.text_box.active else []
-
+            self.text_box.blits() if self.text_box.active else [],
+            self.performance_overlay.blits()
         )
 
     def update(self):
@@ -73,6 +94,7 @@ class UIManager:
             if self.loop_state == 1:
                 pygame.mouse.set_visible(False)
                 self.text_box.deactivate()
+                self.text_controller.clear_placement()
                 self.score_page = 0
                 self.loop_state = 0
         else:
@@ -84,13 +106,19 @@ class UIManager:
             self.text_box.update()
 
     def handle_ui_events(self, event: pygame.event.Event):
-        if self.text_box.active:
+        if event.key == pygame.K_F3:
+            self.performance_overlay.toggle()
+        elif self.text_box.active:
             self._text_box_events(event)
         elif self.game_state.game_over:
             self._score_board_events(event)
 
     def _score_board_events(self, event: pygame.event.Event):
-        pages: int = (len(self.score_manager.get_scores()) + 9) // 10
+        if event.key in (pygame.K_UP, pygame.K_DOWN):
+            self._switch_score_view(1 if event.key == pygame.K_DOWN else -1)
+            return
+
+        pages: int = self.score_manager.page_count() if self.score_view == ScoreView.ALL_TIME else 1
         if event.key in (pygame.K_F1, pygame.K_LEFT) and pages > 1:
             self.score_page = (self.score_page - 1) % pages
             if self.score_page < 0:
@@ -99,6 +127,12 @@ class UIManager:
         elif event.key in (pygame.K_F2, pygame.K_RIGHT) and pages > 1:
             self.score_page = (self.score_page + 1) % pages
 
+    def _switch_score_view(self, step: int):
+        views: list[ScoreView] = list(ScoreView)
+        self.score_view = views[(views.index(self.score_view) + step) % len(views)]
+        self.score_page = 0
+        self.text_controller.show_score_view(self.score_view)
+
     def _text_box_events(self, event: pygame.event.Event):
         if event.key != pygame.K_RETURN:
             self.text_box.input_text(event)
@@ -6,11 +6,20 @@ from pygame import Surface
 from pygame.font import Font
 
 from game_engine.game_state import GameState
+from ui.glyph_atlas import GlyphAtlas
 from ui.text_object import TextObject
-from utilities.constants import Folder, TextObjects as Text, FontStyle as Style, TextGroup as Group
+from utilities.constants import BASE_RESOLUTION, Folder, TextObjects as Text, FontStyle as Style, \
+    TextGroup as Group, ScoreView
+from utilities.lru_cache import LRUCache
 from utilities.score import Score
 from utilities.score_manager import ScoreManager
 
+SCORE_PAGE_SIZE: int = 10
+"""Number of scores shown on a single high score page."""
+
+SCORE_PAGE_CACHE_SIZE: int = 5
+"""Number of rendered high score pages kept in memory."""
+
 
 # Docstrings in this class were written with the help of AI generation.
 class UITextController:
@@ -26,13 +35,20 @@ class UITextController:
         game_state: Instance of the GameState class.
         width: The width of the game screen.
         height: The height of the game screen.
+        _scale: Horizontal and vertical scale of the screen relative to BASE_RESOLUTION.
         text_states: A dictionary tracking the text values for different game aspects.
         fonts: A dictionary associating font names with their respective Font objects.
+        glyph_atlases: A dictionary associating font names with the glyph atlases used to
+            draw frequently changing text with the font. Empty if glyph atlases are disabled.
         text_objects: A dictionary to manage and organize text objects related to
             game states such as gameplay.
+        _score_pages: LRU cache of the rendered high score pages by leaderboard view and
+            page number. High score text objects are rendered one page at a time when the
+            page is first shown.
     """
 
-    def __init__(self, game_state: GameState, score_manager: ScoreManager):
+    def __init__(self, game_state: GameState, score_manager: ScoreManager,
+                 glyph_atlas: bool = False):
         """Initializes the UI text controller.
 
         Keeps reference to game state so it knows what information to render on dynamic
@@ -42,18 +58,26 @@ class UITextController:
         Args:
             game_state: The current game state from which text parameters and configurations
                 are derived.
+            score_manager: The score manager the high scores are read from.
+            glyph_atlas: If True, the gameplay counters and high scores are drawn from glyph
+                atlases instead of rendering every changed string with the font.
         """
         self.game_state: GameState = game_state
         self.score_manager: ScoreManager = score_manager
         self.width: int = self.game_state.width
         self.height: int = self.game_state.height
+        self._scale: tuple[float, float] = (self.width / BASE_RESOLUTION[0],
+                                            self.height / BASE_RESOLUTION[1])
         self.text_states: dict[str, str | int] = {}
 
         self.fonts: dict[str, Font] = {}
+        self.glyph_atlases: dict[str, GlyphAtlas] = {}
         self.text_objects: dict[str, dict[str, TextObject]] = {}
 
         self._create_text_states()
         self._create_font_types()
+        if glyph_atlas:
+            self._create_glyph_atlases()
         self._create_level_text_objects()
         self._create_game_over_text_objects()
         self._create_all_high_score_text_objects()
@@ -69,6 +93,8 @@ class UITextController:
             Text.LEVEL: self.game_state.level,
             Text.LIVES: self.game_state.player.lives,
             Text.POINTS: self.game_state.points,
+            Text.PLACEMENT: 0,
+            Text.SCORE_VIEW: ScoreView.ALL_TIME,
         }
 
     def _create_font_types(self):
@@ -76,10 +102,28 @@ class UITextController:
         cinzel_semi_bold: Path = Path(Folder.FONTS_DIR) / "Cinzel-SemiBold.ttf"
         cinzel_bold: Path = Path(Folder.FONTS_DIR) / "Cinzel-Bold.ttf"
 
-        self.fonts[Style.GAMEPLAY] = pygame.font.SysFont("Arial", 24)
-        self.fonts[Style.GAME_OVER_SCREEN] = pygame.font.Font(cinzel_bold, 14)
-        self.fonts[Style.SCORE_TITLE] = pygame.font.Font(cinzel_semi_bold, 24)
-        self.fonts[Style.SCORE] = pygame.font.SysFont("Courier New", 24)
+        self.fonts[Style.GAMEPLAY] = pygame.font.SysFont("Arial", self._font_size(24))
+        self.fonts[Style.GAME_OVER_SCREEN] = pygame.font.Font(cinzel_bold, self._font_size(14))
+        self.fonts[Style.SCORE_TITLE] = pygame.font.Font(cinzel_semi_bold, self._font_size(24))
+        self.fonts[Style.SCORE] = pygame.font.SysFont("Courier New", self._font_size(24))
+
+    def _position(self, x: int, y: int) -> tuple[int, int]:
+        """Scales a position defined for BASE_RESOLUTION to the game screen."""
+        return round(x * self._scale[0]), round(y * self._scale[1])
+
+    def _font_size(self, size: int) -> int:
+        """Scales a font size defined for BASE_RESOLUTION to the height of the game screen."""
+        return max(1, round(size * self._scale[1]))
+
+    def _create_glyph_atlases(self):
+        """Creates glyph atlases for the font types of the gameplay counters and high scores.
+
+        Text drawn with these font types changes often, so it is drawn from pre-rendered
+        glyphs instead of rendering the whole string again on every change.
+        """
+        self.glyph_atlases[Style.GAMEPLAY] = GlyphAtlas(self.fonts[Style.GAMEPLAY],
+                                                        (230, 215, 165))
+        self.glyph_atlases[Style.SCORE] = GlyphAtlas(self.fonts[Style.SCORE], (0, 0, 0))
 
     def _create_level_text_objects(self):
         """Create level text objects for the game display.
@@ -93,14 +137,21 @@ class UITextController:
         """
         font: Font = self.fonts[Style.GAMEPLAY]
         font_color: tuple[int, int, int] = (230, 215, 165)
+        atlas: GlyphAtlas | None = self.glyph_atlases.get(Style.GAMEPLAY)
+
+        base_width, base_height = BASE_RESOLUTION
 
         level_object: TextObject = TextObject(f"Level: {self.game_state.level}", font_color, font,
-                                              (self.width - 290, self.height - 30))
+                                              self._position(base_width - 290, base_height - 30),
+                                              atlas)
         lives_object: TextObject = TextObject(f"Lives: {self.game_state.player.lives}", font_color,
-                                              font, (self.width - 390, self.height - 30))
+                                              font,
+                                              self._position(base_width - 390, base_height - 30),
+                                              atlas)
         points_object: TextObject = TextObject(f"Points: {self.game_state.points}", font_color,
                                                font,
-                                               (self.width - 190, self.height - 30))
+                                               self._position(base_width - 190, base_height - 30),
+                                               atlas)
 
         self.text_objects[Group.GAMEPLAY] = {
             Text.LEVEL: level_object,
@@ -114,50 +165,114 @@ class UITextController:
         arrows: str = f"< F1: PREVIOUS {' ' * 98} F2: NEXT >"
         restart_exit: str = f"F4: NEW GAME {' ' * 13} ESC: QUIT GAME"
         font_color: tuple[int, int, int] = (0, 0, 0)
-        game_over_object: TextObject = TextObject(arrows, font_color, font, (350, 555))
-        end_options_object: TextObject = TextObject(restart_exit, font_color, font, (510, 555))
+        game_over_object: TextObject = TextObject(arrows, font_color, font,
+                                                  self._position(350, 555))
+        end_options_object: TextObject = TextObject(restart_exit, font_color, font,
+                                                    self._position(510, 555))
+        placement_object: TextObject = TextObject("", font_color, self.fonts[Style.SCORE_TITLE],
+                                                  self._position(350, 120))
+        score_view_object: TextObject = TextObject(_view_title(ScoreView.ALL_TIME), font_color,
+                                                   self.fonts[Style.SCORE_TITLE],
+                                                   self._position(760, 120))
 
         self.text_objects[Group.GAME_OVER_SCREEN] = {
             Text.GAME_OVER: game_over_object,
-            Text.END_OPTIONS: end_options_object
+            Text.END_OPTIONS: end_options_object,
+            Text.PLACEMENT: placement_object,
+            Text.SCORE_VIEW: score_view_object,
         }
 
     def _create_all_high_score_text_objects(self):
         font: Font = self.fonts[Style.SCORE_TITLE]
         font_color: tuple[int, int, int] = (0, 0, 0)
         title_text: str = f"{'#':<{9}}|{'Name':^{40}}|{'Level':^{9}}|   Points"
-        title_object: TextObject = TextObject(title_text, font_color, font, (350, 160))
+        title_object: TextObject = TextObject(title_text, font_color, font,
+                                              self._position(350, 160))
 
         self.text_objects[Group.HIGH_SCORES] = {
             Text.TITLE: title_object
         }
 
-        self._create_score_text_objects()
+        self._score_pages: LRUCache = LRUCache(max_size=SCORE_PAGE_CACHE_SIZE)
+        self.score_manager.add_listener(self._score_added)
+
+    def _create_score_text_objects(self, page: int,
+                                   view: ScoreView = ScoreView.ALL_TIME) -> list[TextObject]:
+        """Creates the text objects for the scores on the given high score page.
 
-    def _create_score_text_objects(self):
-        scores: list[Score] = self.score_manager.get_scores()
+        Only the scores of the requested page are fetched and rendered. Views other than
+        the all time view have a single page.
+
+        Args:
+            page: The 0-based page number.
+            view: The leaderboard view the page belongs to.
+
+        Returns:
+            The text objects of the scores on the page, the highest score first.
+        """
+        if view == ScoreView.ALL_TIME:
+            scores: list[Score] = self.score_manager.get_page(page, SCORE_PAGE_SIZE)
+        else:
+            scores = self.score_manager.get_view(view, SCORE_PAGE_SIZE) if page == 0 else []
         font = self.fonts[Style.SCORE]
         font_color = (0, 0, 0)
+        atlas: GlyphAtlas | None = self.glyph_atlases.get(Style.SCORE)
 
-        for i, score in enumerate(scores, start=1):
+        text_objects: list[TextObject] = []
+        for i, score in enumerate(scores, start=page * SCORE_PAGE_SIZE + 1):
             text: str = f"{i:<{4}}|{score.name[:20]:^{20}}|{score.level:<{6}}|{score.points:<}".upper()
-            location: tuple[int, int] = (350, 200 + ((i - 1) % 10) * 34)
-            text_object: TextObject = TextObject(text, font_color, font, location)
-            self.text_objects[Group.HIGH_SCORES][f"position_{i}"] = text_object
-
-    def _get_score_surface_group(self, first: int = 0, last: int = 10) -> Iterator[
+            location: tuple[int, int] = self._position(350, 200 + ((i - 1) % SCORE_PAGE_SIZE) * 34)
+            text_objects.append(TextObject(text, font_color, font, location, atlas))
+
+        return text_objects
+
+    def _get_score_page(self, page: int,
+                        view: ScoreView = ScoreView.ALL_TIME) -> list[TextObject]:
+        """Returns the text objects of a high score page, rendering the page if it isn't cached."""
+        text_objects: list[TextObject] | None = self._score_pages.get((view, page))
+        if text_objects is None:
+            text_objects = self._create_score_text_objects(page, view)
+            self._score_pages.put((view, page), text_objects)
+        return text_objects
+
+    def _score_added(self, rank: int):
+        """Forgets the rendered pages whose scores were moved by a score added at the rank.
+
+        The new score lands on the page of its rank and pushes every score after it one
+        position down, so that page and all the pages after it are rendered again when
+        they're shown. The pages before it stay cached. The other leaderboard views may
+        change too, so they are always rendered again. The rank is shown on the game over
+        screen until the next game starts.
+        """
+        first_changed: int = (rank - 1) // SCORE_PAGE_SIZE
+        self._score_pages.remove_where(
+            lambda key: key[0] != ScoreView.ALL_TIME or key[1] >= first_changed)
+        self._update_text_object(Group.GAME_OVER_SCREEN, Text.PLACEMENT,
+                                 f"You placed #{rank}", rank)
+
+    def clear_placement(self):
+        """Hides the high score position of the previous game."""
+        self._update_text_object(Group.GAME_OVER_SCREEN, Text.PLACEMENT, "", 0)
+
+    def show_score_view(self, view: ScoreView):
+        """Shows the title of the leaderboard view on the game over screen."""
+        self._update_text_object(Group.GAME_OVER_SCREEN, Text.SCORE_VIEW, _view_title(view),
+                                 view)
+
+    def _get_score_surface_group(self, first: int = 0, last: int = 10,
+                                 view: ScoreView = ScoreView.ALL_TIME) -> Iterator[
         tuple[Surface, tuple[int, int]]]:
 
-        last = min(last + 1, len(self.text_objects[Group.HIGH_SCORES]))
-        first = first if first <= last else last - last % 10
-        scores: dict[str, TextObject] = self.text_objects[Group.HIGH_SCORES]
-        yield scores[Text.TITLE].surface, scores[Text.TITLE].location
+        title: TextObject = self.text_objects[Group.HIGH_SCORES][Text.TITLE]
+        yield title.surface, title.location
 
-        for i in range(first + 1, last):
-            text_object: TextObject = scores[f"position_{i}"]
+        page: int = first // SCORE_PAGE_SIZE
+        start: int = first - page * SCORE_PAGE_SIZE
+        for text_object in self._get_score_page(page, view)[start:last - page * SCORE_PAGE_SIZE]:
             yield text_object.surface, text_object.location
 
-    def get_text_surface_group(self, group_name: str, first: int = 0, last: int = 10) -> Iterator[
+    def get_text_surface_group(self, group_name: str, first: int = 0, last: int = 10,
+                               view: ScoreView = ScoreView.ALL_TIME) -> Iterator[
         tuple[Surface, tuple[int, int]]]:
         """Returns an iterator over text `Surface` instances in the specified group.
 
@@ -168,22 +283,21 @@ class UITextController:
         Args:
             group_name: The name of the group for which TextObject
                 instances are to be retrieved.
+            first: Index of the first high score shown.
+            last: Index after the last high score shown.
+            view: The leaderboard view the high scores are taken from.
 
         Returns:
             Iterator: An iterator over the TextObject tuples in the specified group.
         """
 
         if group_name == Group.HIGH_SCORES:
-            yield from self._get_score_surface_group(first, last)
+            yield from self._get_score_surface_group(first, last, view)
 
         else:
             for text_object in self.text_objects[group_name].values():
                 yield text_object.surface, text_object.location
 
-    def _update_score_board(self):
-        if len(self.score_manager.get_scores()) == len(self.text_objects[Group.HIGH_SCORES]):
-            self._create_score_text_objects()
-
     def _update_text_object(self, group_name: str, object_name: str, text: str, state: int):
         """Updates a text object within a specified group
 
@@ -216,5 +330,7 @@ class UITextController:
 
             level: int = self.game_state.level
             self._update_text_object(Group.GAMEPLAY, Text.LEVEL, f"Level: {level}", level)
-        else:
-            self._update_score_board()
+
+
+def _view_title(view: ScoreView) -> str:
+    return view.upper()
@@ -0,0 +1,137 @@
+import json
+import os
+import threading
+from pathlib import Path
+from typing import TextIO
+
+BUFFER_SIZE: int = 4096
+"""Number of trace events kept in memory before they are written to the file."""
+
+TRACE_ENVIRONMENT_VARIABLE: str = "GEM_POACHER_TRACE"
+"""Environment variable enabling the trace when set to anything other than 0."""
+
+
+class ChromeTraceWriter:
+    """Streams timed spans to a file in the Chrome trace event format.
+
+    The file is a JSON array of complete ("X") events which can be opened in Perfetto
+    or chrome://tracing. Events are collected in a buffer of at most buffer_size events
+    that is written to the file whenever it fills up, so memory use stays the same no
+    matter how long the game runs. Spans can be added from any thread. Timestamps are
+    time.perf_counter times in microseconds.
+
+    Attributes:
+        path: Path of the trace file.
+        _buffer_size: Number of events collected before they are written.
+        _buffer: Events waiting to be written.
+        _file: The open trace file, or None before the first write and after closing.
+        _started: Whether the opening bracket of the event array has been written.
+        _closed: Whether the trace has been closed or writing it has failed.
+        _threads: Native ids of the threads whose name event has been added.
+        _lock: Lock guarding the buffer and the file.
+    """
+
+    def __init__(self, path: Path, buffer_size: int = BUFFER_SIZE):
+        """Initializes the writer. The file is created on the first write.
+
+        Args:
+            path: Path of the trace file. Missing folders are created.
+            buffer_size: Number of events collected before they are written.
+        """
+        self.path: Path = path
+        self._buffer_size: int = buffer_size
+        self._buffer: list[dict] = []
+        self._file: TextIO | None = None
+        self._started: bool = False
+        self._closed: bool = False
+        self._threads: set[int] = set()
+        self._lock: threading.Lock = threading.Lock()
+
+    def add_span(self, name: str, start: float, end: float):
+        """Adds a span to the trace.
+
+        The signature matches the listeners of FrameProfiler, so the writer can be added
+        as a listener to trace every measured phase. The category of the span is the
+        first part of its dotted name.
+
+        Args:
+            name: Name of the span.
+            start: time.perf_counter time when the span started.
+            end: time.perf_counter time when the span ended.
+        """
+        thread_id: int = threading.get_native_id()
+        with self._lock:
+            if self._closed:
+                return
+
+            if thread_id not in self._threads:
+                self._threads.add(thread_id)
+                self._buffer.append({"name": "thread_name", "ph": "M", "pid": os.getpid(),
+                                     "tid": thread_id,
+                                     "args": {"name": threading.current_thread().name}})
+
+            self._buffer.append({
+                "name": name,
+                "cat": name.split(".", 1)[0],
+                "ph": "X",
+                "ts": round(start * 1e6, 1),
+                "dur": round((end - start) * 1e6, 1),
+                "pid": os.getpid(),
+                "tid": thread_id,
+            })
+            if len(self._buffer) >= self._buffer_size:
+                self._flush()
+
+    def close(self) -> bool:
+        """Writes the remaining events and closes the event array and the file.
+
+        Returns:
+            True if the complete trace was written, False if writing it failed or the
+            trace was already closed.
+        """
+        with self._lock:
+            if self._closed:
+                return False
+
+            self._flush()
+            written: bool = False
+            if self._file is not None:
+                try:
+                    self._file.write("\n]\n" if self._started else "[]\n")
+                    self._file.close()
+                    written = True
+                except OSError as error:
+                    print(f"Could not write the trace: {error}")
+            self._file = None
+            self._closed = True
+            return written
+
+    def _flush(self):
+        """Writes the buffered events to the file and empties the buffer.
+
+        If the file can't be written, the trace is closed and later spans are ignored.
+        """
+        try:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                # The file stays open between flushes and is closed in close.
+                # pylint: disable-next=consider-using-with
+                self._file = open(self.path, "w", encoding="utf-8")
+
+            for event in self._buffer:
+                self._file.write(",\n" if self._started else "[\n")
+                self._file.write(json.dumps(event, separators=(",", ":")))
+                self._started = True
+            self._file.flush()
+        except OSError as error:
+            print(f"Could not write the trace: {error}")
+            self._closed = True
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        self._buffer.clear()
+
+
+def trace_requested() -> bool:
+    """Returns whether the trace was enabled with the TRACE_ENVIRONMENT_VARIABLE."""
+    return os.environ.get(TRACE_ENVIRONMENT_VARIABLE, "0") not in ("", "0")
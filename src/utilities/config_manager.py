@@ -1,9 +1,61 @@
 import configparser
+import threading
 from configparser import ConfigParser
+from importlib.util import find_spec
 from pathlib import Path
+from typing import Callable
 
 from utilities import constants
 
+type ConfigListener = Callable[["ConfigSnapshot"], None]
+type FileVersion = tuple[int, int]
+
+PERFORMANCE_OPTIONS: tuple[str, ...] = (
+    "vectorized enemies",
+    "dirty rect rendering",
+    "glyph atlas text",
+    "adaptive frame pacing",
+    "frame profiler",
+    "chrome trace",
+)
+"""Boolean options of the "PERFORMANCE SETTINGS" section."""
+
+
+class ConfigSnapshot:
+    """Parsed and validated settings of a single version of the configuration file.
+
+    Settings that are missing or invalid in the file hold their default values.
+
+    Attributes:
+        width: Width of the game window.
+        height: Height of the game window.
+        fps: Target frames per second.
+        difficulty: The difficulty as a numerical value.
+        custom_difficulty_settings: Progression logic of the custom difficulty, or None if
+            the custom difficulty settings are broken.
+        player_lives: Player lives with the custom difficulty.
+        database_path: Path of the database file, or None if it can't be read.
+        performance: Dictionary mapping the options in PERFORMANCE_OPTIONS to their values.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, *, width: int = 1280, height: int = 720, fps: int = 120,
+                 difficulty: int = constants.Difficulty.MEDIUM,
+                 custom_difficulty_settings: tuple[tuple[int, int], ...] | None = None,
+                 player_lives: int = 5, database_path: str | None = None,
+                 performance: dict[str, bool] | None = None):
+        self.width: int = width
+        self.height: int = height
+        self.fps: int = fps
+        self.difficulty: int = difficulty
+        self.custom_difficulty_settings: tuple[tuple[int, int], ...] | None = (
+            custom_difficulty_settings)
+        self.player_lives: int = player_lives
+        self.database_path: str | None = database_path
+        self.performance: dict[str, bool] = (
+            performance if performance is not None
+            else dict.fromkeys(PERFORMANCE_OPTIONS, False))
+
 
 # Specific exceptions are handled inside the exception handler,
 # but pylint doesn't know that.
@@ -17,25 +69,41 @@ class ConfigManager:
     defining default values and extending its configuration capabilities for
     customizations.
 
+    The file is parsed and validated once into a ConfigSnapshot, which every getter
+    reads. The file is parsed again only when its modification time or size changes,
+    and subscribers are notified with the new snapshot so settings can be applied
+    while the game is running. get_config_manager returns the instance shared by the
+    whole process.
+
     Attributes:
         self._config An instance of `ConfigParser` used to manage and
             parse configuration settings.
         self._config_path The file path object for the configuration file where
             settings are stored.
+        self._snapshot The settings parsed from the current version of the file.
+        self._version Modification time and size of the parsed version of the file.
+        self._listeners Functions called with the new snapshot after the file changes.
+        self._lock Lock guarding the snapshot, so the file is parsed only once even when
+            several threads read the settings.
     """
 
     def __init__(self):
         """Initializes the ConfigManager class and sets path to the configuration file."""
         self._config: ConfigParser = ConfigParser(allow_no_value=True)
         self._config_path: Path = Path(constants.Folder.CONFIG_DIR) / "config.ini"
+        self._snapshot: ConfigSnapshot | None = None
+        self._version: FileVersion | None = None
+        self._listeners: list[ConfigListener] = []
+        self._lock: threading.Lock = threading.Lock()
 
     def _set_default_configs(self):
         """Sets the default configurations for the game, including base game"""
 
         self._config["GAME SETTINGS"] = {
-            "; Currently width, height, and FPS don't do anything": None,
+            "; Window size in pixels, changes are applied after a restart": None,
             "width": "1280",
             "height": "720",
+            "; Target frames per second": None,
             "fps": "120",
             "; Options: EASY, MEDIUM, HARD, LUDICROUS, CUSTOM": None,
             "difficulty": "MEDIUM"
@@ -69,6 +137,24 @@ class ConfigManager:
             "player lives": "9"
         }
 
+    def _set_performance_settings(self):
+        """Sets the default configurations for optional performance features"""
+
+        self._config["PERFORMANCE SETTINGS"] = {
+            "; Moves enemies with vectorized NumPy operations, requires NumPy": None,
+            "vectorized enemies": "false",
+            "; Redraws only the changed parts of the screen on every frame": None,
+            "dirty rect rendering": "false",
+            "; Draws changing gameplay, high score and name input text from cached glyphs": None,
+            "glyph atlas text": "false",
+            "; Lowers the FPS on slow machines and busy waits when sleeping is imprecise": None,
+            "adaptive frame pacing": "false",
+            "; Measures frame phases and writes them to src/profiles on exit": None,
+            "frame profiler": "false",
+            "; Streams frame phases, score queries and asset loads to a Chrome trace file": None,
+            "chrome trace": "false",
+        }
+
     def create_config(self, force: bool = False):
         """Creates a configuration file with default, database, and difficulty sections.
 
@@ -83,6 +169,7 @@ class ConfigManager:
             self._set_default_configs()
             self._set_database_configs()
             self._set_difficulty_settings()
+            self._set_performance_settings()
 
             try:
                 with open(self._config_path, "w", encoding="utf-8") as configfile:
@@ -91,12 +178,169 @@ class ConfigManager:
                 print("Something went wrong while creating config:")
                 print(repr(exception))
 
+    def subscribe(self, listener: ConfigListener):
+        """Adds a function that is called with the new snapshot whenever the file changes.
+
+        Listeners are called from the thread that notices the change, usually the game
+        loop calling reload_if_changed.
+        """
+        self._listeners.append(listener)
+
+    def get_snapshot(self) -> ConfigSnapshot:
+        """Returns the settings of the current version of the configuration file.
+
+        The file is parsed only if it has changed since it was last parsed. Subscribers
+        are notified when a changed file replaces an earlier snapshot.
+
+        Returns:
+            The parsed settings.
+        """
+        return self._refresh()[0]
+
+    def reload_if_changed(self) -> bool:
+        """Parses the configuration file again if it has changed and notifies subscribers.
+
+        Returns:
+            True if the file had changed since it was last parsed.
+        """
+        return self._refresh()[1]
+
+    def _refresh(self) -> tuple[ConfigSnapshot, bool]:
+        """Parses the file if its version differs from the parsed version.
+
+        Returns:
+            The current snapshot and whether an earlier snapshot was replaced.
+        """
+        with self._lock:
+            version: FileVersion | None = self._file_version()
+            if self._snapshot is not None and version == self._version:
+                return self._snapshot, False
+
+            changed: bool = self._snapshot is not None
+            self._snapshot = self._parse()
+            self._version = version
+            snapshot: ConfigSnapshot = self._snapshot
+
+        if changed:
+            for listener in self._listeners:
+                listener(snapshot)
+        return snapshot, changed
+
+    def _file_version(self) -> FileVersion | None:
+        try:
+            stat = self._config_path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _parse(self) -> ConfigSnapshot:
+        """Reads the configuration file and validates every setting into a snapshot."""
+        self._config = ConfigParser(allow_no_value=True)
+        try:
+            self._config.read(self._config_path, encoding="utf-8")
+        except Exception as exception:
+            _config_exceptionhandler(exception)
+
+        return ConfigSnapshot(
+            width=self._parse_positive_int("GAME SETTINGS", "width", 1280),
+            height=self._parse_positive_int("GAME SETTINGS", "height", 720),
+            fps=self._parse_positive_int("GAME SETTINGS", "fps", 120),
+            difficulty=self._parse_difficulty(),
+            custom_difficulty_settings=self._parse_custom_difficulty_settings(),
+            player_lives=self._parse_player_lives(),
+            database_path=self._parse_database_path(),
+            performance={option: self._parse_performance_setting(option)
+                         for option in PERFORMANCE_OPTIONS},
+        )
+
     def get_database_path(self) -> None | str:
         """Gets the database file path from the configuration file.
 
-        This method reads the database configuration settings from the provided
-        configuration file path and constructs the full database file path based
-        on the folder defined in `constants.Folder.DATABASE_DIR`.
+        Returns:
+            Returns the constructed database path as a string if
+            it is successfully retrieved, or None if an error occurs.
+        """
+        return self.get_snapshot().database_path
+
+    def get_difficulty(self) -> int:
+        """Gets the difficulty setting from the configuration file.
+
+        Returns:
+            The difficulty level represented as a numerical value.
+        """
+        return self.get_snapshot().difficulty
+
+    def get_custom_difficulty_settings(self) -> tuple[tuple[int, int]] | None:
+        """Retrieves configuration for custom difficulty settings from the config file.
+
+        Returns:
+            A tuple containing a list of tuples
+            with integers representing the custom difficulty settings, or None if no
+            valid settings are available.
+        """
+        return self.get_snapshot().custom_difficulty_settings
+
+    def get_player_lives(self) -> int:
+        """ Retrieves the number of lives a player has based on the configuration settings.
+
+        Returns:
+            The number of lives for the player based on the configuration or default value.
+        """
+        return self.get_snapshot().player_lives
+
+    def get_vectorized_enemies(self) -> bool:
+        """Retrieves whether enemies should be moved with the vectorized enemy store.
+
+        Returns:
+            The value of the "vectorized enemies" setting, or False if it can't be read.
+        """
+        return self.get_snapshot().performance["vectorized enemies"]
+
+    def get_dirty_rect_rendering(self) -> bool:
+        """Retrieves whether the renderer should only redraw the changed parts of the screen.
+
+        Returns:
+            The value of the "dirty rect rendering" setting, or False if it can't be read.
+        """
+        return self.get_snapshot().performance["dirty rect rendering"]
+
+    def get_glyph_atlas_text(self) -> bool:
+        """Retrieves whether frequently changing text should be drawn from glyph atlases.
+
+        Returns:
+            The value of the "glyph atlas text" setting, or False if it can't be read.
+        """
+        return self.get_snapshot().performance["glyph atlas text"]
+
+    def get_adaptive_frame_pacing(self) -> bool:
+        """Retrieves whether the clock should adapt the framerate and waiting to the machine.
+
+        Returns:
+            The value of the "adaptive frame pacing" setting, or False if it can't be read.
+        """
+        return self.get_snapshot().performance["adaptive frame pacing"]
+
+    def get_frame_profiler(self) -> bool:
+        """Retrieves whether the phases of every frame should be measured.
+
+        Returns:
+            The value of the "frame profiler" setting, or False if it can't be read.
+        """
+        return self.get_snapshot().performance["frame profiler"]
+
+    def get_chrome_trace(self) -> bool:
+        """Retrieves whether measured phases should be written to a Chrome trace file.
+
+        Returns:
+            The value of the "chrome trace" setting, or False if it can't be read.
+        """
+        return self.get_snapshot().performance["chrome trace"]
+
+    def _parse_database_path(self) -> None | str:
+        """Parses the database file path from the configuration file.
+
+        This method reads the database configuration settings and constructs the full
+        database file path based on the folder defined in `constants.Folder.DATABASE_DIR`.
 
         Returns:
             Returns the constructed database path as a string if
@@ -107,7 +351,6 @@ class ConfigManager:
         """
         path: None | str = None
         try:
-            self._config.read(self._config_path)
             filename: str = self._config.get("DATABASE SETTINGS", "database path")
             path = str(Path(constants.Folder.DATABASE_DIR) / filename)
         except Exception as exception:
@@ -115,13 +358,12 @@ class ConfigManager:
 
         return path
 
-    def get_difficulty(self) -> int:
-        """Gets the difficulty setting from the configuration file.
+    def _parse_difficulty(self) -> int:
+        """Parses the difficulty setting from the configuration file.
 
         If the configuration is invalid or an error occurs, defaults to the medium difficulty.
-        The method reads the configuration file to extract the difficulty setting
-        under the "GAME SETTINGS" section of the provided config file path. It
-        translates the difficulty setting into its corresponding numerical value.
+        The difficulty setting under the "GAME SETTINGS" section is translated into its
+        corresponding numerical value.
 
         Raises:
             KeyError: If the retrieved difficulty setting does not correspond to
@@ -136,7 +378,6 @@ class ConfigManager:
         difficulty: int = constants.Difficulty.MEDIUM
 
         try:
-            self._config.read(self._config_path)
             setting: str = self._config.get("GAME SETTINGS", "difficulty").upper()
             difficulty = constants.Difficulty[setting].value
         except KeyError as exception:
@@ -146,14 +387,13 @@ class ConfigManager:
             print("Defaulting to Medium difficulty")
         return difficulty
 
-    def get_custom_difficulty_settings(self) -> tuple[tuple[int, int]] | None:
-        """Retrieves configuration for custom difficulty settings from the config file.
+    def _parse_custom_difficulty_settings(self) -> tuple[tuple[int, int]] | None:
+        """Parses the custom difficulty settings from the configuration file.
 
         And parses the config into a list of tuples containing integer values. If the settings
         are incomplete or an exception occurs during retrieval the method returns None and
         informs the user that medium settings are being used.
 
-
         Returns:
             A tuple containing a list of tuples
             with integers representing the custom difficulty settings, or None if no
@@ -162,7 +402,6 @@ class ConfigManager:
         setting: list[tuple[int, int]] = []
 
         try:
-            self._config.read(self._config_path)
             options: list[str] = self._config.options("CUSTOM DIFFICULTY SETTINGS")
             if len(options) < 6:
                 print("Custom difficulty settings are broken, defaulting to medium settings")
@@ -174,31 +413,94 @@ class ConfigManager:
                     )
                     setting.append(combined_option)
         except Exception as exception:
+            setting = []
             _config_exceptionhandler(exception)
 
         return tuple(setting) if setting else None
 
-    def get_player_lives(self) -> int:
-        """ Retrieves the number of lives a player has based on the configuration settings.
+    def _parse_player_lives(self) -> int:
+        """Parses the number of lives a player has with the custom difficulty.
 
-        This method reads the configuration file to determine the player's lives as defined in the
-        "player lives" setting under the "CUSTOM DIFFICULTY SETTINGS" section. If the configuration
-        file is not accessible or there is an error retrieving the setting,
-        a default value of 5 lives
-        is returned.
+        The lives are defined in the "player lives" setting under the
+        "CUSTOM DIFFICULTY SETTINGS" section. If the setting can't be read,
+        a default value of 5 lives is returned.
 
         Returns:
             The number of lives for the player based on the configuration or default value.
         """
         lives: int = 5
         try:
-            self._config.read(self._config_path)
             lives = self._config.getint("CUSTOM DIFFICULTY SETTINGS", "player lives")
         except Exception as exception:
             _config_exceptionhandler(exception)
 
         return lives
 
+    def _parse_positive_int(self, section: str, option: str, default: int) -> int:
+        """Parses a positive integer option.
+
+        Args:
+            section: Name of the section.
+            option: Name of the option.
+            default: Value returned if the option can't be read or isn't positive.
+
+        Returns:
+            The value of the option, or the default value.
+        """
+        value: int = default
+        try:
+            value = self._config.getint(section, option)
+        except Exception as exception:
+            _config_exceptionhandler(exception)
+
+        if value <= 0:
+            print(f"Config error: {option} must be a positive integer, defaulting to {default}")
+            value = default
+        return value
+
+    def _parse_performance_setting(self, option: str) -> bool:
+        """Parses a boolean option from the "PERFORMANCE SETTINGS" section.
+
+        Vectorized enemies are disabled when NumPy isn't installed, because the enemy
+        store needs it.
+
+        Args:
+            option: Name of the option.
+
+        Returns:
+            The value of the option, or False if it is missing or isn't a boolean.
+        """
+        try:
+            enabled: bool = self._config.getboolean("PERFORMANCE SETTINGS", option,
+                                                    fallback=False)
+        except ValueError as error:
+            _config_exceptionhandler(error)
+            return False
+
+        if enabled and option == "vectorized enemies" and find_spec("numpy") is None:
+            print("NumPy is not installed, vectorized enemies are disabled")
+            return False
+        return enabled
+
+
+_managers: dict[Path, ConfigManager] = {}
+"""Configuration managers of the opened configuration files."""
+_managers_lock: threading.Lock = threading.Lock()
+
+
+def get_config_manager() -> ConfigManager:
+    """Returns the configuration manager shared by the whole process.
+
+    Returns:
+        The ConfigManager of the configuration file in the config folder. Every caller
+        gets the same instance, so the file is parsed only once.
+    """
+    config_path: Path = Path(constants.Folder.CONFIG_DIR) / "config.ini"
+    with _managers_lock:
+        if config_path not in _managers:
+            _managers[config_path] = ConfigManager()
+        return _managers[config_path]
+
 
 def _config_exceptionhandler(exception: Exception):
     """ Handles exceptions raised during configuration processing.
@@ -223,10 +525,25 @@ def _config_exceptionhandler(exception: Exception):
     except configparser.NoSectionError:
         print("Config error:", exception)
     except ValueError as error:
-        if "invalid literal for int()" in repr(error):
-            incorrect_value: str = repr(error).split("'")[1]
-            print(f"Config error: {incorrect_value} is not a valid integer")
-        else:
-            raise error
+        _value_error_handler(error)
     finally:
         print("Deleting the config file will restore default settings")
+
+
+def _value_error_handler(error: ValueError):
+    """Prints a message for ValueErrors caused by invalid integer or boolean config values.
+
+    Args:
+        error: The ValueError to be handled.
+
+    Raises:
+        ValueError: If the error is not caused by an invalid config value.
+    """
+    if "invalid literal for int()" in repr(error):
+        incorrect_value: str = repr(error).split("'")[1]
+        print(f"Config error: {incorrect_value} is not a valid integer")
+    elif "Not a boolean" in repr(error):
+        incorrect_value: str = repr(error).split(": ")[1].rstrip("')")
+        print(f"Config error: {incorrect_value} is not a valid boolean")
+    else:
+        raise error
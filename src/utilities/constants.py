@@ -4,6 +4,9 @@ from pathlib import Path
 SCALE_720P: float = 720 / 1008
 """Scale factor for 720p resolution using castle dungeon background as the baseline value."""
 
+BASE_RESOLUTION: tuple[int, int] = (1280, 720)
+"""Window size the positions and font sizes of the user interface are defined for."""
+
 
 class TextObjects(StrEnum):
     """Defines enumeration for text objects used UITextController.
@@ -15,6 +18,9 @@ class TextObjects(StrEnum):
         TITLE: Represents the text object for the initial title or position.
         GAME_OVER: Represents the text object for the game over screen.
         END_OPTIONS: Represents the text object for end game options.
+        PLACEMENT: Represents the text object for the high score position of the
+            latest score.
+        SCORE_VIEW: Represents the text object naming the shown leaderboard view.
     """
     LIVES: str = "lives"
     POINTS: str = "points"
@@ -22,6 +28,8 @@ class TextObjects(StrEnum):
     TITLE: str = "position_0"
     GAME_OVER: str = "game_over"
     END_OPTIONS: str = "end_options"
+    PLACEMENT: str = "placement"
+    SCORE_VIEW: str = "score_view"
 
 
 class TextGroup(StrEnum):
@@ -55,6 +63,23 @@ class FontStyle(StrEnum):
     SCORE: str = "high_score_style"
 
 
+class ScoreView(StrEnum):
+    """Represents the leaderboard views that can be shown on the high score screen.
+
+    The string values are the titles of the views.
+
+    Attributes:
+        ALL_TIME: Every score in high score order.
+        PLAYER_BESTS: The best score of every player.
+        TODAY: The top scores recorded today.
+        THIS_WEEK: The top scores recorded this week, starting on Monday.
+    """
+    ALL_TIME: str = "all time"
+    PLAYER_BESTS: str = "player bests"
+    TODAY: str = "today"
+    THIS_WEEK: str = "this week"
+
+
 class Folder(StrEnum):
     """Enumeration for predefined folder paths relevant to the application.
 
@@ -64,19 +89,24 @@ class Folder(StrEnum):
             general application assets.
         IMAGES_DIR: Absolute path to the images directory where image
             resources are stored.
+        IMAGE_CACHE_DIR: Absolute path to the directory where pre-scaled images are
+            cached.
         FONTS_DIR: Absolute path to the fonts directory where font
             resources are contained.
         CONFIG_DIR: Absolute path to the configuration directory that
             holds application configuration files.
         DATABASE_DIR: Absolute path to the database directory for storing
             database files.
+        PROFILE_DIR: Absolute path to the directory where frame profiles are written.
     """
     SRC_DIR = str(Path(__file__).parent.parent.resolve())
     ASSETS_DIR = str(Path(SRC_DIR) / "assets")
     IMAGES_DIR = str(Path(ASSETS_DIR) / "images")
+    IMAGE_CACHE_DIR = str(Path(ASSETS_DIR) / "cache")
     FONTS_DIR = str(Path(ASSETS_DIR) / "fonts")
     CONFIG_DIR = str(Path(SRC_DIR) / "config")
     DATABASE_DIR = str(Path(SRC_DIR) / "database")
+    PROFILE_DIR = str(Path(SRC_DIR) / "profiles")
 
 
 class Difficulty(IntEnum):
@@ -0,0 +1,211 @@
+import functools
+import json
+import math
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Callable
+
+type PhaseListener = Callable[[str, float, float], None]
+
+PERCENTILES: tuple[int, ...] = (50, 95, 99)
+"""Percentiles reported for every phase."""
+
+
+class RollingHistogram:
+    """Keeps the most recent durations of a phase and reports their percentiles.
+
+    Attributes:
+        _samples: The most recent durations in milliseconds, the oldest first.
+        _count: Number of durations recorded since the histogram was created.
+    """
+
+    def __init__(self, size: int = 600):
+        """Initializes an empty histogram.
+
+        Args:
+            size: Number of the most recent durations kept.
+        """
+        self._samples: deque[float] = deque(maxlen=size)
+        self._count: int = 0
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def add(self, duration: float):
+        self._samples.append(duration)
+        self._count += 1
+
+    def percentile(self, percent: float) -> float:
+        """Returns the duration below which the given percent of the kept durations fall.
+
+        Uses the nearest rank method. Returns 0 for an empty histogram.
+        """
+        return _nearest_rank(sorted(self._samples), percent)
+
+    def summary(self) -> dict[str, float]:
+        """Returns the percentiles in PERCENTILES, the mean and the total count."""
+        ordered: list[float] = sorted(self._samples)
+        summary: dict[str, float] = {"count": self._count,
+                                     "mean": sum(ordered) / len(ordered) if ordered else 0.0}
+        for percent in PERCENTILES:
+            summary[f"p{percent}"] = _nearest_rank(ordered, percent)
+        return summary
+
+
+def _nearest_rank(ordered: list[float], percent: float) -> float:
+    """Returns the percentile of sorted values with the nearest rank method, 0 if empty."""
+    if not ordered:
+        return 0.0
+    rank: int = max(1, math.ceil(len(ordered) * percent / 100))
+    return ordered[rank - 1]
+
+
+class _Phase:
+    """Context manager timing a single phase with time.perf_counter."""
+
+    __slots__ = ("_profiler", "_name", "_start")
+
+    def __init__(self, profiler: "FrameProfiler", name: str):
+        self._profiler: FrameProfiler = profiler
+        self._name: str = name
+        self._start: float = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._profiler.record(self._name, self._start, time.perf_counter())
+
+
+class _NoPhase:
+    """Context manager used when profiling is disabled. Does nothing."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return None
+
+
+_NO_PHASE: _NoPhase = _NoPhase()
+
+
+class FrameProfiler:
+    """Measures how long each phase of a frame takes.
+
+    Code measures a phase by wrapping it in `with profiler.phase("name"):`. Phase names
+    are dotted paths, so "logic.movement" is a sub-phase of "logic". The durations of
+    every phase are kept in a RollingHistogram. When the profiler is disabled, phase
+    returns a shared context manager that does nothing, so instrumented code costs
+    only a method call.
+
+    Attributes:
+        enabled: Whether phases are measured.
+        _histograms: Dictionary mapping phase names to their histograms.
+        _window: Number of the most recent durations kept for every phase.
+        _listeners: Functions called with the name, start and end time of every measured
+            phase.
+        _lock: Lock guarding the histograms, which may be recorded from other threads.
+    """
+
+    def __init__(self, window: int = 600, enabled: bool = False):
+        """Initializes the profiler.
+
+        Args:
+            window: Number of the most recent durations kept for every phase.
+            enabled: Whether phases are measured from the start.
+        """
+        self.enabled: bool = enabled
+        self._histograms: dict[str, RollingHistogram] = {}
+        self._window: int = window
+        self._listeners: list[PhaseListener] = []
+        self._lock: threading.Lock = threading.Lock()
+
+    def phase(self, name: str) -> _Phase | _NoPhase:
+        """Returns a context manager measuring the phase with the given name."""
+        if not self.enabled:
+            return _NO_PHASE
+        return _Phase(self, name)
+
+    def add_listener(self, listener: PhaseListener):
+        """Adds a function called with the name, start and end perf_counter time of every
+        measured phase."""
+        self._listeners.append(listener)
+
+    def record(self, name: str, start: float, end: float):
+        """Records a measured phase.
+
+        Args:
+            name: Name of the phase.
+            start: time.perf_counter time when the phase started.
+            end: time.perf_counter time when the phase ended.
+        """
+        with self._lock:
+            histogram: RollingHistogram | None = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = RollingHistogram(self._window)
+            histogram.add((end - start) * 1000)
+
+        for listener in self._listeners:
+            listener(name, start, end)
+
+    def has_samples(self) -> bool:
+        return bool(self._histograms)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Returns the percentiles, mean and count of every phase in milliseconds.
+
+        Returns:
+            Dictionary mapping phase names, in alphabetical order, to their summaries.
+        """
+        with self._lock:
+            return {name: self._histograms[name].summary() for name in sorted(self._histograms)}
+
+    def dump(self, path: Path) -> bool:
+        """Writes the summary of every phase to a JSON file.
+
+        Args:
+            path: Path of the JSON file. Missing folders are created.
+
+        Returns:
+            True if the file was written.
+        """
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump({"unit": "ms", "phases": self.summary()}, file, indent=2)
+        except OSError as error:
+            print(f"Could not write the frame profile: {error}")
+            return False
+        return True
+
+
+_profiler: FrameProfiler = FrameProfiler()
+
+
+def get_profiler() -> FrameProfiler:
+    """Returns the frame profiler shared by the whole process. It is disabled by default."""
+    return _profiler
+
+
+def profiled(name: str) -> Callable[[Callable], Callable]:
+    """Decorator measuring every call of the decorated function as a phase.
+
+    Args:
+        name: Name of the phase.
+    """
+
+    def decorator(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with _profiler.phase(name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
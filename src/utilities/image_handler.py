@@ -1,20 +1,41 @@
+import hashlib
+import mmap
 import os
+import re
+from pathlib import Path
 
 import pygame
 from pygame import Surface
 
 import utilities.constants
+from utilities.frame_profiler import profiled
 
 # Docstrings in this module were written with the help of AI generation.
 IMAGES_DIR: str = utilities.constants.Folder.IMAGES_DIR
 """Constant for the Base path of the assets directory."""
 
+IMAGE_CACHE_DIR: str = utilities.constants.Folder.IMAGE_CACHE_DIR
+"""Constant for the path of the on-disk cache of pre-scaled images."""
 
+RAW_FORMAT: str = "RGBX"
+"""Pixel format of the raw pixel buffers in the on-disk image cache."""
+
+type ImageKey = tuple[str, bool, tuple[int, int] | None, float | None, bool, int | None]
+
+_image_cache: dict[ImageKey, Surface] = {}
+"""Process-wide cache of processed image surfaces keyed by the arguments of get_image."""
+
+_cache_stats: dict[str, int] = {"hits": 0, "misses": 0}
+"""Hit and miss counters for the image cache."""
+
+
+@profiled("assets.load_image")
 def load_image(filename: str, alpha: bool = True, size: tuple[int, int] | None = None) -> Surface:
     """
-    Loads an image from the specified filename and converts it to have an
-    alpha channel. This ensures that the image can support transparency. It
-    utilizes the `pygame` library for loading and processing the image data.
+    Loads an image from the specified filename, resizes it and converts it to the
+    pixel format of the display. Images loaded with alpha keep their per pixel
+    transparency. The image is scaled before conversion so only the final sized
+    image has to be converted.
 
     Args:
         filename: The name of the file to be loaded, including its extension.
@@ -22,19 +43,35 @@ def load_image(filename: str, alpha: bool = True, size: tuple[int, int] | None =
         size: Optional size parameter for resizing the image to specific dimensions.
 
     Returns:
-        A `Surface` object containing the loaded image with alpha transparency
-        enabled.
+        A `Surface` object containing the loaded image in the display pixel format.
     """
     image: Surface = pygame.image.load(os.path.join(IMAGES_DIR, filename))
-    if alpha:
-        image.convert_alpha()
-    else:
-        image.convert()
-
     if size:
         image = pygame.transform.scale(image, size)
 
-    return image
+    return convert_image(image, alpha)
+
+
+def convert_image(image: Surface, alpha: bool = True) -> Surface:
+    """Converts an image to the pixel format of the display.
+
+    Surfaces in the display pixel format are blitted without converting every pixel on
+    each blit. Images can't be converted before a display mode has been set, so without
+    a display surface the image is returned unchanged.
+
+    Args:
+        image: The image to be converted.
+        alpha: If True, the converted image keeps per pixel transparency.
+
+    Returns:
+        The converted image, or the original image if there is no display surface.
+    """
+    if pygame.display.get_surface() is None:
+        return image
+
+    if alpha:
+        return image.convert_alpha()
+    return image.convert()
 
 
 def scale_image(image: Surface, scale: float) -> Surface:
@@ -83,6 +120,153 @@ def create_opaque_image(filename: str) -> Surface:
     Returns:
         Surface: The processed image with adjusted opacity.
     """
-    image: Surface = load_image(filename).convert_alpha()
+    image: Surface = load_image(filename)
     image.set_alpha(128)
     return image
+
+
+@profiled("assets.load_cached_image")
+def load_cached_image(filename: str, size: tuple[int, int]) -> Surface:
+    """Loads an opaque image resized to the given size through the on-disk image cache.
+
+    Decoding and scaling large images is slow, so the scaled pixels are stored as a raw
+    pixel buffer in the image cache directory. The name of the cache file contains a
+    hash of the source file's content and the target size, so changing either of them
+    invalidates the cached buffer. Cached buffers are memory-mapped and read with
+    pygame.image.frombuffer. If the cache can't be used, the image is decoded and
+    scaled normally.
+
+    Args:
+        filename: The name of the file to be loaded, including its extension.
+        size: Size the image is resized to.
+
+    Returns:
+        A `Surface` object containing the resized image in the display pixel format.
+    """
+    path: Path = _cache_path(filename, size)
+    image: Surface | None = _read_raw_image(path, size)
+    if image is not None:
+        return image
+
+    image = pygame.transform.scale(pygame.image.load(os.path.join(IMAGES_DIR, filename)), size)
+    _write_raw_image(path, image)
+    return convert_image(image, alpha=False)
+
+
+def _cache_path(filename: str, size: tuple[int, int]) -> Path:
+    """Returns the cache file path for the image content and target size."""
+    digest: str = hashlib.sha256(Path(IMAGES_DIR, filename).read_bytes()).hexdigest()
+    return Path(IMAGE_CACHE_DIR) / f"{Path(filename).stem}-{size[0]}x{size[1]}-{digest[:16]}.raw"
+
+
+def _read_raw_image(path: Path, size: tuple[int, int]) -> Surface | None:
+    """Reads a cached raw pixel buffer into a surface.
+
+    Returns:
+        The converted surface, or None if the cache file is missing or broken.
+    """
+    try:
+        with open(path, "rb") as file:
+            buffer: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    try:
+        if len(buffer) != size[0] * size[1] * len(RAW_FORMAT):
+            return None
+
+        raw: Surface = pygame.image.frombuffer(buffer, size, RAW_FORMAT)
+        image: Surface = convert_image(raw, alpha=False)
+        if image is raw:
+            image = raw.copy()
+        del raw
+        return image
+    finally:
+        buffer.close()
+
+
+def _write_raw_image(path: Path, image: Surface):
+    """Writes the surface into the image cache and removes older buffers of the same image.
+
+    Only files named like the cache files of the same image file are removed, so images
+    whose names start with the same stem keep their cached buffers.
+
+    Failing to write the cache is not fatal, the image is just decoded again on the
+    next launch.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        stem: str = path.name.rsplit("-", 2)[0]
+        cache_file: re.Pattern = re.compile(rf"{re.escape(stem)}-\d+x\d+-[0-9a-f]{{16}}\.raw")
+        for stale in path.parent.glob("*.raw"):
+            if cache_file.fullmatch(stale.name):
+                stale.unlink()
+
+        temporary: Path = path.with_suffix(".tmp")
+        temporary.write_bytes(pygame.image.tobytes(image, RAW_FORMAT))
+        os.replace(temporary, path)
+    except OSError as error:
+        print(f"Could not write the image cache: {error}")
+
+
+def get_image(filename: str, alpha: bool = True, size: tuple[int, int] | None = None, *,
+              scale: float | None = None, flip: bool = False,
+              opacity: int | None = None, disk_cache: bool = False) -> Surface:
+    """Returns a shared, processed image surface from the process-wide image cache.
+
+    The image is loaded and processed only the first time a specific combination of
+    arguments is requested. Every later call with the same arguments returns the same
+    Surface object, so the returned surfaces must be treated as read-only.
+
+    Args:
+        filename: The name of the file to be loaded, including its extension.
+        alpha: A boolean flag indicating whether you want to preserve the alpha channel.
+        size: Optional size parameter for resizing the image to specific dimensions.
+        scale: Optional scale factor applied after resizing.
+        flip: If True the image is reversed horizontally.
+        opacity: Optional surface alpha value between 0 and 255.
+        disk_cache: If True, opaque resized images are loaded through the on-disk
+            image cache with load_cached_image.
+
+    Returns:
+        A cached `Surface` object containing the processed image.
+    """
+    key: ImageKey = (filename, alpha, size, scale, flip, opacity)
+    image: Surface | None = _image_cache.get(key)
+
+    if image is not None:
+        _cache_stats["hits"] += 1
+        return image
+
+    _cache_stats["misses"] += 1
+    if disk_cache and size and not alpha:
+        image = load_cached_image(filename, size)
+    else:
+        image = load_image(filename, alpha, size)
+
+    if scale:
+        image = scale_image(image, scale)
+    if flip:
+        image = reverse_image_horizontally(image)
+    if opacity is not None:
+        image = image.copy()
+        image.set_alpha(opacity)
+
+    _image_cache[key] = image
+    return image
+
+
+def get_cache_stats() -> dict[str, int]:
+    """Returns the image cache counters.
+
+    Returns:
+        A dictionary containing the amount of cache hits, misses and cached surfaces.
+    """
+    return {**_cache_stats, "size": len(_image_cache)}
+
+
+def clear_cache():
+    """Empties the image cache and resets its counters."""
+    _image_cache.clear()
+    _cache_stats["hits"] = 0
+    _cache_stats["misses"] = 0
@@ -0,0 +1,71 @@
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any, Callable
+
+
+class LRUCache:
+    """Dictionary-like cache holding a bounded number of entries.
+
+    When the cache is full, adding a new entry evicts the least recently used one.
+    Reading an entry with get marks it as the most recently used.
+
+    Attributes:
+        _entries: Ordered dictionary of the cached entries, the least recently used first.
+        _max_size: Maximum number of entries kept in the cache.
+    """
+
+    def __init__(self, max_size: int):
+        """Initializes an empty cache.
+
+        Args:
+            max_size: Maximum number of entries kept in the cache.
+        """
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._max_size: int = max_size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the cached value of the key and marks it as recently used.
+
+        Args:
+            key: Key of the entry.
+            default: Value returned when the key isn't cached.
+        """
+        if key not in self._entries:
+            return default
+
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def put(self, key: Hashable, value: Any):
+        """Adds or replaces an entry and evicts the least recently used entry if needed."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Removes the entry and returns its value, or default if the key isn't cached."""
+        return self._entries.pop(key, default)
+
+    def remove_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Removes every entry whose key matches the predicate.
+
+        Args:
+            predicate: Function returning True for the keys to be removed.
+
+        Returns:
+            The number of removed entries.
+        """
+        keys: list[Hashable] = [key for key in self._entries if predicate(key)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def clear(self):
+        self._entries.clear()
@@ -0,0 +1,201 @@
+import threading
+from bisect import bisect_left, insort
+from typing import Callable, Iterable
+
+BLOCK_SIZE: int = 1000
+"""Default number of values in a block. Blocks are split when they grow to twice this."""
+
+
+class RankIndex:
+    """Sorted multiset of integers with logarithmic insertion and rank queries.
+
+    The values are kept in sorted blocks of at most twice the block size, and the sizes
+    of the blocks are summed with a Fenwick tree. Inserting a value finds its block by
+    binary search over the largest value of every block and shifts only the values of
+    that block. Counting the values smaller than a value adds the sizes of the blocks
+    before its block from the tree to its position inside the block.
+
+    Attributes:
+        _blocks: Sorted lists of values, every value of a block smaller than or equal to
+            the values of the next block.
+        _maxes: The largest value of every block.
+        _tree: Fenwick tree of the block sizes, indexed from 1.
+        _block_size: Number of values a split block is left with.
+        _length: Number of values in the index.
+    """
+
+    def __init__(self, values: Iterable[int] = (), block_size: int = BLOCK_SIZE):
+        """Initializes the index.
+
+        Args:
+            values: Initial values in any order. Sorted values are loaded fastest.
+            block_size: Number of values in a block.
+        """
+        ordered: list[int] = sorted(values)
+        self._block_size: int = block_size
+        self._blocks: list[list[int]] = [ordered[start:start + block_size]
+                                         for start in range(0, len(ordered), block_size)]
+        self._maxes: list[int] = [block[-1] for block in self._blocks]
+        self._tree: list[int] = []
+        self._length: int = len(ordered)
+        self._build_tree()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _build_tree(self):
+        """Builds the Fenwick tree of the block sizes in linear time."""
+        self._tree = [0] + [len(block) for block in self._blocks]
+        for index in range(1, len(self._tree)):
+            parent: int = index + (index & -index)
+            if parent < len(self._tree):
+                self._tree[parent] += self._tree[index]
+
+    def _resize_block(self, block_index: int, change: int):
+        """Adds the change to the size of the block in the Fenwick tree."""
+        index: int = block_index + 1
+        while index < len(self._tree):
+            self._tree[index] += change
+            index += index & -index
+
+    def _count_before(self, block_index: int) -> int:
+        """Returns the number of values in the blocks before the given block."""
+        count: int = 0
+        index: int = block_index
+        while index > 0:
+            count += self._tree[index]
+            index -= index & -index
+        return count
+
+    def add(self, value: int):
+        """Inserts the value, keeping the values sorted."""
+        self._length += 1
+        if not self._blocks:
+            self._blocks.append([value])
+            self._maxes.append(value)
+            self._build_tree()
+            return
+
+        block_index: int = min(bisect_left(self._maxes, value), len(self._blocks) - 1)
+        block: list[int] = self._blocks[block_index]
+        insort(block, value)
+        self._maxes[block_index] = block[-1]
+
+        if len(block) > 2 * self._block_size:
+            self._blocks[block_index:block_index + 1] = [block[:self._block_size],
+                                                         block[self._block_size:]]
+            self._maxes[block_index:block_index + 1] = [block[self._block_size - 1], block[-1]]
+            self._build_tree()
+        else:
+            self._resize_block(block_index, 1)
+
+    def remove(self, value: int) -> bool:
+        """Removes one occurrence of the value.
+
+        Returns:
+            False if the value isn't in the index.
+        """
+        block_index: int = bisect_left(self._maxes, value)
+        if block_index == len(self._blocks):
+            return False
+
+        block: list[int] = self._blocks[block_index]
+        position: int = bisect_left(block, value)
+        if block[position] != value:
+            return False
+
+        del block[position]
+        self._length -= 1
+        if block:
+            self._maxes[block_index] = block[-1]
+            self._resize_block(block_index, -1)
+        else:
+            del self._blocks[block_index]
+            del self._maxes[block_index]
+            self._build_tree()
+        return True
+
+    def rank(self, value: int) -> int:
+        """Returns the number of values smaller than the given value."""
+        block_index: int = bisect_left(self._maxes, value)
+        if block_index == len(self._blocks):
+            return self._length
+        return self._count_before(block_index) + bisect_left(self._blocks[block_index], value)
+
+
+class RankIndexLoader:
+    """Loads a RankIndex in a background thread instead of the calling thread.
+
+    Values added before the index is ready are kept aside and added to the loaded index,
+    except the ones the loaded values already include. A value added while it is being
+    saved may or may not be among the loaded values, so it is counted only once either
+    way. Until the index is ready, rank returns None and the caller counts the rank some
+    other way.
+
+    Attributes:
+        _index: The loaded RankIndex, or None until it is ready.
+        _added: Values added before the index was ready.
+        _lock: Lock guarding the index and the added values.
+        _thread: The background loading thread.
+    """
+
+    def __init__(self, load: Callable[[], Iterable[int]]):
+        """Starts loading the index.
+
+        Args:
+            load: Function returning the initial values. It is called in the loading
+                thread.
+        """
+        self._index: RankIndex | None = None
+        self._added: list[int] = []
+        self._lock: threading.Lock = threading.Lock()
+        self._thread: threading.Thread = threading.Thread(target=self._load, args=(load,),
+                                                          name="rank-index", daemon=True)
+        self._thread.start()
+
+    def _load(self, load: Callable[[], Iterable[int]]):
+        try:
+            index: RankIndex = RankIndex(load())
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            print(f"Could not load the score ranks: {error}")
+            return
+
+        with self._lock:
+            for value in self._added:
+                if index.rank(value + 1) == index.rank(value):
+                    index.add(value)
+            self._index = index
+            self._added = []
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Waits until the loading thread has finished.
+
+        Returns:
+            True if the index is ready.
+        """
+        self._thread.join(timeout)
+        with self._lock:
+            return self._index is not None
+
+    def add(self, value: int):
+        """Inserts the value into the index, or keeps it until the index is ready."""
+        with self._lock:
+            if self._index is None:
+                self._added.append(value)
+            else:
+                self._index.add(value)
+
+    def remove(self, value: int):
+        """Removes one occurrence of the value from the index or from the kept values."""
+        with self._lock:
+            if self._index is None:
+                if value in self._added:
+                    self._added.remove(value)
+            else:
+                self._index.remove(value)
+
+    def rank(self, value: int) -> int | None:
+        """Returns the number of values smaller than the given value, or None if the index
+        isn't ready yet."""
+        with self._lock:
+            return None if self._index is None else self._index.rank(value)
@@ -1,3 +1,30 @@
+from datetime import datetime, timedelta
+
+EPOCH: datetime = datetime(1970, 1, 1)
+"""Naive datetime the integer timestamps of scores are counted from."""
+
+_MICROSECOND: timedelta = timedelta(microseconds=1)
+
+
+def to_timestamp(time: datetime | str) -> int:
+    """Converts a naive datetime, or its string form, to microseconds since EPOCH.
+
+    The conversion of a naive datetime doesn't depend on the local timezone, so it can be
+    reversed exactly with from_timestamp. Scores are recorded in local time, so a datetime
+    with a timezone is converted to a naive local time first.
+    """
+    if isinstance(time, str):
+        time = datetime.fromisoformat(time)
+    if time.tzinfo is not None:
+        time = time.astimezone().replace(tzinfo=None)
+    return (time - EPOCH) // _MICROSECOND
+
+
+def from_timestamp(timestamp: int) -> datetime:
+    """Converts microseconds since EPOCH back to a naive datetime."""
+    return EPOCH + timedelta(microseconds=timestamp)
+
+
 class Score:
     """Represents a single score entry in the scoreboard.
 
@@ -5,26 +32,43 @@ class Score:
     level reached, points scored, and the time when the score was recorded.
     It also provides utility methods to compare scores and retrieve score information.
 
+    Scores are slotted and keep the time as an integer timestamp, so a score takes a
+    fraction of the memory of an object with an instance dictionary and a time string,
+    and comparing scores only compares integers.
+
     Attributes:
         name: The name of the player.
         level: The level the player has reached.
         points: The points scored by the player.
-        time: The time at which the score was recorded.
+        timestamp: The time at which the score was recorded in microseconds since EPOCH.
     """
 
-    def __init__(self, name: str, level: int, points: int, time: str):
+    __slots__ = ("name", "level", "points", "timestamp")
+
+    def __init__(self, name: str, level: int, points: int, time: datetime | str | int):
         """Initializes the score object.
 
         Args:
             name: The name of the player.
             level: The level the player has achieved.
             points: The number of points the player has scored.
-            time: The time the player has spent in the game.
+            time: The time the score was recorded as a datetime, its string form as stored
+                in the database or a timestamp in microseconds since EPOCH.
         """
         self.name: str = name
         self.level: int = level
         self.points: int = points
-        self.time: str = time
+        self.timestamp: int = time if isinstance(time, int) else to_timestamp(time)
+
+    @property
+    def time(self) -> str:
+        """The time the score was recorded in the string form stored in the database."""
+        return str(from_timestamp(self.timestamp))
+
+    @property
+    def sort_key(self) -> tuple[int, int]:
+        """Returns a value that sorts scores in high score order."""
+        return -self.points, self.timestamp
 
     @property
     def no_date(self) -> tuple[str, int, int]:
@@ -65,7 +109,7 @@ class Score:
             bool: True if the two objects have the same `points` and `time`
             attributes; False otherwise.
         """
-        return (self.points, self.time) == (other.points, other.time)
+        return self.points == other.points and self.timestamp == other.timestamp
 
     def __lt__(self, other) -> bool:
         """Compares two objects based on their points and time attributes using less than
@@ -81,4 +125,6 @@ class Score:
             bool: True if the current object is considered less than the other
             object, False otherwise.
         """
-        return (-self.points, self.time) < (-other.points, other.time)
+        if self.points != other.points:
+            return self.points > other.points
+        return self.timestamp < other.timestamp
@@ -1,57 +1,96 @@
-import bisect
-from datetime import datetime
+import threading
+from datetime import date, datetime, timedelta
+from functools import partial
+from typing import TYPE_CHECKING, Callable
 
-from database.score_service import ScoreService
-from utilities.score import Score
+from database.score_service import ScoreKey, ScoreService, ScoreTuple
+from database.score_writer import ScoreRow, ScoreWriter
+from utilities.constants import ScoreView
+from utilities.rank_index import RankIndexLoader
+from utilities.score import Score, from_timestamp, to_timestamp
 
-type ScoreTuple = tuple[str, int, int, str]
+if TYPE_CHECKING:
+    from sqlite3 import Connection
 
 
 class ScoreManager:
-    """ Manages and maintains a list of game scores.
+    """ Manages and maintains the high score list of the game.
 
     This class is responsible for interacting with the ScoreService to retrieve,
-    add, and manage a sorted list of game scores. It initializes the scores, handles
-    updates, and ensures the scores are maintained in a sorted order for efficient
-    storage and retrieval. It maintains a local copy of the scores for efficient retrieval.
-    It is assumed that the scores are already in sorted order when initialized as the class uses
-    bisect to maintain the sorted order.
+    add, and manage game scores. Scores are read from the database one page at a time with
+    keyset pagination, so the whole score table is never kept in memory. The first and
+    last score of every fetched page are remembered, so the neighbouring pages can be
+    fetched by seeking from them.
+
+    With a ScoreWriter, new scores are written to the database in the background. Until
+    the writer has committed them, they are kept in a list of pending scores that is
+    merged into the fetched pages, so new scores show up right away. Scores the writer
+    fails to save are dropped from the pending scores, the score count and the rank index.
+
+    Ranks are counted from a RankIndex holding a single integer key for every score.
+    The keys are read from the database in a background thread with a connection of its
+    own, after which adding a score and finding a rank take logarithmic time. Until the
+    index is ready, or without a connection function, ranks are counted by the database
+    from the scores index and the pending scores.
 
     Attributes:
         self._score_service: Service used to interact with underlying score
             storage for fetching and inserting scores.
-        self._scores: List of Score objects sorted in ascending order as
-            per defined criteria in Score.
+        self._score_writer: Writer used for saving new scores in the background, or None
+            for saving them directly with the score service.
+        self._page_bounds: Dictionary mapping page sizes and page numbers to the keys of the
+            first and last score on the page.
+        self._count: Number of scores including the pending ones, or None if it hasn't been
+            fetched yet.
+        self._unsaved: Dictionary holding the "pending" scores that haven't been written
+            yet and the "failed" scores the writer failed to save that haven't been removed
+            from the count, the rank index and the page bounds yet.
+        self._pending_lock: Lock guarding the pending and failed scores, which the writer
+            thread changes after writing the scores or failing to.
+        self._listeners: Functions called with the rank of every added score.
+        self._ranks: RankIndexLoader loading the keys of every score, or None if ranks are
+            always counted by the database.
     """
 
-    def __init__(self, score_service: ScoreService):
+    def __init__(self, score_service: ScoreService, score_writer: ScoreWriter | None = None,
+                 connect: Callable[[], "Connection"] | None = None):
         """Initializes a new instance of the class.
 
         This constructor sets up the instance by assigning the provided score_service
-        to an internal attribute. It also initializes the score list by invoking the
-        internal method _init_score_list.
+        to an internal attribute. Scores are fetched from the service only when they
+        are requested.
 
         Args:
             score_service: Service used for score-related database operations.
+            score_writer: Optional writer used for saving new scores in the background.
+            connect: Optional function opening a database connection. If given, the rank
+                keys are read with it in a background thread right away.
         """
         self._score_service = score_service
-        self._init_score_list()
+        self._score_writer: ScoreWriter | None = score_writer
+        self._page_bounds: dict[tuple[int, int], tuple[ScoreKey, ScoreKey]] = {}
+        self._count: int | None = None
+        self._unsaved: dict[str, list[Score]] = {"pending": [], "failed": []}
+        self._pending_lock: threading.Lock = threading.Lock()
+        self._listeners: list[Callable[[int], None]] = []
+        self._ranks: RankIndexLoader | None = None
+        if connect is not None:
+            self._ranks = RankIndexLoader(partial(_read_rank_keys, connect))
 
-    def _init_score_list(self):
-        """Initializes the list of scores by fetching data from the score service
-        and transforming it into a list of `Score` objects.
-        """
-        scores: list[ScoreTuple] = self._score_service.get_scores()
-        self._scores: list[Score] = [Score(name, level, points, time) for name, level, points, time
-                                     in scores]
+        if score_writer is not None:
+            score_writer.add_listener(self._scores_written)
+            score_writer.add_failure_listener(self._scores_failed)
 
     def add_score(self, name: str, level: int, points: int):
         """Adds a new score entry for a player with the specified details.
 
         This method records the score of a player including their name, the level
         at which the score was achieved, and the points scored. If the points
-        are greater than zero, it creates a timestamp for the score, adds it
-        to an internal score service, and updates the local list of scores with bisect.
+        are greater than zero, it creates a timestamp for the score and adds it
+        to an internal score service, or submits it to the score writer and keeps it as a
+        pending score until it has been written. The new score shifts the scores after it
+        to later pages, so the remembered bounds of the page it lands on and every page
+        after it are forgotten. Listeners are notified with the rank of the new score.
 
         Args:
             name: The name of the player.
@@ -61,13 +100,250 @@ class ScoreManager:
         """
         if points > 0:
             time: datetime = datetime.now()
-            self._score_service.add_new_score(name, level, points, time)
-            bisect.insort_right(self._scores, Score(name, level, points, str(time)))
+            score: Score = Score(name, level, points, time)
+            # The count has to be read before the score can reach the database, so the
+            # score is counted only once.
+            self.count()
+            if self._score_writer is None:
+                self._score_service.add_new_score(name, level, points, time)
+            else:
+                with self._pending_lock:
+                    self._unsaved["pending"].append(score)
+                self._score_writer.submit(name, level, points, time)
+
+            self._count += 1
+            if self._ranks is not None:
+                self._ranks.add(_rank_key(score.points, score.timestamp))
+
+            rank: int = self.get_rank(score)
+            self._page_bounds = {(size, page): bounds
+                                 for (size, page), bounds in self._page_bounds.items()
+                                 if page < (rank - 1) // size}
+            for listener in self._listeners:
+                listener(rank)
+
+    def add_listener(self, listener: Callable[[int], None]):
+        """Adds a function that is called with the 1-based rank of every added score."""
+        self._listeners.append(listener)
+
+    def _scores_written(self, rows: list[ScoreRow]):
+        """Removes the written scores from the pending scores. Called by the writer thread."""
+        self._remove_pending(rows)
+
+    def _scores_failed(self, rows: list[ScoreRow]):
+        """Drops the scores the writer failed to save. Called by the writer thread.
+
+        The scores are removed from the pending scores right away. The count, the rank
+        index and the page bounds are only used by the main thread, so the scores are
+        removed from them by _apply_failures on the next count or rank read.
+        """
+        dropped: list[Score] = self._remove_pending(rows)
+        with self._pending_lock:
+            self._unsaved["failed"].extend(dropped)
+
+    def _apply_failures(self):
+        """Removes the scores the writer failed to save from the count and the rank index.
+
+        The remembered page bounds are forgotten, because the later scores move up, so the
+        failed scores don't stay on the high score list for the rest of the session.
+        """
+        with self._pending_lock:
+            failed: list[Score] = self._unsaved["failed"]
+            self._unsaved["failed"] = []
+        if not failed:
+            return
+
+        if self._count is not None:
+            self._count -= len(failed)
+        if self._ranks is not None:
+            for score in failed:
+                self._ranks.remove(_rank_key(score.points, score.timestamp))
+        self._page_bounds = {}
+
+    def _remove_pending(self, rows: list[ScoreRow]) -> list[Score]:
+        """Removes the pending scores matching the given rows.
+
+        Returns:
+            The removed scores.
+        """
+        keys: set[tuple[str, int, int]] = {(name, points, to_timestamp(time))
+                                           for name, _, points, time in rows}
+        with self._pending_lock:
+            removed: list[Score] = [score for score in self._unsaved["pending"]
+                                    if (score.name, score.points, score.timestamp) in keys]
+            self._unsaved["pending"] = [
+                score for score in self._unsaved["pending"]
+                if (score.name, score.points, score.timestamp) not in keys]
+        return removed
+
+    def count(self) -> int:
+        """Returns the number of stored scores."""
+        self._apply_failures()
+        if self._count is None:
+            self._count = self._score_service.count_scores()
+        return self._count
+
+    def page_count(self, page_size: int = 10) -> int:
+        """Returns the number of pages needed to show every score."""
+        return (self.count() + page_size - 1) // page_size
+
+    def get_page(self, page: int, page_size: int = 10) -> list[Score]:
+        """Retrieves the scores shown on the given page of the high score list.
+
+        Neighbouring pages of already fetched pages, the first page and the last page are
+        fetched with a single keyset query. Other pages are reached by stepping forward
+        from the closest fetched page before them.
+
+        Args:
+            page: The 0-based page number.
+            page_size: Number of scores on a page.
+
+        Returns:
+            A list of Score objects on the page. Empty if the page doesn't exist.
+        """
+        last_page: int = self.page_count(page_size) - 1
+        if page < 0 or page > last_page:
+            return []
+
+        if page == 0:
+            scores: list[Score] = self._fetch_after(None, page_size)
+        elif (page_size, page - 1) in self._page_bounds:
+            scores = self._fetch_after(self._page_bounds[page_size, page - 1][1], page_size)
+        elif (page_size, page + 1) in self._page_bounds:
+            scores = self._fetch_before(self._page_bounds[page_size, page + 1][0], page_size)
+        elif page == last_page:
+            scores = self._fetch_before(None, self.count() - page * page_size)
+        else:
+            known: list[int] = [known for size, known in self._page_bounds
+                                if size == page_size and known < page]
+            for previous_page in range(max(known) + 1 if known else 0, page):
+                self.get_page(previous_page, page_size)
+            return self.get_page(page, page_size)
+
+        if scores:
+            self._page_bounds[page_size, page] = (_key(scores[0]), _key(scores[-1]))
+        return scores
+
+    def _fetch_after(self, after: ScoreKey | None, limit: int) -> list[Score]:
+        """Fetches the scores following the given key and merges in the pending scores."""
+        rows: list[ScoreTuple] = self._score_service.get_page(after, limit)
+        pending: list[Score] = [score for score in self._get_pending()
+                                if after is None or _order(_key(score)) > _order(after)]
+        return _merge(rows, pending)[:limit]
+
+    def _fetch_before(self, before: ScoreKey | None, limit: int) -> list[Score]:
+        """Fetches the scores preceding the given key and merges in the pending scores."""
+        rows: list[ScoreTuple] = self._score_service.get_page_before(before, limit)
+        pending: list[Score] = [score for score in self._get_pending()
+                                if before is None or _order(_key(score)) < _order(before)]
+        return _merge(rows, pending)[-limit:] if limit > 0 else []
+
+    def _get_pending(self) -> list[Score]:
+        with self._pending_lock:
+            return list(self._unsaved["pending"])
+
+    def get_rank(self, score: Score) -> int:
+        """Returns the 1-based position the score has or would have on the high score list.
+
+        Scores with the same points and time as the score are counted after it. The rank
+        is counted from the rank index once it has been loaded, and by the database from
+        the scores index and the pending scores until then.
+        """
+        self._apply_failures()
+        key: int = _rank_key(score.points, score.timestamp)
+        if self._ranks is not None:
+            rank: int | None = self._ranks.rank(key)
+            if rank is not None:
+                return rank + 1
+
+        pending_before: int = sum(_rank_key(pending.points, pending.timestamp) < key
+                                  for pending in self._get_pending())
+        return self._score_service.get_rank(score.points, score.time) + pending_before
+
+    def get_view(self, view: ScoreView, limit: int = 10) -> list[Score]:
+        """Retrieves the top scores of a leaderboard view.
+
+        The player bests, daily and weekly views are each read with a single indexed
+        query from the tables kept up to date by the database. Pending scores that belong
+        to the view are merged in, so new scores show up before they are written. The
+        all time view is the first page of the high score list.
+
+        Args:
+            view: The leaderboard view.
+            limit: Maximum number of scores returned.
+
+        Returns:
+            A list of Score objects in high score order.
+        """
+        if view == ScoreView.ALL_TIME:
+            return self.get_page(0, limit)
+
+        pending: list[Score] = self._get_pending()
+        if view == ScoreView.PLAYER_BESTS:
+            best: dict[str, Score] = {}
+            for score in _merge(self._score_service.get_player_bests(limit), pending):
+                best.setdefault(score.name, score)
+            return list(best.values())[:limit]
+
+        today: date = datetime.now().date()
+        if view == ScoreView.TODAY:
+            start: date = today
+            rows: list[ScoreTuple] = self._score_service.get_daily_top(today, limit)
+        else:
+            start = today - timedelta(days=today.weekday())
+            rows = self._score_service.get_weekly_top(start, limit)
+
+        pending = [score for score in pending if from_timestamp(score.timestamp).date() >= start]
+        return _merge(rows, pending)[:limit]
 
     def get_scores(self) -> list[Score]:
-        """Retrieves the list of `Score` objects
+        """Retrieves every stored score as `Score` objects in high score order.
+
+        Reads the whole score table, so get_page should be preferred for showing scores.
 
         Returns:
             A list containing Score objects.
         """
-        return self._scores
+        return _merge(self._score_service.get_scores(), self._get_pending())
+
+
+def _read_rank_keys(connect: Callable[[], "Connection"]) -> list[int]:
+    """Reads the rank keys of every stored score with a new connection and closes it."""
+    connection: "Connection" = connect()
+    try:
+        return [_rank_key(points, to_timestamp(time)) for points, time
+                in ScoreService(connection, exit_on_missing_tables=False).get_score_keys()]
+    finally:
+        connection.close()
+
+
+def _key(score: Score) -> ScoreKey:
+    return score.points, score.time
+
+
+def _rank_key(points: int, timestamp: int) -> int:
+    """Packs the points and timestamp of a score into one integer in high score order.
+
+    More points give a smaller key, and the timestamp, which is always below 2^64,
+    orders the scores with equal points.
+    """
+    return (-points << 64) + timestamp
+
+
+def _order(key: ScoreKey) -> tuple[int, str]:
+    """Returns a value that sorts score keys in high score order."""
+    return -key[0], key[1]
+
+
+def _merge(rows: list[ScoreTuple], pending: list[Score]) -> list[Score]:
+    """Merges fetched rows with pending scores in high score order.
+
+    Pending scores that have already been written and are included in the rows are
+    skipped.
+    """
+    scores: list[Score] = [Score(name, level, points, time) for name, level, points, time in rows]
+    fetched: set[tuple[str, int, int]] = {(score.name, score.points, score.timestamp)
+                                          for score in scores}
+    scores.extend(score for score in pending
+                  if (score.name, score.points, score.timestamp) not in fetched)
+    return sorted(scores)
@@ -61,6 +61,94 @@ def create_database(ctx):
     platform_agnostic_command(ctx, "python src/initialize_database.py")
 
 
+@task
+def migrate_database(ctx):
+    with ctx.cd("src"):
+        platform_agnostic_command(ctx, "python -m database.migrations")
+
+
+@task
+def export_scores(ctx, path="scores.ndjson"):
+    _transfer_scores(ctx, "export", path)
+
+
+@task
+def import_scores(ctx, path):
+    _transfer_scores(ctx, "import", path)
+
+
+@task
+def benchmark_spawn(ctx):
+    _run_benchmark(ctx, "spawn_benchmark")
+
+
+@task
+def benchmark_enemies(ctx):
+    _run_benchmark(ctx, "enemy_benchmark")
+
+
+@task
+def benchmark_database(ctx):
+    _run_benchmark(ctx, "database_benchmark")
+
+
+@task
+def benchmark_player_cache(ctx):
+    _run_benchmark(ctx, "player_cache_benchmark")
+
+
+@task
+def benchmark_startup(ctx):
+    _run_benchmark(ctx, "startup_benchmark")
+
+
+@task
+def benchmark_text(ctx):
+    _run_benchmark(ctx, "text_benchmark")
+
+
+@task
+def benchmark_pools(ctx):
+    _run_benchmark(ctx, "pool_benchmark")
+
+
+@task
+def benchmark_blit(ctx):
+    _run_benchmark(ctx, "blit_benchmark")
+
+
+@task
+def benchmark_scores(ctx):
+    _run_benchmark(ctx, "score_memory_benchmark")
+
+
+@task
+def simulate(ctx, seed=0, difficulty="MEDIUM", ticks=72000):
+    with ctx.cd("src"):
+        platform_agnostic_command(
+            ctx, f"python simulate.py --seed {seed} --difficulty {difficulty} --ticks {ticks}"
+        )
+
+
+@task
+def tune_difficulty(ctx, games=200, target=120):
+    with ctx.cd("src"):
+        platform_agnostic_command(
+            ctx, f"python tune_difficulty.py --games {games} --target {target}"
+        )
+
+
+def _run_benchmark(ctx, module: str):
+    with ctx.cd("src"):
+        platform_agnostic_command(ctx, f"python -m benchmarks.{module}")
+
+
+def _transfer_scores(ctx, command: str, path: str):
+    score_file = Path(path).resolve()
+    with ctx.cd("src"):
+        platform_agnostic_command(ctx, f'python transfer_scores.py {command} "{score_file}"')
+
+
 @task(create_database)
 def build_binary(ctx):
     command = "pyinstaller --onedir --name gem-poacher --windowed"